@@ -7,245 +7,237 @@ Data: 2026-01-16
 """
 
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import sys
+import time
 import warnings
+from pathlib import Path
+
+from cache_avaliacoes import carregar_avaliacoes
+from instrumentacao import Sequencia, configurar_por_argumentos
+from motor_scores import NOMES_DIMENSOES, agrupar_dimensoes, calcular_scores, identificar_colunas_notas
+from posicoes_ranking import calcular_posicoes
+from ranking_topk import top_k_indices
+from renderizador_graficos import (espec_boxplot, espec_pacote_radares, espec_radar, espec_scatter,
+                                  nome_arquivo_seguro, renderizar_graficos)
 warnings.filterwarnings('ignore')
 
-# Configurações de visualização
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Configurações de exibição (estilo do Matplotlib/Seaborn é aplicado nos
+# processos de renderização, ver renderizador_graficos._inicializar_worker)
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', None)
 
-print("=" * 80)
-print("ANÁLISE DE MATURIDADE DE PRODUTOS IoT - TECHNOVA")
-print("=" * 80)
-print()
-
-# ============================================================================
-# 1. TRATAMENTO DE DADOS
-# ============================================================================
-print("1. TRATAMENTO DE DADOS")
-print("-" * 80)
-
-# Carregar dados
-df = pd.read_excel('Case_TechNova_Dados.xlsx', sheet_name='Avaliacoes_Startups')
-print(f"✓ Dados carregados: {df.shape[0]} startups, {df.shape[1]} colunas")
-
-# Separar por status
-df_falhas = df[df['status'] == 'Inativa'].copy()
-df_investimento = df[df['status'] == 'Ativa'].copy()
-
-print(f"✓ Startups Ativas: {len(df_investimento)}")
-print(f"✓ Startups Inativas: {len(df_falhas)}")
-print()
-
-# ============================================================================
-# 2. ENGENHARIA DE ATRIBUTOS
-# ============================================================================
-print("2. ENGENHARIA DE ATRIBUTOS")
-print("-" * 80)
-
-# Identificar colunas de notas (1.1 a 8.5)
-colunas_notas = [col for col in df.columns if col[0].isdigit() and '.' in col]
-print(f"✓ Colunas de avaliação identificadas: {len(colunas_notas)}")
-
-# Criar Score_Global para todas as startups
-df['Score_Global'] = df[colunas_notas].mean(axis=1)
-df_investimento['Score_Global'] = df_investimento[colunas_notas].mean(axis=1)
-df_falhas['Score_Global'] = df_falhas[colunas_notas].mean(axis=1)
-
-print(f"✓ Score_Global criado")
-print(f"  - Média geral: {df['Score_Global'].mean():.2f}")
-print(f"  - Média Ativas: {df_investimento['Score_Global'].mean():.2f}")
-print(f"  - Média Inativas: {df_falhas['Score_Global'].mean():.2f}")
-print()
-
-# ============================================================================
-# 3. VISÃO MACRO - AGREGAÇÃO POR DIMENSÃO
-# ============================================================================
-print("3. VISÃO MACRO - AGREGAÇÃO POR DIMENSÕES")
-print("-" * 80)
-
-# Definir grupos/dimensões
-dimensoes = {
-    'Grupo 1 - Performance Técnica': [col for col in colunas_notas if col.startswith('1.')],
-    'Grupo 2 - Viabilidade Econômica': [col for col in colunas_notas if col.startswith('2.')],
-    'Grupo 3 - Confiabilidade': [col for col in colunas_notas if col.startswith('3.')],
-    'Grupo 4 - Usabilidade': [col for col in colunas_notas if col.startswith('4.')],
-    'Grupo 5 - Eficiência Energética': [col for col in colunas_notas if col.startswith('5.')],
-    'Grupo 6 - Robustez Física': [col for col in colunas_notas if col.startswith('6.')],
-    'Grupo 7 - Conectividade': [col for col in colunas_notas if col.startswith('7.')],
-    'Grupo 8 - Sustentabilidade': [col for col in colunas_notas if col.startswith('8.')]
-}
-
-# Calcular médias por dimensão para startups ativas
-for nome_dim, colunas_dim in dimensoes.items():
-    df_investimento[nome_dim] = df_investimento[colunas_dim].mean(axis=1)
-    media = df_investimento[nome_dim].mean()
-    print(f"✓ {nome_dim}: {media:.2f}")
-
-print()
-
-# ============================================================================
-# 4. IDENTIFICAÇÃO DA MELHOR STARTUP
-# ============================================================================
-print("4. IDENTIFICAÇÃO DA MELHOR STARTUP")
-print("-" * 80)
-
-# Calcular média combinada de Performance (Grupo 1) e Viabilidade (Grupo 2)
-df_investimento['Score_Performance_Viabilidade'] = (
-    df_investimento['Grupo 1 - Performance Técnica'] + 
-    df_investimento['Grupo 2 - Viabilidade Econômica']
-) / 2
-
-# Identificar a melhor startup
-melhor_startup_idx = df_investimento['Score_Performance_Viabilidade'].idxmax()
-melhor_startup = df_investimento.loc[melhor_startup_idx]
-
-print(f"🏆 MELHOR STARTUP PARA INVESTIMENTO:")
-print(f"   Nome: {melhor_startup['nome_startup']}")
-print(f"   Setor: {melhor_startup['setor']}")
-print(f"   Score Global: {melhor_startup['Score_Global']:.2f}")
-print(f"   Performance Técnica (Grupo 1): {melhor_startup['Grupo 1 - Performance Técnica']:.2f}")
-print(f"   Viabilidade Econômica (Grupo 2): {melhor_startup['Grupo 2 - Viabilidade Econômica']:.2f}")
-print(f"   Score Performance + Viabilidade: {melhor_startup['Score_Performance_Viabilidade']:.2f}")
-print()
-
-# Top 5 startups
-print("📊 TOP 5 STARTUPS (Performance + Viabilidade):")
-top5 = df_investimento.nlargest(5, 'Score_Performance_Viabilidade')[
-    ['nome_startup', 'setor', 'Score_Global', 'Score_Performance_Viabilidade']
-]
-for idx, (i, row) in enumerate(top5.iterrows(), 1):
-    print(f"   {idx}. {row['nome_startup']} ({row['setor']}) - Score: {row['Score_Performance_Viabilidade']:.2f}")
-print()
-
-# ============================================================================
-# 5. VISUALIZAÇÕES
-# ============================================================================
-print("5. GERANDO VISUALIZAÇÕES")
-print("-" * 80)
-
-# 5.1 GRÁFICO DE RADAR - Melhor Startup (Plotly)
-print("✓ Gerando Gráfico de Radar (Plotly)...")
-
-# Preparar dados para o radar
-categorias = list(dimensoes.keys())
-valores_melhor = [melhor_startup[cat] for cat in categorias]
-
-# Criar gráfico de radar
-fig_radar = go.Figure()
-
-fig_radar.add_trace(go.Scatterpolar(
-    r=valores_melhor,
-    theta=categorias,
-    fill='toself',
-    name=melhor_startup['nome_startup'],
-    line=dict(color='#1f77b4', width=2),
-    fillcolor='rgba(31, 119, 180, 0.3)'
-))
-
-fig_radar.update_layout(
-    polar=dict(
-        radialaxis=dict(
-            visible=True,
-            range=[0, 5],
-            tickmode='linear',
-            tick0=0,
-            dtick=1
-        )
-    ),
-    title=dict(
-        text=f"Análise Multidimensional - {melhor_startup['nome_startup']}<br>" +
-             f"<sub>Setor: {melhor_startup['setor']} | Score Global: {melhor_startup['Score_Global']:.2f}</sub>",
-        x=0.5,
-        xanchor='center',
-        font=dict(size=18)
-    ),
-    showlegend=True,
-    height=600,
-    width=800
-)
-
-# Salvar gráfico de radar
-fig_radar.write_html('radar_melhor_startup.html')
-fig_radar.write_image('radar_melhor_startup.png', width=800, height=600, scale=2)
-print("  → Salvo: radar_melhor_startup.html e radar_melhor_startup.png")
-
-# 5.2 BOXPLOT - Score Global por Setor (Matplotlib/Seaborn)
-print("✓ Gerando Boxplot - Score Global por Setor...")
-
-plt.figure(figsize=(12, 6))
-sns.boxplot(data=df_investimento, x='setor', y='Score_Global', palette='Set2')
-plt.title('Distribuição do Score Global por Setor\n(Startups Ativas)', 
-          fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Setor', fontsize=12, fontweight='bold')
-plt.ylabel('Score Global', fontsize=12, fontweight='bold')
-plt.xticks(rotation=45, ha='right')
-plt.grid(axis='y', alpha=0.3, linestyle='--')
-plt.tight_layout()
-plt.savefig('boxplot_score_por_setor.png', dpi=300, bbox_inches='tight')
-print("  → Salvo: boxplot_score_por_setor.png")
-plt.close()
-
-# 5.3 GRÁFICO ADICIONAL - Comparação Performance vs Viabilidade
-print("✓ Gerando Scatter Plot - Performance vs Viabilidade...")
-
-plt.figure(figsize=(12, 8))
-setores_unicos = df_investimento['setor'].unique()
-cores = plt.cm.Set3(np.linspace(0, 1, len(setores_unicos)))
-
-for setor, cor in zip(setores_unicos, cores):
-    dados_setor = df_investimento[df_investimento['setor'] == setor]
-    plt.scatter(
-        dados_setor['Grupo 1 - Performance Técnica'],
-        dados_setor['Grupo 2 - Viabilidade Econômica'],
-        label=setor,
-        s=100,
-        alpha=0.6,
-        c=[cor],
-        edgecolors='black',
-        linewidth=1
-    )
-
-# Destacar a melhor startup
-plt.scatter(
-    melhor_startup['Grupo 1 - Performance Técnica'],
-    melhor_startup['Grupo 2 - Viabilidade Econômica'],
-    s=500,
-    c='gold',
-    marker='*',
-    edgecolors='red',
-    linewidth=2,
-    label=f'🏆 {melhor_startup["nome_startup"]}',
-    zorder=10
-)
-
-plt.title('Performance Técnica vs Viabilidade Econômica\n(Startups Ativas)', 
-          fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Grupo 1 - Performance Técnica', fontsize=12, fontweight='bold')
-plt.ylabel('Grupo 2 - Viabilidade Econômica', fontsize=12, fontweight='bold')
-plt.legend(loc='best', framealpha=0.9)
-plt.grid(True, alpha=0.3, linestyle='--')
-plt.tight_layout()
-plt.savefig('scatter_performance_viabilidade.png', dpi=300, bbox_inches='tight')
-print("  → Salvo: scatter_performance_viabilidade.png")
-plt.close()
-
-print()
-
-# ============================================================================
-# 6. RELATÓRIO FINAL
-# ============================================================================
-print("6. RELATÓRIO EXECUTIVO")
-print("=" * 80)
-
-print(f"""
+DIRETORIO_RADARES = 'radares_startups'
+
+
+def main():
+    """Executa a análise completa e gera os gráficos e CSVs processados"""
+    # --trace ARQUIVO, --tempos, --tracemalloc e --perfil DIR (ver instrumentacao.py)
+    configurar_por_argumentos()
+    etapas = Sequencia('analise')
+
+    print("=" * 80)
+    print("ANÁLISE DE MATURIDADE DE PRODUTOS IoT - TECHNOVA")
+    print("=" * 80)
+    print()
+
+    # ============================================================================
+    # 1. TRATAMENTO DE DADOS
+    # ============================================================================
+    print("1. TRATAMENTO DE DADOS")
+    etapas.iniciar("1. TRATAMENTO DE DADOS")
+    print("-" * 80)
+
+    # Carregar dados (via cache colunar; --atualizar-cache força a releitura do Excel)
+    df = carregar_avaliacoes('Case_TechNova_Dados.xlsx',
+                             forcar_atualizacao='--atualizar-cache' in sys.argv)
+    print(f"✓ Dados carregados: {df.shape[0]} startups, {df.shape[1]} colunas")
+
+    # Separar por status
+    mascara_falhas = (df['status'] == 'Inativa').to_numpy()
+    mascara_investimento = (df['status'] == 'Ativa').to_numpy()
+    df_falhas = df[mascara_falhas].copy()
+    df_investimento = df[mascara_investimento].copy()
+
+    print(f"✓ Startups Ativas: {len(df_investimento)}")
+    print(f"✓ Startups Inativas: {len(df_falhas)}")
+    etapas.atual.linhas = len(df)
+    print()
+
+    # ============================================================================
+    # 2. ENGENHARIA DE ATRIBUTOS
+    # ============================================================================
+    print("2. ENGENHARIA DE ATRIBUTOS")
+    etapas.iniciar("2. ENGENHARIA DE ATRIBUTOS")
+    print("-" * 80)
+
+    # Identificar colunas de notas (1.1 a 8.5)
+    colunas_notas = identificar_colunas_notas(df.columns)
+    print(f"✓ Colunas de avaliação identificadas: {len(colunas_notas)}")
+
+    # Calcular todos os scores (global, dimensões e combinado) em uma passada
+    scores = calcular_scores(df[colunas_notas].to_numpy(), colunas_notas)
+
+    # Criar Score_Global para todas as startups
+    df['Score_Global'] = scores.score_global
+    df_investimento['Score_Global'] = scores.score_global[mascara_investimento]
+    df_falhas['Score_Global'] = scores.score_global[mascara_falhas]
+
+    print(f"✓ Score_Global criado")
+    print(f"  - Média geral: {df['Score_Global'].mean():.2f}")
+    print(f"  - Média Ativas: {df_investimento['Score_Global'].mean():.2f}")
+    print(f"  - Média Inativas: {df_falhas['Score_Global'].mean():.2f}")
+    print()
+
+    # ============================================================================
+    # 3. VISÃO MACRO - AGREGAÇÃO POR DIMENSÃO
+    # ============================================================================
+    print("3. VISÃO MACRO - AGREGAÇÃO POR DIMENSÕES")
+    etapas.iniciar("3. VISÃO MACRO - AGREGAÇÃO POR DIMENSÕES")
+    print("-" * 80)
+
+    # Definir grupos/dimensões
+    dimensoes = agrupar_dimensoes(colunas_notas)
+
+    # Médias por dimensão para startups ativas (já calculadas pelo motor de scores)
+    dimensoes_investimento = scores.dimensoes[mascara_investimento]
+    for j, nome_dim in enumerate(NOMES_DIMENSOES):
+        df_investimento[nome_dim] = dimensoes_investimento[:, j]
+        media = df_investimento[nome_dim].mean()
+        print(f"✓ {nome_dim}: {media:.2f}")
+
+    print()
+
+    # ============================================================================
+    # 4. IDENTIFICAÇÃO DA MELHOR STARTUP
+    # ============================================================================
+    print("4. IDENTIFICAÇÃO DA MELHOR STARTUP")
+    etapas.iniciar("4. IDENTIFICAÇÃO DA MELHOR STARTUP")
+    print("-" * 80)
+
+    # Média combinada de Performance (Grupo 1) e Viabilidade (Grupo 2)
+    df_investimento['Score_Performance_Viabilidade'] = scores.score_performance_viabilidade[mascara_investimento]
+
+    # Identificar a melhor startup e o top 5 com uma única seleção parcial
+    posicoes_top5 = top_k_indices(df_investimento['Score_Performance_Viabilidade'].to_numpy(), 5)
+    melhor_startup = df_investimento.iloc[posicoes_top5[0]]
+
+    # Posições (geral e no setor) de todas as startups ativas em cada métrica,
+    # calculadas uma vez e consultadas por (startup, métrica)
+    posicoes = calcular_posicoes(df_investimento)
+
+    print(f"🏆 MELHOR STARTUP PARA INVESTIMENTO:")
+    print(f"   Nome: {melhor_startup['nome_startup']}")
+    print(f"   Setor: {melhor_startup['setor']}")
+    print(f"   Score Global: {melhor_startup['Score_Global']:.2f}")
+    print(f"   Performance Técnica (Grupo 1): {melhor_startup['Grupo 1 - Performance Técnica']:.2f}")
+    print(f"   Viabilidade Econômica (Grupo 2): {melhor_startup['Grupo 2 - Viabilidade Econômica']:.2f}")
+    print(f"   Score Performance + Viabilidade: {melhor_startup['Score_Performance_Viabilidade']:.2f}")
+    print()
+
+    # Top 5 startups
+    print("📊 TOP 5 STARTUPS (Performance + Viabilidade):")
+    top5 = df_investimento.iloc[posicoes_top5][
+        ['nome_startup', 'setor', 'Score_Global', 'Score_Performance_Viabilidade']
+    ]
+    for idx, (i, row) in enumerate(top5.iterrows(), 1):
+        print(f"   {idx}. {row['nome_startup']} ({row['setor']}) - Score: {row['Score_Performance_Viabilidade']:.2f}")
+    print()
+
+    # ============================================================================
+    # 5. VISUALIZAÇÕES
+    # ============================================================================
+    print("5. GERANDO VISUALIZAÇÕES")
+    etapas.iniciar("5. GERANDO VISUALIZAÇÕES")
+    print("-" * 80)
+
+    # Especificações dos gráficos: os dados de cada um são separados aqui e a
+    # renderização roda em processos paralelos (ver renderizador_graficos.py)
+    categorias = list(dimensoes.keys())
+    especs = [
+        # 5.1 GRÁFICO DE RADAR - Melhor Startup (Plotly)
+        espec_radar(
+            melhor_startup['nome_startup'], melhor_startup['setor'], melhor_startup['Score_Global'],
+            categorias, [melhor_startup[cat] for cat in categorias],
+            {'html': 'radar_melhor_startup.html', 'png': 'radar_melhor_startup.png'}
+        ),
+        # 5.2 BOXPLOT - Score Global por Setor (Matplotlib/Seaborn)
+        espec_boxplot(df_investimento['setor'], df_investimento['Score_Global'], 'boxplot_score_por_setor.png'),
+        # 5.3 GRÁFICO ADICIONAL - Comparação Performance vs Viabilidade
+        espec_scatter(
+            df_investimento['setor'],
+            df_investimento['Grupo 1 - Performance Técnica'],
+            df_investimento['Grupo 2 - Viabilidade Econômica'],
+            (melhor_startup['nome_startup'],
+             melhor_startup['Grupo 1 - Performance Técnica'],
+             melhor_startup['Grupo 2 - Viabilidade Econômica']),
+            'scatter_performance_viabilidade.png'
+        ),
+    ]
+
+    principais = len(especs)
+
+    # Com --radar-todas, um radar (PNG) para cada startup ativa e para a média
+    # de cada setor, além de um único HTML com todos eles (menu de seleção)
+    if '--radar-todas' in sys.argv:
+        Path(DIRETORIO_RADARES).mkdir(exist_ok=True)
+        radares = []
+        for startup in df_investimento[['nome_startup', 'setor', 'Score_Global'] + categorias].itertuples(index=False):
+            radares.append(espec_radar(
+                startup[0], startup[1], startup[2], categorias, startup[3:],
+                {'png': str(Path(DIRETORIO_RADARES) / f"radar_{nome_arquivo_seguro(startup[0])}.png")}
+            ))
+        medias_setor = df_investimento.groupby('setor', sort=False)[['Score_Global'] + categorias].mean()
+        for setor, medias in medias_setor.iterrows():
+            radares.append(espec_radar(
+                f"Média {setor}", setor, medias['Score_Global'], categorias, medias[categorias],
+                {'png': str(Path(DIRETORIO_RADARES) / f"radar_media_{nome_arquivo_seguro(setor)}.png")}
+            ))
+        especs += radares
+        especs.append(espec_pacote_radares(radares, str(Path(DIRETORIO_RADARES) / 'radares.html')))
+
+    inicio_graficos = time.perf_counter()
+    resultados_graficos = renderizar_graficos(especs, forcar='--forcar-graficos' in sys.argv)
+    for resultado in resultados_graficos:
+        saidas = ' e '.join(resultado.espec.saidas.values())
+        if resultado.erro is not None:
+            print(f"✗ Erro ao gerar {resultado.espec.nome}: {str(resultado.erro) or repr(resultado.erro)}")
+        elif resultado.reaproveitado:
+            print(f"✓ {resultado.espec.nome}: inalterado ({saidas})")
+        else:
+            print(f"✓ {resultado.espec.nome}")
+            print(f"  → Salvo: {saidas}")
+    duracao_graficos = time.perf_counter() - inicio_graficos
+    gerados = sum(not r.reaproveitado and r.erro is None for r in resultados_graficos)
+    taxa = gerados / duracao_graficos if duracao_graficos > 0 else 0.0
+    print(f"⏱ {gerados} gráficos gerados em {duracao_graficos:.2f}s ({taxa:.1f} gráficos/s), "
+          f"{sum(r.reaproveitado for r in resultados_graficos)} inalterados")
+
+    # Arquivos do relatório, conforme o resultado de cada gráfico principal
+    # (um gráfico que falhou não tem os seus arquivos listados como gerados)
+    arquivos_gerados = []
+    for resultado in resultados_graficos[:principais]:
+        for formato, saida in resultado.espec.saidas.items():
+            if resultado.erro is not None:
+                arquivos_gerados.append(f"✗ {saida} (não gerado, ver o erro acima)")
+            else:
+                arquivos_gerados.append(f"✓ {saida}" + (" (interativo)" if formato == 'html' else ""))
+    if len(resultados_graficos) > principais:
+        extras = resultados_graficos[principais:]
+        ok = sum(resultado.erro is None for resultado in extras)
+        arquivos_gerados.append(f"{'✓' if ok == len(extras) else '✗'} {DIRETORIO_RADARES}/ "
+                                f"({ok} de {len(extras)} gráficos gerados)")
+    lista_arquivos = '\n'.join(arquivos_gerados)
+
+    print()
+
+    # ============================================================================
+    # 6. RELATÓRIO FINAL
+    # ============================================================================
+    print("6. RELATÓRIO EXECUTIVO")
+    etapas.iniciar("6. RELATÓRIO EXECUTIVO")
+    print("=" * 80)
+
+    print(f"""
 RECOMENDAÇÃO DE INVESTIMENTO - TECHNOVA
 {'=' * 80}
 
@@ -260,30 +252,32 @@ JUSTIFICATIVA:
 DESTAQUES POR DIMENSÃO:
 """)
 
-for cat in categorias:
-    valor = melhor_startup[cat]
-    print(f"  • {cat}: {valor:.2f}/5.00")
+    for cat in categorias:
+        valor = melhor_startup[cat]
+        print(f"  • {cat}: {valor:.2f}/5.00")
 
-print(f"""
+    print(f"""
 ANÁLISE SETORIAL:
 - Total de startups ativas no setor {melhor_startup['setor']}: {len(df_investimento[df_investimento['setor'] == melhor_startup['setor']])}
 - Média do setor: {df_investimento[df_investimento['setor'] == melhor_startup['setor']]['Score_Global'].mean():.2f}
-- Posição da startup no setor: #{(df_investimento[df_investimento['setor'] == melhor_startup['setor']]['Score_Global'] > melhor_startup['Score_Global']).sum() + 1}
+- Posição da startup no setor: #{posicoes.loc[(melhor_startup.name, 'Score_Global'), 'posicao_setor']}
 
 ARQUIVOS GERADOS:
-✓ radar_melhor_startup.html (interativo)
-✓ radar_melhor_startup.png
-✓ boxplot_score_por_setor.png
-✓ scatter_performance_viabilidade.png
+{lista_arquivos}
 
 {'=' * 80}
 """)
 
-# Salvar DataFrames processados
-df_investimento.to_csv('startups_ativas_processadas.csv', index=False, encoding='utf-8-sig')
-df_falhas.to_csv('startups_inativas_processadas.csv', index=False, encoding='utf-8-sig')
-print("✓ DataFrames salvos: startups_ativas_processadas.csv e startups_inativas_processadas.csv")
-print()
-print("=" * 80)
-print("ANÁLISE CONCLUÍDA COM SUCESSO!")
-print("=" * 80)
+    # Salvar DataFrames processados
+    df_investimento.to_csv('startups_ativas_processadas.csv', index=False, encoding='utf-8-sig')
+    df_falhas.to_csv('startups_inativas_processadas.csv', index=False, encoding='utf-8-sig')
+    print("✓ DataFrames salvos: startups_ativas_processadas.csv e startups_inativas_processadas.csv")
+    print()
+    print("=" * 80)
+    print("ANÁLISE CONCLUÍDA COM SUCESSO!")
+    print("=" * 80)
+    etapas.encerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark de Inicialização - TechNova IoT
+Mede o tempo de importação dos scripts com `python -X importtime` e o
+tempo de partida das ferramentas interativas, e confere que as
+bibliotecas pesadas só são carregadas nos caminhos que as usam
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+DIRETORIO_SCRIPTS = Path(__file__).resolve().parent
+REPETICOES_PADRAO = 5
+
+# Bibliotecas que cada módulo NÃO deve importar só por ser importado
+# (elas são carregadas dentro das funções que as usam)
+IMPORTACOES_ADIADAS = {
+    'visualizador_banco': ('pandas', 'numpy'),
+    'consultar_banco': ('pandas',),
+    'criar_banco_dados': ('pandas',),
+    'exportar_para_powerbi': ('pandas',),
+    'analise_maturidade_iot': ('matplotlib', 'seaborn', 'plotly'),
+}
+
+# Partidas completas: argumentos do script e o que é digitado no terminal
+PARTIDAS = {
+    'interpretador (python -c pass)': (['-c', 'pass'], None),
+    'visualizador: listar tabelas e sair': (['visualizador_banco.py'], '1\n\n0\n'),
+}
+
+MedidaImportacao = namedtuple(
+    'MedidaImportacao', ['modulo', 'total_ms', 'maiores', 'carregados']
+)
+
+
+def ler_importtime(saida_erro):
+    """
+    Interpreta a saída de `-X importtime`
+
+    Returns:
+        Lista de (nome, profundidade, próprio_us, acumulado_us), na ordem
+        em que o Python a imprime (dependências antes de quem as importou)
+    """
+    registros = []
+    for linha in saida_erro.splitlines():
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|', 2)
+        profundidade = (len(nome) - len(nome.lstrip(' ')) - 1) // 2
+        registros.append((nome.strip(), profundidade, int(proprio), int(acumulado)))
+    return registros
+
+
+def _importar(modulo):
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=DIRETORIO_SCRIPTS, capture_output=True, text=True
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"falha ao importar {modulo}: {processo.stderr.strip().splitlines()[-1]}")
+    return ler_importtime(processo.stderr)
+
+
+def medir_importacao(modulo, repeticoes=REPETICOES_PADRAO, maiores=5):
+    """
+    Importa `modulo` em processos novos e mede o tempo acumulado
+
+    Returns:
+        MedidaImportacao com a mediana do tempo total (ms), as `maiores`
+        importações diretas da execução mediana e o conjunto de pacotes
+        de primeiro nível carregados
+    """
+    execucoes = []
+    for _ in range(repeticoes):
+        registros = _importar(modulo)
+        posicao = next(i for i, (nome, profundidade, _, _) in enumerate(registros)
+                       if nome == modulo and profundidade == 0)
+        # As dependências aparecem antes do módulo, logo após o registro de
+        # primeiro nível anterior (o que vem antes é a partida do interpretador)
+        inicio = max((i + 1 for i in range(posicao) if registros[i][1] == 0), default=0)
+        execucoes.append((registros[posicao][3], registros[inicio:posicao + 1]))
+    execucoes.sort(key=lambda execucao: execucao[0])
+    total, registros = execucoes[len(execucoes) // 2]
+
+    diretas = sorted(
+        ((nome, acumulado / 1000) for nome, profundidade, _, acumulado in registros if profundidade == 1),
+        key=lambda item: item[1], reverse=True
+    )
+    carregados = {nome.split('.')[0] for nome, _, _, _ in registros}
+    return MedidaImportacao(modulo, total / 1000, diretas[:maiores], carregados)
+
+
+def medir_partida(argumentos, entrada=None, repeticoes=REPETICOES_PADRAO):
+    """Mediana (ms) do tempo de parede de `python <argumentos>` até o fim do processo"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable] + argumentos, cwd=DIRETORIO_SCRIPTS, input=entrada,
+                       capture_output=True, text=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def medir_modulos(modulos=None, repeticoes=REPETICOES_PADRAO):
+    """MedidaImportacao de cada módulo (padrão: os de IMPORTACOES_ADIADAS)"""
+    return [medir_importacao(modulo, repeticoes) for modulo in (modulos or IMPORTACOES_ADIADAS)]
+
+
+def main():
+    """Uso: python benchmark_inicializacao.py [repetições]"""
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else REPETICOES_PADRAO
+
+    print("=" * 80)
+    print(f"BENCHMARK DE INICIALIZAÇÃO (mediana de {repeticoes} processos)")
+    print("=" * 80)
+
+    violacoes = []
+    print("\n📦 IMPORTAÇÃO (python -X importtime):")
+    for medida in medir_modulos(repeticoes=repeticoes):
+        adiadas = IMPORTACOES_ADIADAS.get(medida.modulo, ())
+        carregadas = [pacote for pacote in adiadas if pacote in medida.carregados]
+        marca = '✗' if carregadas else '✓'
+        print(f"\n{marca} {medida.modulo:28s} {medida.total_ms:8.1f} ms")
+        for nome, ms in medida.maiores:
+            print(f"    {nome:32s} {ms:8.1f} ms")
+        if carregadas:
+            print(f"    ✗ importa na carga: {', '.join(carregadas)}")
+            violacoes.append(medida.modulo)
+
+    print("\n🚀 PARTIDA COMPLETA:")
+    for rotulo, (argumentos, entrada) in PARTIDAS.items():
+        print(f"  {rotulo:40s} {medir_partida(argumentos, entrada, repeticoes):8.1f} ms")
+
+    if violacoes:
+        print(f"\n✗ Bibliotecas pesadas importadas antes do uso em: {', '.join(violacoes)}")
+        sys.exit(1)
+    print("\n✓ Nenhuma biblioteca pesada importada antes do uso")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Benchmark do Pipeline - TechNova IoT
+Gera um portfólio sintético no formato da aba Avaliacoes_Startups e mede
+cada etapa do pipeline (leitura, scores, importação, consultas, exportação
+e gráficos), comparando com o histórico de execuções anteriores
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmark_inicializacao import medir_modulos
+from busca_nomes import nomes_sinteticos
+from consultar_banco import CONSULTAS_EXEMPLO
+from criar_banco_dados import TechNovaDatabase
+from exportar_para_powerbi import exportar_para_powerbi
+from leitor_dados import ABA_AVALIACOES, ler_avaliacoes
+from motor_scores import NOMES_DIMENSOES, aplicar_scores, identificar_colunas_notas
+from renderizador_graficos import espec_boxplot, espec_radar, espec_scatter, renderizar_graficos
+from utilitarios import gravar_json_atomico, valor_opcao
+
+ARQUIVO_HISTORICO = 'benchmark_historico.json'
+
+# Faixa de tamanhos aceita pelo gerador
+LINHAS_MINIMO = 1_000
+LINHAS_MAXIMO = 10_000_000
+LINHAS_PADRAO = 10_000
+
+# Acima deste tamanho a leitura do Excel não é medida: gravar a planilha
+# com openpyxl domina o tempo do benchmark (e o .xlsx tem no máximo
+# 1.048.576 linhas)
+LIMITE_LINHAS_EXCEL = 50_000
+
+TAMANHO_BLOCO_GERACAO = 100_000
+
+# Uma etapa regride quando fica mais de LIMITE_REGRESSAO (fração) acima da
+# mediana das últimas JANELA_REFERENCIA execuções com o mesmo número de
+# linhas e a diferença passa de TEMPO_MINIMO_REGRESSAO segundos (etapas
+# de poucos milissegundos oscilam demais para uma comparação relativa)
+LIMITE_REGRESSAO = 0.20
+JANELA_REFERENCIA = 5
+TEMPO_MINIMO_REGRESSAO = 0.01
+
+SETORES = ['Agri-IoT', 'Water-Ops', 'SmartCity', 'Enviro-Tech', 'Power-Grid']
+PROPORCAO_ATIVAS = 33 / 45
+
+# Critérios da aba Avaliacoes_Startups, na ordem da planilha
+CRITERIOS = [
+    '1.1_precisao_basica', '1.2_calibracao', '1.3_estabilidade_leitura', '1.4_latencia_sinal',
+    '1.5_relacao_sinal_ruido',
+    '2.1_custo_bom', '2.2_custo_opex', '2.3_tempo_deploy', '2.4_escalabilidade_fabril',
+    '2.5_competitividade_preco',
+    '3.1_mtbf_teorico', '3.2_tratamento_erros', '3.3_estabilidade_firmware', '3.4_tempo_recuperacao',
+    '3.5_stress_test',
+    '4.1_tempo_instalacao', '4.2_facilidade_config', '4.3_clareza_dashboard', '4.4_feedback_usuario',
+    '4.5_doc_tecnica',
+    '5.1_autonomia_bateria', '5.2_eficiencia_carga', '5.3_consumo_standby', '5.4_dimensionamento_fonte',
+    '5.5_modo_sleep',
+    '6.1_protecao_ip_agua', '6.2_resistencia_termica', '6.3_integridade_mecanica',
+    '6.4_resistencia_impacto', '6.5_durabilidade_conector',
+    '7.1_perda_pacotes', '7.2_latencia_nuvem', '7.3_integridade_backup', '7.4_resiliencia_api',
+    '7.5_seguranca_cripto',
+    '8.1_risco_supply_chain', '8.2_frequencia_manutencao', '8.3_indice_reparabilidade',
+    '8.4_tempo_montagem', '8.5_ciclo_vida_material',
+]
+
+Comparacao = namedtuple('Comparacao', ['etapa', 'segundos', 'referencia', 'variacao', 'regrediu'])
+
+
+def gerar_blocos(linhas, tamanho_bloco=TAMANHO_BLOCO_GERACAO, semente=42):
+    """
+    Gera o portfólio sintético em blocos de até `tamanho_bloco` linhas
+
+    Cada startup tem uma qualidade base (maior nas ativas) e as 40 notas
+    (inteiros de 1 a 5) variam em torno dela, como na planilha real.
+
+    Yields:
+        DataFrame com as colunas da aba Avaliacoes_Startups
+    """
+    rng = np.random.default_rng(semente)
+    for numero, inicio in enumerate(range(0, linhas, tamanho_bloco)):
+        n = min(tamanho_bloco, linhas - inicio)
+        ativas = rng.random(n) < PROPORCAO_ATIVAS
+        qualidade = rng.normal(np.where(ativas, 3.4, 2.6), 0.5)
+        notas = np.clip(np.rint(qualidade[:, None] + rng.normal(0, 0.8, (n, len(CRITERIOS)))), 1, 5)
+        datas = np.datetime64('2024-07-01') + rng.integers(0, 365, size=n)
+
+        # O prefixo vem do gerador da busca; o número global garante nomes únicos
+        nomes = [f"{nome.rstrip('0123456789')}{inicio + i + 1}"
+                 for i, nome in enumerate(nomes_sinteticos(n, semente + numero))]
+        bloco = pd.DataFrame({
+            'id_startup': np.arange(inicio + 1, inicio + n + 1),
+            'nome_startup': nomes,
+            'setor': np.array(SETORES, dtype=object)[rng.integers(len(SETORES), size=n)],
+            'status': np.where(ativas, 'Ativa', 'Inativa').astype(object),
+            'data_avaliacao': datas.astype(str).astype(object),
+        })
+        yield pd.concat([bloco, pd.DataFrame(notas.astype(np.uint8), columns=CRITERIOS)], axis=1)
+
+
+def gerar_portfolio(linhas, diretorio, semente=42, excel=True):
+    """
+    Grava o portfólio sintético como CSV (sempre) e Excel (se `excel`)
+
+    Returns:
+        Tupla (caminho do CSV, caminho do Excel ou None)
+    """
+    caminho_csv = Path(diretorio) / 'portfolio_sintetico.csv'
+    for i, bloco in enumerate(gerar_blocos(linhas, semente=semente)):
+        bloco.to_csv(caminho_csv, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+
+    caminho_excel = None
+    if excel:
+        caminho_excel = Path(diretorio) / 'portfolio_sintetico.xlsx'
+        df = pd.concat(gerar_blocos(linhas, semente=semente), ignore_index=True)
+        df.to_excel(caminho_excel, sheet_name=ABA_AVALIACOES, index=False)
+    return caminho_csv, caminho_excel
+
+
+def _cronometrar(tempos, etapa, funcao, *args, **kwargs):
+    """Executa `funcao` sem a saída no terminal e guarda a duração em tempos[etapa]"""
+    with redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        resultado = funcao(*args, **kwargs)
+        tempos[etapa] = time.perf_counter() - inicio
+    return resultado
+
+
+def _consultas(db):
+    """Consultas do consultar_banco.exemplo_consultas, na mesma ordem"""
+    melhor = db.obter_melhor_startup()
+    consultas = {
+        'listar_startups_ativas': lambda: db.listar_startups_ativas(limite=10),
+        'obter_melhor_startup': db.obter_melhor_startup,
+        'obter_estatisticas_setor': db.obter_estatisticas_setor,
+        'listar_startups_por_setor': lambda: db.listar_startups_por_setor('Saúde'),
+    }
+    for nome, query in CONSULTAS_EXEMPLO.items():
+        consultas[nome] = lambda query=query: db.executar_query_personalizada(query)
+    if melhor:
+        consultas['obter_avaliacoes_dimensoes'] = lambda: db.obter_avaliacoes_dimensoes(melhor[0])
+    return consultas
+
+
+def _especs_graficos(df, diretorio):
+    """Radar da melhor startup, boxplot e scatter, como em analise_maturidade_iot.py"""
+    ativas = df[df['status'] == 'Ativa']
+    if ativas.empty:
+        ativas = df
+    melhor = ativas.loc[ativas['Score_Performance_Viabilidade'].idxmax()]
+    saida = Path(diretorio)
+    return [
+        espec_radar(melhor['nome_startup'], melhor['setor'], melhor['Score_Global'], NOMES_DIMENSOES,
+                    [melhor[dim] for dim in NOMES_DIMENSOES],
+                    {'html': str(saida / 'radar.html'), 'png': str(saida / 'radar.png')}),
+        espec_boxplot(ativas['setor'], ativas['Score_Global'], str(saida / 'boxplot.png')),
+        espec_scatter(ativas['setor'], ativas[NOMES_DIMENSOES[0]], ativas[NOMES_DIMENSOES[1]],
+                      (melhor['nome_startup'], melhor[NOMES_DIMENSOES[0]], melhor[NOMES_DIMENSOES[1]]),
+                      str(saida / 'scatter.png')),
+    ]
+
+
+def executar_benchmark(linhas=LINHAS_PADRAO, semente=42, excel=None, graficos=True,
+                       inicializacao=True):
+    """
+    Mede cada etapa do pipeline sobre um portfólio sintético de `linhas` startups
+
+    Tudo roda em um diretório temporário (banco, exportação e gráficos são
+    descartados ao final). A geração dos arquivos de entrada fica fora das
+    etapas comparadas; etapas que falham são registradas em 'erros'.
+
+    Args:
+        linhas: Número de startups do portfólio
+        semente: Semente do gerador (mesma semente, mesmos dados)
+        excel: Se True, mede também a leitura do .xlsx (padrão: apenas até
+               LIMITE_LINHAS_EXCEL linhas)
+        graficos: Se False, não mede a renderização dos gráficos
+        inicializacao: Se True, mede também a importação de cada script
+                       (`python -X importtime`, ver benchmark_inicializacao.py)
+
+    Returns:
+        Dicionário da execução, no formato gravado no histórico
+    """
+    if excel is None:
+        excel = linhas <= LIMITE_LINHAS_EXCEL
+    preparacao, etapas, erros = {}, {}, {}
+
+    with tempfile.TemporaryDirectory(prefix='technova_bench_') as diretorio:
+        caminho_csv, caminho_excel = _cronometrar(
+            preparacao, 'gerar_portfolio', gerar_portfolio, linhas, diretorio, semente, excel
+        )
+
+        # Leitura e scores
+        if caminho_excel is not None:
+            _cronometrar(etapas, 'carregar_excel', ler_avaliacoes, caminho_excel)
+        df = _cronometrar(etapas, 'carregar_csv', ler_avaliacoes, caminho_csv)
+        _cronometrar(etapas, 'calcular_scores', aplicar_scores, df, identificar_colunas_notas(df.columns))
+
+        # Importação para o banco (sem o cache colunar, para medir a leitura real)
+        db_path = str(Path(diretorio) / 'technova_bench.db')
+        # Sem o cache de resultados: cada consulta é medida no banco
+        db = TechNovaDatabase(db_path, cache_resultados=False)
+        with redirect_stdout(io.StringIO()):
+            db.conectar()
+            db.criar_tabelas()
+        importado = _cronometrar(etapas, 'importar_dados_excel', db.importar_dados_excel,
+                                 str(caminho_csv), usar_cache=False)
+        if not importado:
+            erros['importar_dados_excel'] = 'importação falhou'
+            etapas.pop('importar_dados_excel')
+        else:
+            for nome, consulta in _consultas(db).items():
+                _cronometrar(etapas, f'consulta:{nome}', consulta)
+        with redirect_stdout(io.StringIO()):
+            db.desconectar()
+
+        if importado:
+            exportado = _cronometrar(etapas, 'exportar_para_powerbi', exportar_para_powerbi,
+                                     db_path, str(Path(diretorio) / 'powerbi_export'), forcar=True)
+            if not exportado:
+                erros['exportar_para_powerbi'] = 'exportação falhou'
+                etapas.pop('exportar_para_powerbi')
+
+        if graficos:
+            resultados = _cronometrar(
+                etapas, 'renderizar_graficos', renderizar_graficos, _especs_graficos(df, diretorio),
+                forcar=True, manifesto=str(Path(diretorio) / 'manifesto.json')
+            )
+            falhas = [f"{r.espec.nome}: {' '.join(str(r.erro).split())}" for r in resultados if r.erro is not None]
+            if falhas:
+                # Tempo parcial não é comparável com execuções completas
+                erros['renderizar_graficos'] = '; '.join(falhas)
+                etapas.pop('renderizar_graficos')
+
+    if inicializacao:
+        for medida in medir_modulos(repeticoes=3):
+            etapas[f'importar:{medida.modulo}'] = medida.total_ms / 1000
+
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'linhas': linhas,
+        'semente': semente,
+        'python': sys.version.split()[0],
+        'preparacao': preparacao,
+        'etapas': etapas,
+        'erros': erros,
+    }
+
+
+def carregar_historico(caminho=ARQUIVO_HISTORICO):
+    """Lista de execuções anteriores (vazia se o arquivo não existe ou é inválido)"""
+    try:
+        with open(caminho, encoding='utf-8') as f:
+            historico = json.load(f)
+        return historico if isinstance(historico, list) else []
+    except (OSError, ValueError):
+        return []
+
+
+def gravar_historico(historico, caminho=ARQUIVO_HISTORICO):
+    """Grava o histórico de forma atômica (arquivo temporário + rename)"""
+    gravar_json_atomico(caminho, historico)
+
+
+def comparar_com_historico(execucao, historico, limite=LIMITE_REGRESSAO, janela=JANELA_REFERENCIA):
+    """
+    Compara cada etapa com a mediana das últimas `janela` execuções de mesmo tamanho
+
+    Returns:
+        Lista de Comparacao (referencia e variacao são None quando a etapa
+        não tem histórico)
+    """
+    anteriores = [e for e in historico if e.get('linhas') == execucao['linhas']][-janela:]
+    comparacoes = []
+    for etapa, segundos in execucao['etapas'].items():
+        referencias = [e['etapas'][etapa] for e in anteriores if etapa in e.get('etapas', {})]
+        if not referencias:
+            comparacoes.append(Comparacao(etapa, segundos, None, None, False))
+            continue
+        referencia = statistics.median(referencias)
+        variacao = (segundos - referencia) / referencia if referencia > 0 else 0.0
+        regrediu = variacao > limite and segundos - referencia > TEMPO_MINIMO_REGRESSAO
+        comparacoes.append(Comparacao(etapa, segundos, referencia, variacao, regrediu))
+    return comparacoes
+
+
+def main():
+    """
+    Uso: python benchmark_pipeline.py [linhas] [--limite 0.20] [--historico arquivo.json]
+         [--semente 42] [--sem-graficos] [--sem-excel] [--sem-inicializacao]
+    """
+    argumentos = [a for a in sys.argv[1:2] if not a.startswith('--')]
+    try:
+        linhas = int(argumentos[0]) if argumentos else LINHAS_PADRAO
+        limite = float(valor_opcao('--limite', LIMITE_REGRESSAO))
+        semente = int(valor_opcao('--semente', 42))
+    except ValueError as e:
+        print(f"✗ Argumento inválido: {e}")
+        sys.exit(1)
+    if not LINHAS_MINIMO <= linhas <= LINHAS_MAXIMO:
+        print(f"✗ Número de linhas fora da faixa ({LINHAS_MINIMO:,} a {LINHAS_MAXIMO:,}): {linhas:,}")
+        sys.exit(1)
+    caminho_historico = valor_opcao('--historico', ARQUIVO_HISTORICO)
+
+    print("=" * 80)
+    print(f"BENCHMARK DO PIPELINE - {linhas:,} STARTUPS SINTÉTICAS")
+    print("=" * 80)
+
+    execucao = executar_benchmark(
+        linhas, semente,
+        excel=False if '--sem-excel' in sys.argv else None,
+        graficos='--sem-graficos' not in sys.argv,
+        inicializacao='--sem-inicializacao' not in sys.argv,
+    )
+    historico = carregar_historico(caminho_historico)
+    comparacoes = comparar_com_historico(execucao, historico, limite)
+
+    print(f"\n⏱ Portfólio gerado em {execucao['preparacao']['gerar_portfolio']:.2f}s\n")
+    print(f"{'Etapa':<42} {'Tempo (s)':>10} {'Referência':>11} {'Variação':>9}")
+    print("-" * 80)
+    for c in comparacoes:
+        if c.referencia is None:
+            print(f"  {c.etapa:<40} {c.segundos:>10.4f} {'-':>11} {'-':>9}")
+        else:
+            marca = '✗' if c.regrediu else '✓'
+            print(f"{marca} {c.etapa:<40} {c.segundos:>10.4f} {c.referencia:>11.4f} {c.variacao:>+9.1%}")
+    for etapa, erro in execucao['erros'].items():
+        print(f"✗ {etapa}: {erro}")
+
+    historico.append(execucao)
+    gravar_historico(historico, caminho_historico)
+    print(f"\n✓ Execução registrada em {caminho_historico} ({len(historico)} no histórico)")
+
+    regressoes = [c for c in comparacoes if c.regrediu]
+    if regressoes:
+        print(f"✗ {len(regressoes)} etapa(s) mais de {limite:.0%} acima da referência: "
+              f"{', '.join(c.etapa for c in regressoes)}")
+        sys.exit(1)
+    print("✓ Nenhuma regressão acima do limite")
+
+
+if __name__ == "__main__":
+    main()
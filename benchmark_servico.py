@@ -0,0 +1,197 @@
+"""
+Benchmark do Serviço de Consultas - TechNova IoT
+Gerador de carga: N clientes simultâneos fazem requisições ao
+servico_consultas.py e são medidas a vazão e as latências (p50/p95/p99)
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import namedtuple
+from urllib.parse import quote
+
+from motor_exportacao import conectar_somente_leitura
+from servico_consultas import ENDERECO_PADRAO, TRABALHADORES_PADRAO, ServicoConsultas
+from utilitarios import valor_opcao
+
+CLIENTES_PADRAO = (1, 8, 32)
+REQUISICOES_POR_CLIENTE = 200
+
+ResultadoCarga = namedtuple(
+    'ResultadoCarga',
+    ['clientes', 'requisicoes', 'erros', 'segundos', 'vazao', 'p50_ms', 'p95_ms', 'p99_ms', 'coalescidas',
+     'acertos_cache']
+)
+
+
+def caminhos_padrao(db_path):
+    """Mistura de requisições do visualizador/consultas, com nomes reais do banco"""
+    conn = conectar_somente_leitura(db_path)
+    try:
+        nomes = [nome for nome, in conn.execute('SELECT nome_startup FROM startups ORDER BY id LIMIT 3')]
+    finally:
+        conn.close()
+    caminhos = [
+        '/listar_startups_ativas?limite=10',
+        '/obter_melhor_startup',
+        '/obter_estatisticas_setor',
+        '/obter_top_k?k=5',
+    ]
+    for nome in nomes:
+        caminhos += [f'/obter_avaliacoes_dimensoes?nome_startup={quote(nome)}',
+                     f'/obter_posicoes?nome_startup={quote(nome)}',
+                     f'/consultar_startup?nome_startup={quote(nome)}']
+    return caminhos
+
+
+def percentil(valores, fracao):
+    """Percentil pelo método do posto mais próximo (valores já ordenados)"""
+    if not valores:
+        return float('nan')
+    return valores[min(len(valores) - 1, max(0, math.ceil(fracao * len(valores)) - 1))]
+
+
+async def _requisitar(leitor, escritor, caminho):
+    """Envia um GET na conexão aberta e devolve (status, corpo)"""
+    escritor.write(f'GET {caminho} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode('latin-1'))
+    await escritor.drain()
+    status = int((await leitor.readline()).split()[1])
+    tamanho = 0
+    while True:
+        linha = await leitor.readline()
+        if linha in (b'\r\n', b''):
+            break
+        nome, _, valor = linha.decode('latin-1').partition(':')
+        if nome.lower() == 'content-length':
+            tamanho = int(valor)
+    return status, await leitor.readexactly(tamanho)
+
+
+async def _cliente(endereco, porta, caminhos, requisicoes, deslocamento, latencias):
+    """Um cliente com conexão keep-alive; devolve o número de respostas com erro"""
+    leitor, escritor = await asyncio.open_connection(endereco, porta)
+    erros = 0
+    try:
+        for i in range(requisicoes):
+            inicio = time.perf_counter()
+            status, _ = await _requisitar(leitor, escritor, caminhos[(deslocamento + i) % len(caminhos)])
+            latencias.append(time.perf_counter() - inicio)
+            erros += status != 200
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+    return erros
+
+
+async def _estatisticas(endereco, porta):
+    leitor, escritor = await asyncio.open_connection(endereco, porta)
+    try:
+        _, corpo = await _requisitar(leitor, escritor, '/estatisticas')
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+    return json.loads(corpo)
+
+
+async def gerar_carga(endereco, porta, clientes, requisicoes, caminhos):
+    """
+    Dispara `clientes` clientes simultâneos com `requisicoes` GETs cada
+
+    Cada cliente percorre `caminhos` a partir de um deslocamento próprio,
+    de modo que requisições iguais se sobrepõem e podem ser coalescidas.
+
+    Returns:
+        ResultadoCarga com a vazão (requisições/s) e as latências em ms
+    """
+    antes = await _estatisticas(endereco, porta)
+    latencias = []
+    inicio = time.perf_counter()
+    erros = await asyncio.gather(*[
+        _cliente(endereco, porta, caminhos, requisicoes, i, latencias) for i in range(clientes)
+    ])
+    segundos = time.perf_counter() - inicio
+    depois = await _estatisticas(endereco, porta)
+
+    latencias.sort()
+    total = len(latencias)
+    # Serviço sem cache de resultados (ou de versão anterior): sem acertos
+    acertos = [(estatisticas.get('cache') or {}).get('acertos', 0) for estatisticas in (antes, depois)]
+    return ResultadoCarga(
+        clientes, total, sum(erros), segundos, total / segundos if segundos > 0 else float('inf'),
+        percentil(latencias, 0.50) * 1000, percentil(latencias, 0.95) * 1000, percentil(latencias, 0.99) * 1000,
+        depois['coalescidas'] - antes['coalescidas'], acertos[1] - acertos[0],
+    )
+
+
+async def _executar(db_path, externo, niveis, requisicoes, trabalhadores, coalescer, cache_resultados):
+    servico = servidor = None
+    if externo:
+        endereco, _, porta = externo.rpartition(':')
+        porta = int(porta)
+    else:
+        # Serviço no mesmo processo, em uma porta livre
+        servico = ServicoConsultas(db_path, trabalhadores, coalescer=coalescer,
+                                   cache_resultados=cache_resultados)
+        servidor = await servico.iniciar(ENDERECO_PADRAO, 0)
+        endereco, porta = ENDERECO_PADRAO, servidor.sockets[0].getsockname()[1]
+    try:
+        caminhos = caminhos_padrao(db_path)
+        return [await gerar_carga(endereco, porta, clientes, requisicoes, caminhos) for clientes in niveis]
+    finally:
+        if servidor is not None:
+            servidor.close()
+            await servidor.wait_closed()
+            servico.fechar()
+
+
+def main():
+    """
+    Uso: python benchmark_servico.py [clientes] [--requisicoes 200] [--db technova_iot.db]
+         [--trabalhadores 4] [--sem-coalescencia] [--sem-cache] [--externo host:porta]
+
+    Sem `clientes`, mede 1, 8 e 32 clientes simultâneos. Com --externo a
+    carga vai para um servico_consultas.py já em execução (o --db ainda
+    é lido para escolher os nomes das startups). Com --sem-cache o
+    serviço do próprio processo não usa o cache de resultados.
+    """
+    argumentos = [a for a in sys.argv[1:2] if not a.startswith('--')]
+    try:
+        niveis = (int(argumentos[0]),) if argumentos else CLIENTES_PADRAO
+        requisicoes = int(valor_opcao('--requisicoes', REQUISICOES_POR_CLIENTE))
+        trabalhadores = int(valor_opcao('--trabalhadores', TRABALHADORES_PADRAO))
+    except ValueError as e:
+        print(f"✗ Argumento inválido: {e}")
+        sys.exit(1)
+    coalescer = '--sem-coalescencia' not in sys.argv
+    cache_resultados = '--sem-cache' not in sys.argv
+
+    print("=" * 80)
+    print("BENCHMARK DO SERVIÇO DE CONSULTAS")
+    print("=" * 80)
+    try:
+        resultados = asyncio.run(_executar(valor_opcao('--db', 'technova_iot.db'), valor_opcao('--externo', None),
+                                           niveis, requisicoes, trabalhadores, coalescer, cache_resultados))
+    except (OSError, ValueError) as e:
+        print(f"✗ Erro ao executar a carga: {e}")
+        sys.exit(1)
+
+    print(f"\n{'Clientes':>8} {'Requisições':>12} {'Erros':>6} {'req/s':>10} "
+          f"{'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'Coalescidas':>12} {'Cache':>8}")
+    print("-" * 80)
+    for r in resultados:
+        print(f"{r.clientes:>8} {r.requisicoes:>12} {r.erros:>6} {r.vazao:>10,.0f} "
+              f"{r.p50_ms:>9.2f} {r.p95_ms:>9.2f} {r.p99_ms:>9.2f} {r.coalescidas:>12} {r.acertos_cache:>8}")
+
+    if any(r.erros for r in resultados):
+        print("\n✗ Houve respostas com erro")
+        sys.exit(1)
+    print("\n✓ Todas as requisições responderam 200")
+
+
+if __name__ == "__main__":
+    main()
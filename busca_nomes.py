@@ -0,0 +1,337 @@
+"""
+Busca de Startups por Nome - TechNova IoT
+Índice de n-gramas em memória para busca por prefixo, por trecho e com
+tolerância a erros de digitação, sem varrer a tabela a cada consulta
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import sqlite3
+import statistics
+import sys
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+import numpy as np
+
+# Tamanho máximo dos n-gramas indexados (todos de 1 até este valor)
+TAMANHO_NGRAMA = 3
+LIMITE_RESULTADOS = 20
+# Candidatas avaliadas com distância de edição na busca aproximada
+MAX_CANDIDATOS_APROXIMADOS = 64
+# Termos menores que isto não usam busca aproximada
+TAMANHO_MINIMO_APROXIMADO = 4
+
+# Ordem de relevância dos tipos de correspondência
+TIPOS_CORRESPONDENCIA = ('exata', 'prefixo', 'trecho', 'aproximada')
+
+ResultadoBusca = namedtuple('ResultadoBusca', ['posicao', 'nome', 'tipo', 'distancia'])
+
+
+def normalizar(texto):
+    """Forma usada na comparação: sem acentos e sem diferença de maiúsculas"""
+    if texto.isascii():
+        return texto.lower()
+    decomposto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def ngramas(texto, tamanho):
+    """Conjunto dos n-gramas de um tamanho (vazio se o texto for menor)"""
+    return {texto[i:i + tamanho] for i in range(len(texto) - tamanho + 1)}
+
+
+def erros_tolerados(termo):
+    """Distância de edição aceita na busca aproximada para um termo normalizado"""
+    if len(termo) < TAMANHO_MINIMO_APROXIMADO:
+        return 0
+    return 1 if len(termo) <= 7 else 2
+
+
+def distancia_trecho(termo, texto, limite):
+    """
+    Menor distância de edição entre `termo` e qualquer trecho de `texto`
+
+    O início do trecho é livre, então "chilek" casa com "chileak" e com
+    "chileakpro" a distância 1. Usa o algoritmo de vetores de bits de
+    Myers: cada caractere do texto atualiza uma coluna inteira da tabela
+    de programação dinâmica com operações em inteiros.
+
+    Returns:
+        A distância, ou limite + 1 se ela passar do limite
+    """
+    tamanho = len(termo)
+    if tamanho == 0:
+        return 0
+    mascara = (1 << tamanho) - 1
+    topo = 1 << (tamanho - 1)
+    padroes = {}
+    for i, letra in enumerate(termo):
+        padroes[letra] = padroes.get(letra, 0) | (1 << i)
+
+    positivos, negativos = mascara, 0
+    distancia = melhor = tamanho
+    for letra in texto:
+        iguais = padroes.get(letra, 0)
+        xv = iguais | negativos
+        xh = (((iguais & positivos) + positivos) ^ positivos) | iguais
+        ph = negativos | (~(xh | positivos) & mascara)
+        mh = positivos & xh
+        if ph & topo:
+            distancia += 1
+        elif mh & topo:
+            distancia -= 1
+        # Sem bit de entrada: a primeira linha da tabela é zero (início livre)
+        ph = (ph << 1) & mascara
+        mh = (mh << 1) & mascara
+        positivos = mh | (~(xv | ph) & mascara)
+        negativos = ph & xv
+        if distancia < melhor:
+            melhor = distancia
+    return melhor if melhor <= limite else limite + 1
+
+
+def _chaves_ngramas(codigos, tamanho):
+    """Chave inteira de cada n-grama (21 bits por caractere Unicode)"""
+    chaves = codigos[:len(codigos) - tamanho + 1].astype(np.int64)
+    for deslocamento in range(1, tamanho):
+        chaves = (chaves << 21) | codigos[deslocamento:len(codigos) - tamanho + 1 + deslocamento]
+    return chaves
+
+
+class IndiceNomes:
+    """
+    Índice de busca sobre uma lista de nomes
+
+    Guarda os nomes normalizados em ordem alfabética (prefixos por busca
+    binária) e, para cada n-grama de 1 a TAMANHO_NGRAMA caracteres, as
+    posições dos nomes que o contêm com a primeira ocorrência em cada um
+    (trechos por interseção dessas listas; erros de digitação por contagem
+    de n-gramas em comum, confirmada com distância de edição).
+    """
+
+    def __init__(self, nomes):
+        self.nomes = list(nomes)
+        self.normalizados = [normalizar(nome) for nome in self.nomes]
+
+        self.ordem_alfabetica = sorted(range(len(self.nomes)), key=self.normalizados.__getitem__)
+        self.chaves_alfabeticas = [self.normalizados[i] for i in self.ordem_alfabetica]
+        self.rank_alfabetico = np.empty(len(self.nomes), dtype=np.int64)
+        self.rank_alfabetico[self.ordem_alfabetica] = np.arange(len(self.nomes))
+
+        self._construir_ngramas()
+
+    def _construir_ngramas(self):
+        """Monta as listas de n-gramas de uma vez, sobre o texto concatenado"""
+        comprimentos = np.array([len(nome) for nome in self.normalizados], dtype=np.int64)
+        texto = '\x00'.join(self.normalizados) + '\x00'
+        codigos = np.frombuffer(texto.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        donos = np.repeat(np.arange(len(self.nomes), dtype=np.int32), comprimentos + 1)
+        deslocamentos = np.arange(len(codigos)) - np.repeat(np.cumsum(comprimentos + 1) - comprimentos - 1,
+                                                              comprimentos + 1)
+
+        chaves, todos_donos, todas_posicoes = [], [], []
+        for tamanho in range(1, TAMANHO_NGRAMA + 1):
+            quantidade = len(codigos) - tamanho + 1
+            validos = deslocamentos[:quantidade] + tamanho <= comprimentos[donos[:quantidade]]
+            chaves.append(_chaves_ngramas(codigos, tamanho)[validos])
+            todos_donos.append(donos[:quantidade][validos])
+            todas_posicoes.append(deslocamentos[:quantidade][validos])
+        chaves = np.concatenate(chaves)
+        donos = np.concatenate(todos_donos)
+        posicoes = np.concatenate(todas_posicoes)
+
+        # Ordenação estável: dentro de cada n-grama as ocorrências seguem a
+        # ordem do texto (nome, depois posição); fica só a primeira por nome
+        ordem = np.argsort(chaves, kind='stable')
+        chaves, donos, posicoes = chaves[ordem], donos[ordem], posicoes[ordem]
+        primeiras = np.ones(len(chaves), dtype=bool)
+        primeiras[1:] = (chaves[1:] != chaves[:-1]) | (donos[1:] != donos[:-1])
+        chaves, self.donos, self.primeiras_posicoes = chaves[primeiras], donos[primeiras], posicoes[primeiras]
+
+        inicios = np.flatnonzero(np.r_[True, chaves[1:] != chaves[:-1]])
+        fins = np.r_[inicios[1:], len(chaves)]
+        self.faixas = {}
+        for chave, inicio, fim in zip(chaves[inicios].tolist(), inicios.tolist(), fins.tolist()):
+            letras = []
+            while chave:
+                letras.append(chr(chave & 0x1FFFFF))
+                chave >>= 21
+            self.faixas[''.join(reversed(letras))] = (inicio, fim)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def _lista(self, grama):
+        """(nomes que contêm o n-grama, posição da primeira ocorrência em cada)"""
+        inicio, fim = self.faixas.get(grama, (0, 0))
+        return self.donos[inicio:fim], self.primeiras_posicoes[inicio:fim]
+
+    def _prefixos(self, termo, limite):
+        """Posições dos nomes que começam com o termo, em ordem alfabética"""
+        encontrados = []
+        k = bisect_left(self.chaves_alfabeticas, termo)
+        while k < len(self.chaves_alfabeticas) and len(encontrados) < limite:
+            if not self.chaves_alfabeticas[k].startswith(termo):
+                break
+            encontrados.append(self.ordem_alfabetica[k])
+            k += 1
+        return encontrados
+
+    def _trechos(self, termo, limite):
+        """
+        Nomes que contêm o termo fora do início, pela posição do trecho
+
+        As candidatas vêm da lista do n-grama mais raro do termo. Se ele
+        aparece na posição k do termo, o trecho não pode começar antes da
+        primeira ocorrência dele no nome menos k: as candidatas são
+        conferidas na ordem desse limite inferior e a conferência para
+        assim que nenhuma outra pode entrar entre as `limite` melhores.
+        Termos de até TAMANHO_NGRAMA caracteres são n-gramas indexados e
+        dispensam conferência.
+        """
+        tamanho = min(len(termo), TAMANHO_NGRAMA)
+        k = min(range(len(termo) - tamanho + 1), key=lambda k: len(self._lista(termo[k:k + tamanho])[0]))
+        candidatas, primeiras = self._lista(termo[k:k + tamanho])
+        minimos = np.maximum(primeiras - k, 0)
+        ranks = self.rank_alfabetico[candidatas]
+        ordem = np.argsort(minimos * len(self.nomes) + ranks)
+
+        encontrados = []
+        for posicao, minimo, rank in zip(candidatas[ordem].tolist(), minimos[ordem].tolist(), ranks[ordem].tolist()):
+            if len(encontrados) >= limite and (minimo, rank) > encontrados[-1][:2]:
+                break
+            inicio = minimo if len(termo) <= TAMANHO_NGRAMA else self.normalizados[posicao].find(termo, minimo)
+            if inicio > 0:
+                insort(encontrados, (inicio, rank, posicao))
+                del encontrados[limite:]
+        return [posicao for _, _, posicao in encontrados]
+
+    def _aproximados(self, termo, excluir, limite):
+        """Nomes a até erros_tolerados(termo) edições de algum trecho do nome"""
+        tolerancia = erros_tolerados(termo)
+        gramas = ngramas(termo, TAMANHO_NGRAMA)
+        listas = [self._lista(grama)[0] for grama in gramas if grama in self.faixas]
+        if tolerancia == 0 or not listas:
+            return []
+
+        # Cada edição destrói no máximo TAMANHO_NGRAMA n-gramas do termo
+        minimo = max(len(gramas) - tolerancia * TAMANHO_NGRAMA, 1)
+        contagem = np.bincount(np.concatenate(listas), minlength=len(self.nomes))
+        candidatas = np.flatnonzero(contagem >= minimo)
+        if candidatas.size > MAX_CANDIDATOS_APROXIMADOS:
+            # Mais n-gramas em comum primeiro; empates pela ordem alfabética
+            prioridade = self.rank_alfabetico[candidatas] - contagem[candidatas] * len(self.nomes)
+            melhores = np.argpartition(prioridade, MAX_CANDIDATOS_APROXIMADOS - 1)
+            candidatas = candidatas[melhores[:MAX_CANDIDATOS_APROXIMADOS]]
+
+        encontrados = []
+        for posicao in candidatas.tolist():
+            if posicao in excluir:
+                continue
+            distancia = distancia_trecho(termo, self.normalizados[posicao], tolerancia)
+            if distancia <= tolerancia:
+                encontrados.append((distancia, int(self.rank_alfabetico[posicao]), posicao))
+        encontrados.sort()
+        return [(posicao, distancia) for distancia, _, posicao in encontrados[:limite]]
+
+    def buscar(self, termo, limite=LIMITE_RESULTADOS):
+        """
+        Busca nomes por exato, prefixo, trecho e aproximação
+
+        O resultado vem ordenado por relevância: correspondência exata,
+        prefixos (ordem alfabética), trechos (pela posição do trecho no
+        nome) e aproximados (pela distância de edição). Maiúsculas e
+        acentos são ignorados.
+
+        Args:
+            termo: Texto digitado
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Lista de ResultadoBusca(posicao, nome, tipo, distancia)
+        """
+        termo = normalizar(termo.strip())
+        if not termo or limite <= 0:
+            return []
+
+        resultados = []
+        for posicao in self._prefixos(termo, limite):
+            tipo = 'exata' if self.normalizados[posicao] == termo else 'prefixo'
+            resultados.append(ResultadoBusca(posicao, self.nomes[posicao], tipo, 0))
+        if len(resultados) >= limite:
+            return resultados
+
+        for posicao in self._trechos(termo, limite - len(resultados)):
+            resultados.append(ResultadoBusca(posicao, self.nomes[posicao], 'trecho', 0))
+        if len(resultados) >= limite:
+            return resultados
+
+        ja_encontrados = {resultado.posicao for resultado in resultados}
+        for posicao, distancia in self._aproximados(termo, ja_encontrados, limite - len(resultados)):
+            resultados.append(ResultadoBusca(posicao, self.nomes[posicao], 'aproximada', distancia))
+        return resultados
+
+
+def nomes_sinteticos(quantidade, semente=42):
+    """Nomes no estilo do portfólio (letra grega/hebraica + área + número)"""
+    letras = ['Alpha', 'Beta', 'Gamma', 'Delta', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Lambda',
+              'Mu', 'Nu', 'Pi', 'Rho', 'Sigma', 'Tau', 'Upsilon', 'Phi', 'Chi', 'Omega',
+              'Aleph', 'Beth', 'Dalet', 'He', 'Vav', 'Zayin', 'Kaf', 'Lamed', 'Mem', 'Samek',
+              'Ayin', 'Pe', 'Tsadi']
+    areas = ['Tech', 'Solutions', 'Systems', 'Devices', 'Sensors', 'Flow', 'Light', 'Waste', 'Power',
+             'Crops', 'Aqua', 'Traffic', 'Tracking', 'Irrigation', 'Parking', 'Air', 'Batt', 'Farm',
+             'Leak', 'Carbon', 'Volt', 'Grain', 'Safe', 'Ocean', 'Sun', 'Soil', 'Grid', 'Drone',
+             'Rain', 'Forest', 'Watt', 'Collar', 'Hydro']
+    rng = np.random.default_rng(semente)
+    i_letras = rng.integers(len(letras), size=quantidade)
+    i_areas = rng.integers(len(areas), size=quantidade)
+    return [f"{letras[a]}{areas[b]}{n}" for n, (a, b) in enumerate(zip(i_letras, i_areas))]
+
+
+def main():
+    """Compara o índice com LIKE '%termo%' (tamanho via: python busca_nomes.py 200000)"""
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    repeticoes = 20
+
+    print("=" * 80)
+    print(f"BENCHMARK DA BUSCA POR NOME - {quantidade} STARTUPS SINTÉTICAS")
+    print("=" * 80)
+
+    nomes = nomes_sinteticos(quantidade)
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE startups (id INTEGER PRIMARY KEY, nome_startup TEXT UNIQUE NOT NULL)')
+    conn.executemany('INSERT INTO startups (nome_startup) VALUES (?)', ((nome,) for nome in nomes))
+
+    inicio = time.perf_counter()
+    indice = IndiceNomes(nomes)
+    print(f"\n✓ Índice construído em {time.perf_counter() - inicio:.2f}s ({len(indice.faixas)} n-gramas)")
+
+    termos = ['chi', 'ChiLeak', 'leak', 'Grid1234', 'ayinwatt77', 'chilek', 'Lambdacrop', 'xyz']
+    print(f"\n{'termo':14s} | {'LIKE (ms)':>10s} {'linhas':>7s} | {'índice (ms)':>11s} {'resultados':>10s} | melhor")
+    print("-" * 80)
+    for termo in termos:
+        tempos_like, tempos_indice = [], []
+        for _ in range(repeticoes):
+            t = time.perf_counter()
+            linhas = conn.execute(
+                "SELECT nome_startup FROM startups WHERE nome_startup LIKE '%' || ? || '%' LIMIT ?",
+                (termo, LIMITE_RESULTADOS)
+            ).fetchall()
+            tempos_like.append(time.perf_counter() - t)
+            t = time.perf_counter()
+            resultados = indice.buscar(termo)
+            tempos_indice.append(time.perf_counter() - t)
+        melhor = f"{resultados[0].nome} ({resultados[0].tipo})" if resultados else '-'
+        print(f"{termo:14s} | {statistics.median(tempos_like) * 1000:10.3f} {len(linhas):7d} | "
+              f"{statistics.median(tempos_indice) * 1000:11.3f} {len(resultados):10d} | {melhor}")
+
+    conn.close()
+    print("\nTempos medianos de", repeticoes, "execuções; LIKE limitado aos mesmos", LIMITE_RESULTADOS, "resultados")
+
+
+if __name__ == "__main__":
+    main()
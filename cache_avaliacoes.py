@@ -0,0 +1,309 @@
+"""
+Cache Colunar da Planilha de Avaliações - TechNova IoT
+Guarda a aba 'Avaliacoes_Startups' já convertida em arquivos .npy (um por
+coluna) para evitar o parsing do Excel pelo openpyxl a cada execução
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from leitor_dados import ABA_AVALIACOES, TAMANHO_BLOCO_PADRAO, ler_em_blocos
+from utilitarios import gravar_json_atomico, hash_arquivo
+
+DIRETORIO_CACHE_PADRAO = '.cache_technova'
+VERSAO_FORMATO = 1
+
+
+def _diretorio_entrada(caminho, aba, dir_cache):
+    """Diretório do cache para um par (arquivo, aba)"""
+    chave = f"{Path(caminho).resolve()}::{aba}"
+    return Path(dir_cache) / hashlib.sha1(chave.encode('utf-8')).hexdigest()[:16]
+
+
+def _ler_meta(entrada):
+    """Lê o meta.json de uma entrada do cache (None se ausente ou inválido)"""
+    try:
+        with open(entrada / 'meta.json', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('versao') == VERSAO_FORMATO else None
+
+
+def _gravar_meta(entrada, meta):
+    """Grava o meta.json de forma atômica"""
+    gravar_json_atomico(entrada / 'meta.json', meta)
+
+
+def _coluna_para_array(serie):
+    """
+    Converte uma coluna em (array, máscara de nulos) para gravação em .npy
+
+    Colunas numéricas são gravadas no próprio dtype; colunas de texto
+    viram arrays unicode de largura fixa, que também podem ser mapeados
+    em memória. Colunas com tipos mistos não são suportadas.
+    """
+    if pd.api.types.is_numeric_dtype(serie.dtype) or pd.api.types.is_bool_dtype(serie.dtype):
+        return serie.to_numpy(), None
+
+    nulos = serie.isna().to_numpy()
+    valores = serie[~nulos]
+    if not all(isinstance(valor, str) for valor in valores):
+        raise ValueError(f"coluna '{serie.name}' tem tipos mistos")
+    texto = serie.where(~nulos, '').astype(str).to_numpy(dtype=str)
+    return texto, (nulos if nulos.any() else None)
+
+
+class _GravadorCache:
+    """
+    Grava uma entrada do cache à medida que os blocos da planilha passam
+
+    Cada coluna de cada bloco vai para um .npy temporário; ao concluir, as
+    partes de cada coluna são copiadas, uma de cada vez, para o col_XXX.npy
+    final (o tipo e a largura do texto só são conhecidos ao fim da leitura).
+    A memória usada fica limitada a um bloco.
+    """
+
+    def __init__(self, entrada, meta):
+        entrada.parent.mkdir(parents=True, exist_ok=True)
+        self.entrada = entrada
+        self.meta = meta
+        self.temporario = Path(tempfile.mkdtemp(prefix='.tmp_', dir=entrada.parent))
+        self.colunas = None
+        # Por bloco: (linhas, [(dtype, tem_nulos) de cada coluna])
+        self.partes = []
+        self.linhas = 0
+
+    def _parte(self, bloco, coluna, sufixo=''):
+        return self.temporario / f'parte_{bloco:05d}_{coluna:03d}{sufixo}.npy'
+
+    def gravar(self, df):
+        if self.colunas is None:
+            self.colunas = list(df.columns)
+        elif list(df.columns) != self.colunas:
+            raise ValueError("blocos da planilha com colunas diferentes")
+        bloco = len(self.partes)
+        tipos = []
+        for i, coluna in enumerate(self.colunas):
+            valores, nulos = _coluna_para_array(df[coluna])
+            np.save(self._parte(bloco, i), valores, allow_pickle=False)
+            if nulos is not None:
+                np.save(self._parte(bloco, i, '_nulos'), nulos, allow_pickle=False)
+            tipos.append((valores.dtype, nulos is not None))
+        self.partes.append((len(df), tipos))
+        self.linhas += len(df)
+
+    def _juntar_coluna(self, i, nome):
+        """Copia as partes da coluna `i` para o seu .npy final e devolve a descrição"""
+        tipos = [tipos_bloco[i] for _, tipos_bloco in self.partes]
+        textos = [dtype for dtype, _ in tipos if dtype.kind == 'U']
+        # Blocos sem nenhum valor numa coluna de texto chegam como float (NaN)
+        dtype = np.result_type(*textos) if textos else np.result_type(*[dtype for dtype, _ in tipos])
+        com_nulos = bool(textos) and any(nulos or dtype_parte.kind != 'U' for dtype_parte, nulos in tipos)
+
+        descricao = {'nome': nome, 'arquivo': f'col_{i:03d}.npy', 'texto': bool(textos)}
+        valores = np.lib.format.open_memmap(self.temporario / descricao['arquivo'], mode='w+',
+                                            dtype=dtype, shape=(self.linhas,))
+        nulos = None
+        if com_nulos:
+            descricao['nulos'] = f'nulos_{i:03d}.npy'
+            nulos = np.lib.format.open_memmap(self.temporario / descricao['nulos'], mode='w+',
+                                              dtype=bool, shape=(self.linhas,))
+        inicio = 0
+        for bloco, (linhas, _) in enumerate(self.partes):
+            fim = inicio + linhas
+            parte = np.load(self._parte(bloco, i), allow_pickle=False)
+            if textos and parte.dtype.kind != 'U':
+                if not np.isnan(parte.astype(float)).all():
+                    raise ValueError(f"coluna '{nome}' tem tipos mistos")
+                nulos[inicio:fim] = True
+            else:
+                valores[inicio:fim] = parte
+                if nulos is not None and tipos[bloco][1]:
+                    nulos[inicio:fim] = np.load(self._parte(bloco, i, '_nulos'), allow_pickle=False)
+            inicio = fim
+        valores.flush()
+        if nulos is not None:
+            nulos.flush()
+        return descricao
+
+    def concluir(self):
+        """Junta as colunas, grava o meta.json e move a entrada para o lugar definitivo"""
+        colunas = [self._juntar_coluna(i, nome) for i, nome in enumerate(self.colunas or [])]
+        for parte in self.temporario.glob('parte_*.npy'):
+            parte.unlink()
+        _gravar_meta(self.temporario, dict(self.meta, colunas=colunas, linhas=self.linhas))
+
+        if self.entrada.exists():
+            shutil.rmtree(self.entrada)
+        os.replace(self.temporario, self.entrada)
+
+    def descartar(self):
+        shutil.rmtree(self.temporario, ignore_errors=True)
+
+
+def _ler_gravando(caminho, aba, tamanho_bloco, entrada, meta):
+    """
+    Lê a planilha em blocos (ver leitor_dados.ler_em_blocos) gravando o
+    cache ao mesmo tempo
+
+    Cada bloco é gravado antes de ser entregue, já que quem o recebe pode
+    alterá-lo. O cache só passa a valer se a leitura chegar ao fim; falhas
+    ao gravá-lo não interrompem a leitura.
+    """
+    try:
+        gravador = _GravadorCache(entrada, meta)
+    except OSError as e:
+        print(f"⚠ Cache não gravado: {e}")
+        gravador = None
+    try:
+        for bloco in ler_em_blocos(caminho, aba, tamanho_bloco):
+            if gravador is not None:
+                try:
+                    gravador.gravar(bloco)
+                except (OSError, ValueError) as e:
+                    print(f"⚠ Cache não gravado: {e}")
+                    gravador.descartar()
+                    gravador = None
+            yield bloco
+        if gravador is not None:
+            try:
+                gravador.concluir()
+                print(f"✓ Cache atualizado: {entrada}")
+            except (OSError, ValueError) as e:
+                print(f"⚠ Cache não gravado: {e}")
+                gravador.descartar()
+            gravador = None
+    finally:
+        if gravador is not None:
+            gravador.descartar()
+
+
+def _abrir_colunas(entrada, meta):
+    """Mapeia em memória os .npy de cada coluna: (descrição, valores, nulos)"""
+    colunas = []
+    for descricao in meta['colunas']:
+        valores = np.load(entrada / descricao['arquivo'], mmap_mode='r', allow_pickle=False)
+        nulos = None
+        if 'nulos' in descricao:
+            nulos = np.load(entrada / descricao['nulos'], mmap_mode='r', allow_pickle=False)
+        colunas.append((descricao, valores, nulos))
+    return colunas
+
+
+def _montar_bloco(colunas, inicio, fim):
+    """DataFrame das linhas [inicio, fim) do cache (só essa fatia é lida do disco)"""
+    indice = pd.RangeIndex(inicio, fim)
+    dados = {}
+    for descricao, valores, nulos in colunas:
+        if descricao['texto']:
+            parte = valores[inicio:fim].astype(object)
+            if nulos is not None:
+                parte[nulos[inicio:fim]] = np.nan
+            dados[descricao['nome']] = pd.Series(parte, index=indice).infer_objects()
+        else:
+            dados[descricao['nome']] = np.array(valores[inicio:fim])
+    return pd.DataFrame(dados, index=indice)
+
+
+def _validar_entrada(caminho, aba, forcar_atualizacao, dir_cache):
+    """
+    Localiza a entrada do cache para (caminho, aba) e verifica se vale
+
+    A entrada é validada pelo mtime/tamanho do arquivo. Se esses mudarem,
+    o hash do conteúdo decide: conteúdo igual reaproveita o cache.
+
+    Returns:
+        (entrada, meta, válido); se não for válido, `meta` é o da entrada
+        a gravar (sem as colunas)
+    """
+    estado = os.stat(caminho)
+    entrada = _diretorio_entrada(caminho, aba, dir_cache)
+    meta = None if forcar_atualizacao else _ler_meta(entrada)
+
+    if meta is not None:
+        if meta['mtime_ns'] == estado.st_mtime_ns and meta['tamanho'] == estado.st_size:
+            print(f"✓ Cache válido: {entrada}")
+            return entrada, meta, True
+
+        hash_atual = hash_arquivo(caminho)
+        if hash_atual == meta['sha256']:
+            meta.update(mtime_ns=estado.st_mtime_ns, tamanho=estado.st_size)
+            _gravar_meta(entrada, meta)
+            print(f"✓ Cache válido (conteúdo inalterado): {entrada}")
+            return entrada, meta, True
+    else:
+        hash_atual = hash_arquivo(caminho)
+
+    meta = {
+        'versao': VERSAO_FORMATO,
+        'caminho': str(Path(caminho).resolve()),
+        'aba': aba,
+        'mtime_ns': estado.st_mtime_ns,
+        'tamanho': estado.st_size,
+        'sha256': hash_atual,
+    }
+    return entrada, meta, False
+
+
+def carregar_avaliacoes(caminho='Case_TechNova_Dados.xlsx', aba=ABA_AVALIACOES,
+                        forcar_atualizacao=False, dir_cache=DIRETORIO_CACHE_PADRAO):
+    """
+    Carrega a aba de avaliações inteira usando o cache colunar quando válido
+
+    Se o cache não vale (ver _validar_entrada), a planilha é lida em
+    blocos e o cache é regravado durante a leitura.
+
+    Args:
+        caminho: Caminho para o arquivo Excel (ou CSV)
+        aba: Nome da aba a carregar
+        forcar_atualizacao: Se True, ignora o cache e o regrava
+        dir_cache: Diretório onde o cache é mantido
+
+    Returns:
+        DataFrame com os dados da aba
+    """
+    entrada, meta, valido = _validar_entrada(caminho, aba, forcar_atualizacao, dir_cache)
+    if valido:
+        return _montar_bloco(_abrir_colunas(entrada, meta), 0, meta['linhas'])
+
+    blocos = list(_ler_gravando(caminho, aba, TAMANHO_BLOCO_PADRAO, entrada, meta))
+    if not blocos:
+        return pd.DataFrame()
+    return pd.concat(blocos, ignore_index=True)
+
+
+def blocos_avaliacoes(caminho='Case_TechNova_Dados.xlsx', aba=ABA_AVALIACOES,
+                      tamanho_bloco=TAMANHO_BLOCO_PADRAO, forcar_atualizacao=False,
+                      dir_cache=DIRETORIO_CACHE_PADRAO):
+    """
+    Percorre a aba de avaliações em blocos de até `tamanho_bloco` linhas
+
+    Com o cache válido, cada bloco é montado a partir das fatias dos .npy
+    mapeados em memória; caso contrário a planilha é lida em blocos e o
+    cache é gravado durante a leitura. Nos dois casos o pico de memória
+    depende do tamanho do bloco, não do total de linhas.
+    """
+    entrada, meta, valido = _validar_entrada(caminho, aba, forcar_atualizacao, dir_cache)
+    if not valido:
+        yield from _ler_gravando(caminho, aba, tamanho_bloco, entrada, meta)
+        return
+
+    colunas = _abrir_colunas(entrada, meta)
+    for inicio in range(0, meta['linhas'], tamanho_bloco):
+        yield _montar_bloco(colunas, inicio, min(inicio + tamanho_bloco, meta['linhas']))
+
+
+def limpar_cache(dir_cache=DIRETORIO_CACHE_PADRAO):
+    """Remove todo o diretório de cache"""
+    shutil.rmtree(dir_cache, ignore_errors=True)
@@ -0,0 +1,182 @@
+"""
+Cache de Consultas - TechNova IoT
+Cache LRU com TTL dos resultados de consultas (DataFrames e linhas),
+invalidado automaticamente quando o banco muda
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from utilitarios import versao_banco
+
+MAX_ENTRADAS_PADRAO = 256
+MAX_BYTES_PADRAO = 64 * 1024 * 1024
+# Segundos que um resultado pode ser reaproveitado mesmo sem mudança no
+# banco (limita o efeito de funções como CURRENT_TIMESTAMP e random())
+TTL_PADRAO = 300.0
+
+# Só consultas que começam com estas palavras têm o resultado guardado
+PALAVRAS_LEITURA = ('SELECT', 'WITH', 'VALUES')
+
+# Conexões cujo estado é acompanhado; acima disso (reconexões sucessivas)
+# o registro recomeça, o que apenas esvazia o cache mais uma vez
+MAX_CONEXOES_ACOMPANHADAS = 64
+
+
+def normalizar_sql(query):
+    """Texto da consulta sem diferenças de espaços e quebras de linha"""
+    return ' '.join(query.split())
+
+
+def _chave(query, params):
+    """Chave do cache: SQL normalizado + parâmetros (posicionais ou nomeados)"""
+    if not params:
+        return normalizar_sql(query), ()
+    if isinstance(params, dict):
+        return normalizar_sql(query), tuple(sorted(params.items()))
+    return normalizar_sql(query), tuple(params)
+
+
+def _tamanho(resultado):
+    """Bytes aproximados de um resultado (DataFrame ou tupla de valores)"""
+    if hasattr(resultado, 'memory_usage'):
+        return int(resultado.memory_usage(index=True, deep=True).sum())
+    if resultado is None:
+        return 0
+    return sum(len(valor) if isinstance(valor, (str, bytes)) else 8 for valor in resultado)
+
+
+def _copiar(resultado):
+    """DataFrames saem como cópia, para que quem altera o seu não altere o do cache"""
+    return resultado.copy() if hasattr(resultado, 'columns') else resultado
+
+
+class _Entrada:
+    """Resultado guardado, com o seu tamanho e o instante em que foi calculado"""
+
+    def __init__(self, resultado, tamanho):
+        self.resultado = resultado
+        self.tamanho = tamanho
+        self.criada = time.monotonic()
+
+
+class CacheConsultas:
+    """
+    Resultados de consultas por SQL normalizado + parâmetros
+
+    Antes de cada consulta, o estado do banco visto pela conexão da thread
+    (utilitarios.versao_banco) é comparado com o da consulta anterior nessa
+    mesma conexão: commits de outras conexões mudam o data_version e
+    escritas desta (inclusive as da importação, que atualizam
+    controle_alteracoes) mudam o total_changes. Qualquer mudança — ou uma
+    conexão ainda não vista, cujo estado anterior não se conhece — esvazia
+    o cache inteiro.
+
+    Consultas feitas com uma transação aberta não passam pelo cache: elas
+    enxergam escritas ainda não confirmadas, e um rollback as desfaz sem
+    mudar nenhum dos dois valores.
+
+    O cache guarda no máximo `max_entradas` resultados e `max_bytes` bytes,
+    descartando os usados há mais tempo, e cada resultado vale por até
+    `ttl` segundos. Pode ser compartilhado entre threads.
+    """
+
+    def __init__(self, max_entradas=MAX_ENTRADAS_PADRAO, max_bytes=MAX_BYTES_PADRAO, ttl=TTL_PADRAO):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entradas = OrderedDict()
+        self.bytes = 0
+        self.geracao = 0
+        # id(conn) → (conn, versão): a referência impede que o id seja reaproveitado
+        self.versoes = {}
+        self.trava = threading.Lock()
+        self.contadores = {'acertos': 0, 'faltas': 0, 'invalidacoes': 0, 'expiradas': 0, 'descartadas': 0}
+
+    def _verificar_banco(self, conn):
+        """Esvazia o cache se o banco mudou desde a última consulta nesta conexão"""
+        versao = versao_banco(conn)
+        with self.trava:
+            anterior = self.versoes.get(id(conn))
+            if anterior is None or anterior[1] != versao:
+                if anterior is None and len(self.versoes) >= MAX_CONEXOES_ACOMPANHADAS:
+                    self.versoes.clear()
+                self.versoes[id(conn)] = (conn, versao)
+                self._limpar()
+            return self.geracao
+
+    def _limpar(self):
+        if self.entradas:
+            self.contadores['invalidacoes'] += 1
+        self.entradas.clear()
+        self.bytes = 0
+        self.geracao += 1
+
+    def _descartar_excesso(self):
+        while self.entradas and (len(self.entradas) > self.max_entradas or self.bytes > self.max_bytes):
+            _, entrada = self.entradas.popitem(last=False)
+            self.bytes -= entrada.tamanho
+            self.contadores['descartadas'] += 1
+
+    def consultar(self, conn, query, params, executar):
+        """
+        Resultado de `query` com `params`, do cache ou de executar()
+
+        Args:
+            conn: Conexão em que a consulta roda (usada para detectar mudanças)
+            query: Texto SQL; só leituras (SELECT/WITH/VALUES) fora de uma
+                transação aberta são guardadas
+            params: Parâmetros da consulta (sequência, dicionário ou None)
+            executar: Função sem argumentos que roda a consulta de fato
+        """
+        if conn.in_transaction or not query.lstrip().upper().startswith(PALAVRAS_LEITURA):
+            return executar()
+        geracao = self._verificar_banco(conn)
+        chave = _chave(query, params)
+        with self.trava:
+            entrada = self.entradas.get(chave)
+            if entrada is not None:
+                if time.monotonic() - entrada.criada <= self.ttl:
+                    self.entradas.move_to_end(chave)
+                    self.contadores['acertos'] += 1
+                    return _copiar(entrada.resultado)
+                del self.entradas[chave]
+                self.bytes -= entrada.tamanho
+                self.contadores['expiradas'] += 1
+            self.contadores['faltas'] += 1
+
+        resultado = executar()
+        # A consulta pode ter escrito (ex.: SELECT com função que altera
+        # dados): só guarda se o banco continua no mesmo estado
+        if self._verificar_banco(conn) != geracao:
+            return resultado
+        entrada = _Entrada(_copiar(resultado), _tamanho(resultado))
+        with self.trava:
+            if self.geracao == geracao and entrada.tamanho <= self.max_bytes:
+                anterior = self.entradas.pop(chave, None)
+                if anterior is not None:
+                    self.bytes -= anterior.tamanho
+                self.entradas[chave] = entrada
+                self.bytes += entrada.tamanho
+                self._descartar_excesso()
+        return resultado
+
+    def limpar(self):
+        """Descarta todos os resultados guardados"""
+        with self.trava:
+            self._limpar()
+
+    def estatisticas(self):
+        """Acertos, faltas, taxa de acerto e ocupação do cache"""
+        with self.trava:
+            consultas = self.contadores['acertos'] + self.contadores['faltas']
+            return dict(
+                self.contadores,
+                taxa_acerto=self.contadores['acertos'] / consultas if consultas else 0.0,
+                entradas=len(self.entradas),
+                bytes=self.bytes,
+            )
@@ -7,13 +7,54 @@ Data: 2026-01-16
 """
 
 from criar_banco_dados import TechNovaDatabase
-import pandas as pd
+from instrumentacao import configurar_por_argumentos
 
-def exemplo_consultas():
+# Consultas SQL dos exemplos 5 a 8 (também cronometradas pelo benchmark_pipeline.py)
+CONSULTAS_EXEMPLO = {
+    'top_performance_tecnica': '''
+        SELECT s.nome_startup, s.setor, d.score as performance_tecnica
+        FROM startups s
+        JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        WHERE d.dimensao = 'Grupo 1 - Performance Técnica' AND s.status = 'Ativa'
+        ORDER BY d.score DESC
+        LIMIT 5
+    ''',
+    'comparacao_setores': '''
+        SELECT setor, 
+               ROUND(AVG(score_global), 2) as score_medio,
+               COUNT(*) as total_startups,
+               SUM(CASE WHEN status = 'Ativa' THEN 1 ELSE 0 END) as ativas
+        FROM startups
+        GROUP BY setor
+        ORDER BY score_medio DESC
+    ''',
+    'startups_equilibradas': '''
+        SELECT s.nome_startup, s.setor, s.score_global,
+               COUNT(d.id) as total_dimensoes,
+               SUM(CASE WHEN d.score > 3.5 THEN 1 ELSE 0 END) as dimensoes_acima_3_5
+        FROM startups s
+        JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        WHERE s.status = 'Ativa'
+        GROUP BY s.id
+        HAVING dimensoes_acima_3_5 = 8
+        ORDER BY s.score_global DESC
+    ''',
+    'risco_setor': '''
+        SELECT setor,
+               COUNT(*) as total,
+               SUM(CASE WHEN status = 'Inativa' THEN 1 ELSE 0 END) as inativas,
+               ROUND(100.0 * SUM(CASE WHEN status = 'Inativa' THEN 1 ELSE 0 END) / COUNT(*), 2) as percentual_risco
+        FROM startups
+        GROUP BY setor
+        ORDER BY percentual_risco DESC
+    ''',
+}
+
+def exemplo_consultas(db_path='technova_iot.db'):
     """Demonstra diferentes tipos de consultas ao banco de dados"""
     
     # Conectar ao banco
-    db = TechNovaDatabase('technova_iot.db')
+    db = TechNovaDatabase(db_path)
     db.conectar()
     
     print("=" * 80)
@@ -23,7 +64,7 @@ def exemplo_consultas():
     # 1. Listar todas as startups ativas
     print("\n1️⃣ TOP 10 STARTUPS ATIVAS (por Performance + Viabilidade)")
     print("-" * 80)
-    startups_ativas = db.listar_startups_ativas().head(10)
+    startups_ativas = db.listar_startups_ativas(limite=10)
     print(startups_ativas.to_string(index=False))
     
     # 2. Melhor startup
@@ -56,47 +97,19 @@ def exemplo_consultas():
     # 5. Query personalizada - Top 5 por dimensão específica
     print("\n5️⃣ TOP 5 STARTUPS EM PERFORMANCE TÉCNICA")
     print("-" * 80)
-    query = '''
-        SELECT s.nome_startup, s.setor, d.score as performance_tecnica
-        FROM startups s
-        JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
-        WHERE d.dimensao = 'Grupo 1 - Performance Técnica' AND s.status = 'Ativa'
-        ORDER BY d.score DESC
-        LIMIT 5
-    '''
-    top_performance = db.executar_query_personalizada(query)
+    top_performance = db.executar_query_personalizada(CONSULTAS_EXEMPLO['top_performance_tecnica'])
     print(top_performance.to_string(index=False))
     
     # 6. Comparação entre setores
     print("\n6️⃣ COMPARAÇÃO DE SCORES MÉDIOS POR SETOR")
     print("-" * 80)
-    query = '''
-        SELECT setor, 
-               ROUND(AVG(score_global), 2) as score_medio,
-               COUNT(*) as total_startups,
-               SUM(CASE WHEN status = 'Ativa' THEN 1 ELSE 0 END) as ativas
-        FROM startups
-        GROUP BY setor
-        ORDER BY score_medio DESC
-    '''
-    comparacao = db.executar_query_personalizada(query)
+    comparacao = db.executar_query_personalizada(CONSULTAS_EXEMPLO['comparacao_setores'])
     print(comparacao.to_string(index=False))
     
     # 7. Startups com melhor equilíbrio (todas dimensões acima de 3.5)
     print("\n7️⃣ STARTUPS COM EQUILÍBRIO (todas dimensões > 3.5)")
     print("-" * 80)
-    query = '''
-        SELECT s.nome_startup, s.setor, s.score_global,
-               COUNT(d.id) as total_dimensoes,
-               SUM(CASE WHEN d.score > 3.5 THEN 1 ELSE 0 END) as dimensoes_acima_3_5
-        FROM startups s
-        JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
-        WHERE s.status = 'Ativa'
-        GROUP BY s.id
-        HAVING dimensoes_acima_3_5 = 8
-        ORDER BY s.score_global DESC
-    '''
-    equilibradas = db.executar_query_personalizada(query)
+    equilibradas = db.executar_query_personalizada(CONSULTAS_EXEMPLO['startups_equilibradas'])
     if not equilibradas.empty:
         print(equilibradas.to_string(index=False))
     else:
@@ -105,16 +118,7 @@ def exemplo_consultas():
     # 8. Análise de risco por setor (baseado em startups inativas)
     print("\n8️⃣ ANÁLISE DE RISCO POR SETOR (% de Inativas)")
     print("-" * 80)
-    query = '''
-        SELECT setor,
-               COUNT(*) as total,
-               SUM(CASE WHEN status = 'Inativa' THEN 1 ELSE 0 END) as inativas,
-               ROUND(100.0 * SUM(CASE WHEN status = 'Inativa' THEN 1 ELSE 0 END) / COUNT(*), 2) as percentual_risco
-        FROM startups
-        GROUP BY setor
-        ORDER BY percentual_risco DESC
-    '''
-    risco = db.executar_query_personalizada(query)
+    risco = db.executar_query_personalizada(CONSULTAS_EXEMPLO['risco_setor'])
     print(risco.to_string(index=False))
     
     # 9. Detalhamento de uma startup específica
@@ -151,6 +155,17 @@ def exemplo_consultas():
     db.desconectar()
 
 
+def _mostrar_cache(db):
+    """Acertos e ocupação do cache de resultados do TechNovaDatabase"""
+    cache = db.estatisticas_cache()
+    if cache is None:
+        print("Cache de resultados desativado")
+        return
+    print(f"Cache de resultados: {cache['acertos']} acertos, {cache['faltas']} faltas "
+          f"(taxa de acerto {cache['taxa_acerto']:.0%}), {cache['entradas']} resultados "
+          f"em {cache['bytes'] / 1024:.1f} KB, {cache['invalidacoes']} invalidações")
+
+
 def consulta_interativa():
     """Permite ao usuário fazer consultas interativas"""
     db = TechNovaDatabase('technova_iot.db')
@@ -159,7 +174,7 @@ def consulta_interativa():
     print("\n" + "=" * 80)
     print("MODO INTERATIVO - CONSULTA SQL")
     print("=" * 80)
-    print("Digite suas queries SQL ou 'sair' para encerrar")
+    print("Digite suas queries SQL, 'cache' para ver o cache de resultados ou 'sair' para encerrar")
     print("Exemplo: SELECT * FROM startups WHERE setor = 'Saúde' LIMIT 5")
     print("-" * 80)
     
@@ -172,17 +187,25 @@ def consulta_interativa():
         if not query:
             continue
         
+        if query.lower() == 'cache':
+            _mostrar_cache(db)
+            continue
+        
         try:
             resultado = db.executar_query_personalizada(query)
             print("\n" + resultado.to_string(index=False))
         except Exception as e:
             print(f"✗ Erro: {e}")
     
+    _mostrar_cache(db)
     db.desconectar()
     print("\n✓ Sessão encerrada")
 
 
 if __name__ == "__main__":
+    # --trace ARQUIVO, --tempos, --tracemalloc e --perfil DIR (ver instrumentacao.py)
+    configurar_por_argumentos()
+    
     # Executar exemplos de consultas
     exemplo_consultas()
     
@@ -6,42 +6,289 @@ Autor: Sistema TechNova
 Data: 2026-01-16
 """
 
-import pandas as pd
+import hashlib
 import sqlite3
 from pathlib import Path
 import sys
+import threading
+import time
 
+# pandas e o cache colunar são importados só nos métodos que os usam:
+# abrir o banco e consultas que devolvem tuplas dependem apenas do sqlite3
+from cache_consultas import CacheConsultas
+from instrumentacao import configurar_por_argumentos, instrumentar_metodos, medir_iteracao, secao
+from leitor_dados import TAMANHO_BLOCO_PADRAO, ler_em_blocos
+from motor_estatisticas import calcular_estatisticas, carregar_estatisticas
+from motor_scores import agrupar_dimensoes, aplicar_scores, identificar_colunas_notas
+from notas_compactas import (ESQUEMA_COMPACTO, SQL_VISAO_DETALHADA, TABELA_CRITERIOS, TABELA_NOTAS,
+                             empacotar_notas, notas_gravadas, sql_nota,
+                             usa_armazenamento_compacto)
+from pool_conexoes import TAMANHO_POOL_PADRAO, PoolConexoes
+from posicoes_ranking import ESQUEMA_POSICOES, SQL_GRAVAR_POSICOES, TABELA_POSICOES
+from utilitarios import versao_banco
+
+# Colunas adicionadas à tabela startups após a versão inicial do esquema
+COLUNAS_RASTREAMENTO = {
+    'id_origem': 'INTEGER',
+    'data_avaliacao': 'TEXT',
+    'hash_conteudo': 'TEXT',
+}
+
+
+# Tabela larga materializada: uma linha por startup, uma coluna por
+# dimensão e por critério (evita o pivot sobre avaliacoes_dimensoes)
+TABELA_LARGA = 'startups_completo'
+COLUNAS_DIMENSOES = {
+    'Grupo 1 - Performance Técnica': 'performance_tecnica',
+    'Grupo 2 - Viabilidade Econômica': 'viabilidade_economica',
+    'Grupo 3 - Confiabilidade': 'confiabilidade',
+    'Grupo 4 - Usabilidade': 'usabilidade',
+    'Grupo 5 - Eficiência Energética': 'eficiencia_energetica',
+    'Grupo 6 - Robustez Física': 'robustez_fisica',
+    'Grupo 7 - Conectividade': 'conectividade',
+    'Grupo 8 - Sustentabilidade': 'sustentabilidade',
+}
+COLUNAS_BASE_LARGA = ['id', 'nome_startup', 'setor', 'status', 'score_global', 'score_performance_viabilidade']
+
+# Tabelas cujas alterações são registradas em controle_alteracoes
+# (usado pela exportação incremental para o Power BI)
+TABELAS_VERSIONADAS = ['startups', 'avaliacoes_dimensoes', 'avaliacoes_detalhadas',
+                       'estatisticas_setor', TABELA_LARGA, TABELA_POSICOES]
+
+# Identificador aleatório gravado em controle_alteracoes.geracao
+SQL_NOVA_GERACAO = 'lower(hex(randomblob(8)))'
+
+# PRAGMAs aplicados a cada conexão: WAL permite leitores simultâneos a
+# uma escrita, e cache/mmap maiores reduzem leituras de disco
+PRAGMAS_CONEXAO = [
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA temp_store = MEMORY',
+]
+
+# Índices secundários para os caminhos de acesso das consultas frequentes
+INDICES = {
+    # listar_startups_ativas, obter_melhor_startup, ranking e top N
+    'idx_startups_status_pv': '''
+        CREATE INDEX IF NOT EXISTS idx_startups_status_pv
+        ON startups (status, score_performance_viabilidade DESC, nome_startup, setor, score_global)
+    ''',
+    # listar_startups_por_setor e agregações por setor/status
+    'idx_startups_setor_global': '''
+        CREATE INDEX IF NOT EXISTS idx_startups_setor_global
+        ON startups (setor, score_global DESC, status, score_performance_viabilidade, nome_startup)
+    ''',
+    # Top N de uma dimensão específica
+    'idx_dimensoes_dimensao_score': '''
+        CREATE INDEX IF NOT EXISTS idx_dimensoes_dimensao_score
+        ON avaliacoes_dimensoes (dimensao, score DESC, startup_id)
+    ''',
+    # Junções por startup_id (pivot largo e detalhes) sem acessar a tabela
+    'idx_dimensoes_startup': '''
+        CREATE INDEX IF NOT EXISTS idx_dimensoes_startup
+        ON avaliacoes_dimensoes (startup_id, dimensao, score)
+    ''',
+    'idx_detalhadas_startup': '''
+        CREATE INDEX IF NOT EXISTS idx_detalhadas_startup
+        ON avaliacoes_detalhadas (startup_id, score DESC, criterio)
+    ''',
+}
+
+# Índices sobre avaliacoes_detalhadas, que no modo compacto é uma visão
+INDICES_SO_MODO_NORMALIZADO = {'idx_detalhadas_startup'}
+
+# Consultas de referência usadas no relatório de planos de execução
+CONSULTAS_REFERENCIA = {
+    'listar_startups_ativas': '''
+        SELECT nome_startup, setor, score_global, score_performance_viabilidade
+        FROM startups
+        WHERE status = 'Ativa'
+        ORDER BY score_performance_viabilidade DESC
+    ''',
+    'listar_startups_por_setor': '''
+        SELECT nome_startup, status, score_global, score_performance_viabilidade
+        FROM startups
+        WHERE setor = 'Agri-IoT'
+        ORDER BY score_global DESC
+    ''',
+    'obter_melhor_startup': '''
+        SELECT s.nome_startup, s.setor, s.score_global, s.score_performance_viabilidade,
+               GROUP_CONCAT(d.dimensao || ': ' || ROUND(d.score, 2), '\n') as dimensoes
+        FROM startups s
+        LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        WHERE s.status = 'Ativa'
+        GROUP BY s.id
+        ORDER BY s.score_performance_viabilidade DESC
+        LIMIT 1
+    ''',
+    'top_performance_tecnica': '''
+        SELECT s.nome_startup, s.setor, d.score as performance_tecnica
+        FROM startups s
+        JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        WHERE d.dimensao = 'Grupo 1 - Performance Técnica' AND s.status = 'Ativa'
+        ORDER BY d.score DESC
+        LIMIT 5
+    ''',
+    'pivot_startups_completo': '''
+        SELECT s.id, s.nome_startup,
+               MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
+               MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica
+        FROM startups s
+        LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        GROUP BY s.id, s.nome_startup
+    ''',
+    'tabela_larga': '''
+        SELECT id, nome_startup, performance_tecnica, viabilidade_economica
+        FROM startups_completo
+    ''',
+    'criterios_da_startup': '''
+        SELECT a.criterio, a.score
+        FROM avaliacoes_detalhadas a
+        JOIN startups s ON a.startup_id = s.id
+        WHERE s.nome_startup = 'AlphaTech'
+        ORDER BY a.score DESC
+    ''',
+}
+
+
+def calcular_hashes(df, colunas_notas):
+    """
+    Calcula um hash de conteúdo por linha da planilha
+    
+    O hash cobre nome, setor, status, data da avaliação e todas as notas,
+    e é usado pela importação incremental para detectar mudanças.
+    """
+    campos = ['nome_startup', 'setor', 'status', 'data_avaliacao']
+    textos = df[[col for col in campos if col in df.columns]].astype(str).to_numpy().tolist()
+    notas = df[colunas_notas].to_numpy(dtype=float).tolist()
+    return [
+        hashlib.sha1('\x1f'.join(texto + [repr(nota) for nota in linha]).encode('utf-8')).hexdigest()
+        for texto, linha in zip(textos, notas)
+    ]
+
+
+def _citar(identificador):
+    """Cita um identificador SQL (nomes de critérios como '1.1_precisao_basica')"""
+    return '"' + identificador.replace('"', '""') + '"'
+
+
+def _ler_sql(conn, query, params=None):
+    """Executa a consulta e devolve um DataFrame (importa o pandas na primeira chamada)"""
+    import pandas as pd
+    if params:
+        return pd.read_sql_query(query, conn, params=params)
+    return pd.read_sql_query(query, conn)
+
+
+def _ler_linha(conn, query, params=None):
+    """Executa a consulta e devolve a primeira linha (tupla) ou None"""
+    return conn.execute(query, params or ()).fetchone()
+
+
+def _valores_origem(df):
+    """Retorna listas (id_startup, data_avaliacao) da planilha, com None se ausentes"""
+    import pandas as pd
+    n = len(df)
+    ids = [int(v) if pd.notna(v) else None for v in df['id_startup']] if 'id_startup' in df else [None] * n
+    datas = [str(v) if pd.notna(v) else None for v in df['data_avaliacao']] if 'data_avaliacao' in df else [None] * n
+    return ids, datas
+
+
+@instrumentar_metodos('banco')
 class TechNovaDatabase:
     """Classe para gerenciar o banco de dados TechNova"""
     
-    def __init__(self, db_path='technova_iot.db'):
+    def __init__(self, db_path='technova_iot.db', aplicar_pragmas=True, armazenamento_compacto=False,
+                 somente_leitura=False, max_conexoes=TAMANHO_POOL_PADRAO, cache_resultados=True):
         """
         Inicializa conexão com o banco de dados
         
         Args:
             db_path: Caminho para o arquivo do banco de dados SQLite
+            aplicar_pragmas: Se True, aplica PRAGMAS_CONEXAO ao conectar
+            armazenamento_compacto: Se True, as notas dos critérios são
+                gravadas como um BLOB de um byte por critério (ver
+                notas_compactas); bancos já compactos são detectados ao conectar
+            somente_leitura: Se True, abre as conexões com URI mode=ro
+                (consultas e exportações; qualquer escrita falha)
+            max_conexoes: Máximo de conexões abertas ao mesmo tempo, uma por
+                thread que usa o objeto (ver pool_conexoes)
+            cache_resultados: Se True, os relatórios e as consultas
+                personalizadas reaproveitam resultados enquanto o banco não
+                muda (ver cache_consultas)
         """
         self.db_path = db_path
-        self.conn = None
-        self.cursor = None
+        self.aplicar_pragmas = aplicar_pragmas
+        self.compacto = armazenamento_compacto
+        self.somente_leitura = somente_leitura
+        self.max_conexoes = max_conexoes
+        self.pool = None
+        self._cursores = threading.local()
+        self.cache = CacheConsultas() if cache_resultados else None
+        # Estatísticas por setor mantidas em memória entre importações
+        # incrementais, com a versão do banco em que foram carregadas
+        self.estatisticas = None
+        self.versao_estatisticas = None
+    
+    @property
+    def conn(self):
+        """Conexão da thread atual, obtida do pool no primeiro uso (None antes de conectar)"""
+        return self.pool.obter() if self.pool is not None else None
+    
+    @property
+    def cursor(self):
+        """Cursor próprio da thread atual sobre a sua conexão"""
+        conn = self.conn
+        local = self._cursores
+        if conn is not None and getattr(local, 'conn', None) is not conn:
+            local.conn, local.cursor = conn, conn.cursor()
+        return local.cursor if conn is not None else None
     
     def conectar(self):
-        """Estabelece conexão com o banco de dados"""
+        """
+        Estabelece conexão com o banco de dados
+        
+        Cria o pool de conexões e já abre uma conexão, para que um arquivo
+        inexistente ou inválido seja informado aqui; ela volta ao pool em
+        seguida. Cada thread recebe a sua no primeiro uso de `conn`/`cursor`.
+        """
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
+            if self.pool is None or self.pool.fechado:
+                pragmas = PRAGMAS_CONEXAO if self.aplicar_pragmas else ()
+                self.pool = PoolConexoes(self.db_path, self.max_conexoes, self.somente_leitura, pragmas)
+            with self.pool.conexao() as conn:
+                self.compacto = self.compacto or usa_armazenamento_compacto(conn)
             print(f"✓ Conectado ao banco de dados: {self.db_path}")
             return True
         except Exception as e:
+            if self.pool is not None:
+                self.pool.fechar()
+                self.pool = None
             print(f"✗ Erro ao conectar ao banco: {e}")
             return False
     
     def desconectar(self):
-        """Fecha conexão com o banco de dados"""
-        if self.conn:
-            self.conn.close()
+        """Fecha todas as conexões do banco de dados"""
+        if self.pool is not None and not self.pool.fechado:
+            self.pool.fechar()
             print("✓ Conexão fechada")
     
+    def liberar_conexao(self):
+        """Devolve ao pool a conexão da thread atual (ex.: ao fim de uma tarefa em outra thread)"""
+        if self.pool is not None:
+            self.pool.liberar()
+    
+    def __enter__(self):
+        if (self.pool is None or self.pool.fechado) and not self.conectar():
+            raise sqlite3.OperationalError(f"não foi possível conectar a {self.db_path}")
+        return self
+    
+    def __exit__(self, tipo, valor, rastreamento):
+        self.desconectar()
+        return False
+    
     def criar_tabelas(self):
         """Cria as tabelas do banco de dados"""
         print("\n" + "=" * 80)
@@ -57,9 +304,13 @@ class TechNovaDatabase:
                 status TEXT NOT NULL CHECK(status IN ('Ativa', 'Inativa')),
                 score_global REAL,
                 score_performance_viabilidade REAL,
-                data_cadastro TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                data_cadastro TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                id_origem INTEGER,
+                data_avaliacao TEXT,
+                hash_conteudo TEXT
             )
         ''')
+        self._migrar_esquema()
         print("✓ Tabela 'startups' criada")
         
         # Tabela de Avaliações por Dimensão
@@ -75,18 +326,27 @@ class TechNovaDatabase:
         ''')
         print("✓ Tabela 'avaliacoes_dimensoes' criada")
         
-        # Tabela de Avaliações Detalhadas (todas as colunas de notas)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS avaliacoes_detalhadas (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                startup_id INTEGER NOT NULL,
-                criterio TEXT NOT NULL,
-                score REAL NOT NULL,
-                FOREIGN KEY (startup_id) REFERENCES startups(id),
-                UNIQUE(startup_id, criterio)
-            )
-        ''')
-        print("✓ Tabela 'avaliacoes_detalhadas' criada")
+        # Tabela de Avaliações Detalhadas (todas as colunas de notas); no
+        # modo compacto, visão sobre as notas empacotadas por startup
+        if self.compacto:
+            if self._tipo_objeto('avaliacoes_detalhadas') == 'table':
+                self.compactar_avaliacoes()
+            else:
+                self._criar_esquema_compacto()
+            print(f"✓ Tabelas '{TABELA_CRITERIOS}' e '{TABELA_NOTAS}' criadas")
+            print("✓ Visão 'avaliacoes_detalhadas' criada")
+        else:
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS avaliacoes_detalhadas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    startup_id INTEGER NOT NULL,
+                    criterio TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    FOREIGN KEY (startup_id) REFERENCES startups(id),
+                    UNIQUE(startup_id, criterio)
+                )
+            ''')
+            print("✓ Tabela 'avaliacoes_detalhadas' criada")
         
         # Tabela de Estatísticas por Setor
         self.cursor.execute('''
@@ -105,15 +365,436 @@ class TechNovaDatabase:
         ''')
         print("✓ Tabela 'estatisticas_setor' criada")
         
+        # Posições no ranking, recalculadas a cada importação; bancos que já
+        # tinham startups recebem as posições delas agora
+        nova = self._tipo_objeto(TABELA_POSICOES) is None
+        for sql in ESQUEMA_POSICOES:
+            self.cursor.execute(sql)
+        print(f"✓ Tabela '{TABELA_POSICOES}' criada")
+        
+        self.criar_gatilhos_versao()
         self.conn.commit()
+        if nova:
+            self.cursor.execute('SELECT EXISTS (SELECT 1 FROM startups)')
+            if self.cursor.fetchone()[0]:
+                self.reconstruir_posicoes()
         print("\n✓ Estrutura do banco de dados criada com sucesso!")
     
-    def importar_dados_excel(self, excel_path='Case_TechNova_Dados.xlsx'):
+    def _migrar_esquema(self):
+        """
+        Adiciona à tabela startups as colunas de rastreamento ausentes e
+        cria a tabela controle_alteracoes (bancos antigos)
+        """
+        self.cursor.execute('PRAGMA table_info(startups)')
+        existentes = {linha[1] for linha in self.cursor.fetchall()}
+        for coluna, tipo in COLUNAS_RASTREAMENTO.items():
+            if coluna not in existentes:
+                self.cursor.execute(f'ALTER TABLE startups ADD COLUMN {coluna} {tipo}')
+        
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS controle_alteracoes (
+                tabela TEXT PRIMARY KEY,
+                versao INTEGER NOT NULL DEFAULT 0,
+                ultima_alteracao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                geracao TEXT
+            )
+        ''')
+        if 'geracao' not in self._colunas_existentes('controle_alteracoes'):
+            self.cursor.execute('ALTER TABLE controle_alteracoes ADD COLUMN geracao TEXT')
+            self.cursor.execute(f'UPDATE controle_alteracoes SET geracao = {SQL_NOVA_GERACAO}')
+    
+    def _tipo_objeto(self, nome):
+        """Tipo do objeto no sqlite_master ('table', 'view', ...) ou None se não existir"""
+        linha = self.conn.execute('SELECT type FROM sqlite_master WHERE name = ?', (nome,)).fetchone()
+        return linha[0] if linha else None
+    
+    def _criar_esquema_compacto(self):
+        """Cria as tabelas criterios e notas_compactas e a visão avaliacoes_detalhadas"""
+        for sql in ESQUEMA_COMPACTO + [SQL_VISAO_DETALHADA]:
+            self.cursor.execute(sql)
+    
+    def compactar_avaliacoes(self):
+        """
+        Converte a tabela avaliacoes_detalhadas de um banco existente para o
+        modo compacto
+        
+        Os critérios recebem ids na ordem em que foram gravados, as notas
+        de cada startup viram um BLOB em notas_compactas e a tabela dá lugar
+        à visão de mesmo nome. O arquivo é reescrito com VACUUM ao final.
+        
+        Returns:
+            True se a conversão foi concluída
+        """
+        self.cursor.execute('SELECT criterio FROM avaliacoes_detalhadas GROUP BY criterio ORDER BY MIN(id)')
+        criterios = [linha[0] for linha in self.cursor.fetchall()]
+        posicao_criterio = {criterio: i for i, criterio in enumerate(criterios)}
+        self.cursor.execute('SELECT startup_id, criterio, score FROM avaliacoes_detalhadas ORDER BY startup_id')
+        notas_por_startup = {}
+        for startup_id, criterio, score in self.cursor.fetchall():
+            notas = notas_por_startup.setdefault(startup_id, [float('nan')] * len(criterios))
+            notas[posicao_criterio[criterio]] = score
+        tinha_gatilhos = self._tipo_objeto(f'trg_{TABELA_LARGA}_startup_ins') == 'trigger'
+        
+        if not self.conn.in_transaction:
+            self.cursor.execute('BEGIN')
+        try:
+            for sql in ESQUEMA_COMPACTO:
+                self.cursor.execute(sql)
+            self.cursor.executemany(f'INSERT INTO {TABELA_CRITERIOS} (id, nome) VALUES (?, ?)',
+                                    [(i + 1, criterio) for i, criterio in enumerate(criterios)])
+            blobs = empacotar_notas(list(notas_por_startup.values()), list(range(len(criterios))),
+                                    len(criterios)) if notas_por_startup else []
+            self.cursor.executemany(f'INSERT INTO {TABELA_NOTAS} (startup_id, notas) VALUES (?, ?)',
+                                    zip(notas_por_startup, blobs))
+            # Remove também o índice e os triggers da tabela larga sobre ela
+            self.cursor.execute('DROP TABLE avaliacoes_detalhadas')
+            self.cursor.execute(SQL_VISAO_DETALHADA)
+            self.criar_gatilhos_versao()
+            self.registrar_alteracao(['avaliacoes_detalhadas'])
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            print(f"✗ Erro ao compactar as avaliações detalhadas (banco inalterado): {e}")
+            return False
+        
+        self.compacto = True
+        if tinha_gatilhos:
+            self.criar_gatilhos_tabela_larga()
+        self.cursor.execute('VACUUM')
+        print(f"✓ {len(notas_por_startup)} startups x {len(criterios)} critérios convertidos para o modo compacto")
+        return True
+    
+    def registrar_alteracao(self, tabelas):
+        """
+        Incrementa a versão das tabelas alteradas em controle_alteracoes
+        
+        Deve ser chamado dentro da mesma transação que altera os dados.
+        Atualizações que não mudam a contagem de linhas nem o maior id só
+        são percebidas pela exportação incremental através dessa versão.
+        A primeira alteração de cada tabela sorteia a sua geração, que
+        distingue um banco recriado (mesmas contagens e versões) do anterior.
+        """
+        self.cursor.executemany(f'''
+            INSERT INTO controle_alteracoes (tabela, versao, geracao) VALUES (?, 1, {SQL_NOVA_GERACAO})
+            ON CONFLICT(tabela) DO UPDATE SET
+                versao = versao + 1,
+                ultima_alteracao = CURRENT_TIMESTAMP
+        ''', [(tabela,) for tabela in tabelas])
+    
+    def criar_gatilhos_versao(self):
+        """
+        Cria triggers que incrementam a versão em controle_alteracoes a cada
+        UPDATE ou DELETE nas tabelas versionadas
+        
+        Assim escritas feitas fora do importador (SQL manual ou os triggers
+        da tabela larga) também são vistas pela exportação incremental,
+        mesmo quando não mudam a contagem de linhas nem o maior id; inserções
+        já mudam esses valores. No modo compacto os triggers ficam em
+        notas_compactas (inclusive para INSERT, já que o marcador da visão
+        avaliacoes_detalhadas é só a versão). A tabela de posições, apagada
+        e regravada inteira pelo importador a cada escrita, fica de fora para
+        não perder o DELETE sem WHERE otimizado do SQLite.
+        """
+        for tabela in TABELAS_VERSIONADAS:
+            fisica, eventos = tabela, ('UPDATE', 'DELETE')
+            if tabela == 'avaliacoes_detalhadas' and self._tipo_objeto(tabela) == 'view':
+                fisica, eventos = TABELA_NOTAS, ('INSERT', 'UPDATE', 'DELETE')
+            if tabela == TABELA_POSICOES or self._tipo_objeto(fisica) != 'table':
+                continue
+            for evento in eventos:
+                self.cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS trg_versao_{fisica}_{evento.lower()[:3]}
+                    AFTER {evento} ON {fisica} BEGIN
+                        INSERT INTO controle_alteracoes (tabela, versao, geracao)
+                        VALUES ('{tabela}', 1, {SQL_NOVA_GERACAO})
+                        ON CONFLICT(tabela) DO UPDATE SET
+                            versao = versao + 1,
+                            ultima_alteracao = CURRENT_TIMESTAMP;
+                    END
+                ''')
+    
+    def otimizar_esquema(self):
+        """
+        Cria os índices secundários (INDICES) e atualiza as estatísticas
+        do otimizador com ANALYZE
+        
+        É chamado ao fim de cada importação: criar os índices depois da
+        carga é mais rápido do que mantê-los a cada INSERT.
+        """
+        indices = [sql for nome, sql in INDICES.items()
+                   if not (self.compacto and nome in INDICES_SO_MODO_NORMALIZADO)]
+        for sql in indices:
+            self.cursor.execute(sql)
+        self.cursor.execute('ANALYZE')
+        self.conn.commit()
+        print(f"✓ {len(indices)} índices verificados e estatísticas atualizadas (ANALYZE)")
+    
+    def planos_consultas(self, conn=None):
+        """Retorna o EXPLAIN QUERY PLAN de cada consulta de CONSULTAS_REFERENCIA"""
+        conn = conn or self.conn
+        planos = {}
+        for nome, sql in CONSULTAS_REFERENCIA.items():
+            try:
+                linhas = conn.execute(f'EXPLAIN QUERY PLAN {sql}').fetchall()
+                planos[nome] = [linha[-1] for linha in linhas]
+            except sqlite3.OperationalError as e:
+                planos[nome] = [f'indisponível ({e})']
+        return planos
+    
+    def relatorio_planos_consultas(self):
+        """
+        Compara os planos de execução sem e com os índices de INDICES
+        
+        O cenário "antes" é montado em uma cópia em memória do banco, da
+        qual os índices de INDICES são removidos; o banco real não muda.
+        
+        Returns:
+            Dicionário {consulta: (plano_antes, plano_depois)}, ou None se
+            houver uma transação aberta na conexão
+        """
+        if self.conn.in_transaction:
+            print("✗ Há uma transação aberta: faça commit antes de gerar o relatório de planos")
+            return None
+        
+        copia = sqlite3.connect(':memory:')
+        try:
+            self.conn.backup(copia)
+            for nome in INDICES:
+                copia.execute(f'DROP INDEX IF EXISTS {nome}')
+            copia.execute('ANALYZE')
+            antes = self.planos_consultas(copia)
+        finally:
+            copia.close()
+        depois = self.planos_consultas()
+        
+        print("\n" + "=" * 80)
+        print("PLANOS DE EXECUÇÃO - ANTES x DEPOIS DOS ÍNDICES")
+        print("=" * 80)
+        for nome in CONSULTAS_REFERENCIA:
+            print(f"\n🔎 {nome}")
+            print("   antes : " + " | ".join(antes[nome]))
+            print("   depois: " + " | ".join(depois[nome]))
+        
+        return {nome: (antes[nome], depois[nome]) for nome in CONSULTAS_REFERENCIA}
+    
+    def _colunas_existentes(self, tabela):
+        """Lista as colunas de uma tabela (vazia se a tabela não existir)"""
+        self.cursor.execute(f'PRAGMA table_info({tabela})')
+        return [linha[1] for linha in self.cursor.fetchall()]
+    
+    def _garantir_tabela_larga(self, colunas_notas):
+        """
+        Cria a tabela larga (TABELA_LARGA) ou adiciona critérios novos
+        
+        Returns:
+            True se a tabela foi criada agora
+        """
+        existentes = self._colunas_existentes(TABELA_LARGA)
+        if not existentes:
+            colunas = [
+                'id INTEGER PRIMARY KEY REFERENCES startups(id)',
+                'nome_startup TEXT NOT NULL',
+                'setor TEXT NOT NULL',
+                'status TEXT NOT NULL',
+                'score_global REAL',
+                'score_performance_viabilidade REAL',
+            ]
+            colunas += [f'{coluna} REAL' for coluna in COLUNAS_DIMENSOES.values()]
+            colunas += [f'{_citar(criterio)} REAL' for criterio in colunas_notas]
+            self.cursor.execute(f"CREATE TABLE {TABELA_LARGA} ({', '.join(colunas)})")
+            self.cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{TABELA_LARGA}_status_pv '
+                f'ON {TABELA_LARGA} (status, score_performance_viabilidade DESC)'
+            )
+            self.criar_gatilhos_versao()
+            return True
+        
+        for criterio in colunas_notas:
+            if criterio not in existentes:
+                self.cursor.execute(f'ALTER TABLE {TABELA_LARGA} ADD COLUMN {_citar(criterio)} REAL')
+        return False
+    
+    def _gravar_tabela_larga(self, ids, df, colunas_notas):
+        """Grava (ou substitui) as linhas largas das startups de um bloco"""
+        colunas = (COLUNAS_BASE_LARGA + list(COLUNAS_DIMENSOES.values()) + list(colunas_notas))
+        valores = [
+            ids,
+            df['nome_startup'].tolist(),
+            df['setor'].tolist(),
+            df['status'].tolist(),
+            df['Score_Global'].astype(float).tolist(),
+            df['Score_Performance_Viabilidade'].astype(float).tolist(),
+        ]
+        valores += [df[dimensao].astype(float).tolist() for dimensao in COLUNAS_DIMENSOES]
+        valores += [df[criterio].astype(float).tolist() for criterio in colunas_notas]
+        
+        marcadores = ', '.join('?' * len(colunas))
+        self.cursor.executemany(
+            f"INSERT OR REPLACE INTO {TABELA_LARGA} ({', '.join(_citar(c) for c in colunas)}) "
+            f"VALUES ({marcadores})",
+            list(zip(*valores))
+        )
+    
+    def reconstruir_tabela_larga(self, commit=True):
+        """
+        Reconstrói a tabela larga a partir das tabelas normalizadas
+        
+        Usado para bancos que já tinham dados antes da tabela larga existir;
+        é o único ponto em que o pivot sobre as tabelas de avaliação roda.
+        
+        Args:
+            commit: Se False, deixa a reconstrução na transação em aberto
+                (ex.: a da importação incremental, que faz o commit ou o
+                rollback de tudo junto)
+        """
+        if self.compacto:
+            self.cursor.execute(f'SELECT nome, id FROM {TABELA_CRITERIOS} ORDER BY nome')
+            ids_criterios = self.cursor.fetchall()
+            criterios = [nome for nome, _ in ids_criterios]
+            pivot_criterios = ''.join(f",\n{sql_nota('n.notas', criterio_id)}" for _, criterio_id in ids_criterios)
+            juncao = f'LEFT JOIN {TABELA_NOTAS} n ON n.startup_id = s.id'
+            parametros = []
+        else:
+            self.cursor.execute('SELECT DISTINCT criterio FROM avaliacoes_detalhadas ORDER BY criterio')
+            criterios = [linha[0] for linha in self.cursor.fetchall()]
+            pivot_criterios = ''.join(
+                ",\n(SELECT a.score FROM avaliacoes_detalhadas a WHERE a.startup_id = s.id AND a.criterio = ?)"
+                for _ in criterios
+            )
+            juncao = ''
+            parametros = criterios
+        self._garantir_tabela_larga(criterios)
+        
+        pivot_dimensoes = ',\n'.join(
+            f"(SELECT d.score FROM avaliacoes_dimensoes d WHERE d.startup_id = s.id AND d.dimensao = '{dimensao}')"
+            for dimensao in COLUNAS_DIMENSOES
+        )
+        colunas = COLUNAS_BASE_LARGA + list(COLUNAS_DIMENSOES.values()) + criterios
+        self.cursor.execute(f'DELETE FROM {TABELA_LARGA}')
+        self.cursor.execute(f'''
+            INSERT INTO {TABELA_LARGA} ({', '.join(_citar(c) for c in colunas)})
+            SELECT s.id, s.nome_startup, s.setor, s.status, s.score_global, s.score_performance_viabilidade,
+            {pivot_dimensoes}{pivot_criterios}
+            FROM startups s {juncao}
+        ''', parametros)
+        self.registrar_alteracao([TABELA_LARGA])
+        if commit:
+            self.conn.commit()
+        print(f"✓ Tabela '{TABELA_LARGA}' reconstruída")
+    
+    def _gravar_posicoes(self):
+        """
+        Recalcula a tabela de posições (TABELA_POSICOES) das startups ativas
+        
+        As funções de janela rodam aqui, uma vez por escrita, e não a cada
+        consulta de ranking. Deve ser chamado dentro da transação que
+        alterou as startups ou as dimensões.
+        """
+        for sql in ESQUEMA_POSICOES:
+            self.cursor.execute(sql)
+        self.cursor.execute(f'DELETE FROM {TABELA_POSICOES}')
+        self.cursor.execute(SQL_GRAVAR_POSICOES)
+    
+    def reconstruir_posicoes(self):
+        """
+        Recalcula as posições no ranking a partir das tabelas startups e
+        avaliacoes_dimensoes (ex.: após escritas feitas fora do importador)
+        """
+        self._gravar_posicoes()
+        self.registrar_alteracao([TABELA_POSICOES])
+        self.conn.commit()
+        print(f"✓ Tabela '{TABELA_POSICOES}' reconstruída")
+    
+    def criar_gatilhos_tabela_larga(self):
+        """
+        Cria triggers que mantêm a tabela larga sincronizada com escritas
+        feitas fora do importador (startups, avaliacoes_dimensoes e
+        avaliacoes_detalhadas, ou notas_compactas no modo compacto)
+        """
+        criterios = [c for c in self._colunas_existentes(TABELA_LARGA)
+                     if c not in COLUNAS_BASE_LARGA and c not in COLUNAS_DIMENSOES.values()]
+        base = COLUNAS_BASE_LARGA
+        gatilhos = {
+            f'trg_{TABELA_LARGA}_startup_ins': f'''
+                AFTER INSERT ON startups BEGIN
+                    INSERT OR IGNORE INTO {TABELA_LARGA} ({', '.join(base)})
+                    VALUES ({', '.join('NEW.' + c for c in base)});
+                END''',
+            f'trg_{TABELA_LARGA}_startup_upd': f'''
+                AFTER UPDATE ON startups BEGIN
+                    UPDATE {TABELA_LARGA}
+                    SET {', '.join(f'{c} = NEW.{c}' for c in base[1:])}
+                    WHERE id = NEW.id;
+                END''',
+            f'trg_{TABELA_LARGA}_startup_del': f'''
+                AFTER DELETE ON startups BEGIN
+                    DELETE FROM {TABELA_LARGA} WHERE id = OLD.id;
+                END''',
+        }
+        for i, (dimensao, coluna) in enumerate(COLUNAS_DIMENSOES.items(), 1):
+            for evento in ('INSERT', 'UPDATE'):
+                gatilhos[f'trg_{TABELA_LARGA}_dim{i}_{evento.lower()[:3]}'] = f'''
+                    AFTER {evento} ON avaliacoes_dimensoes WHEN NEW.dimensao = '{dimensao}' BEGIN
+                        UPDATE {TABELA_LARGA} SET {coluna} = NEW.score WHERE id = NEW.startup_id;
+                    END'''
+        if self.compacto:
+            self.cursor.execute(f'SELECT nome, id FROM {TABELA_CRITERIOS}')
+            ids_criterios = dict(self.cursor.fetchall())
+            atribuicoes = ', '.join(f"{_citar(criterio)} = {sql_nota('NEW.notas', ids_criterios[criterio])}"
+                                    for criterio in criterios if criterio in ids_criterios)
+            for evento in ('INSERT', 'UPDATE') if atribuicoes else ():
+                gatilhos[f'trg_{TABELA_LARGA}_notas_{evento.lower()[:3]}'] = f'''
+                    AFTER {evento} ON {TABELA_NOTAS} BEGIN
+                        UPDATE {TABELA_LARGA} SET {atribuicoes} WHERE id = NEW.startup_id;
+                    END'''
+            criterios = []
+        for i, criterio in enumerate(criterios, 1):
+            literal = criterio.replace("'", "''")
+            for evento in ('INSERT', 'UPDATE'):
+                gatilhos[f'trg_{TABELA_LARGA}_crit{i}_{evento.lower()[:3]}'] = f'''
+                    AFTER {evento} ON avaliacoes_detalhadas WHEN NEW.criterio = '{literal}' BEGIN
+                        UPDATE {TABELA_LARGA} SET {_citar(criterio)} = NEW.score WHERE id = NEW.startup_id;
+                    END'''
+        
+        for nome, corpo in gatilhos.items():
+            self.cursor.execute(f'DROP TRIGGER IF EXISTS {nome}')
+            self.cursor.execute(f'CREATE TRIGGER {nome} {corpo}')
+        self.conn.commit()
+        print(f"✓ {len(gatilhos)} triggers da tabela '{TABELA_LARGA}' criados")
+    
+    def obter_startup_completa(self, nome_startup):
+        """Retorna a linha larga (dimensões e critérios) de uma startup"""
+        query = f'SELECT * FROM {TABELA_LARGA} WHERE nome_startup = ?'
+        return self._consultar(query, (nome_startup,))
+    
+    def _blocos_planilha(self, excel_path, tamanho_bloco, usar_cache, atualizar_cache):
+        """Gera os blocos da planilha, via cache colunar ou direto do arquivo"""
+        if usar_cache:
+            from cache_avaliacoes import blocos_avaliacoes
+            return blocos_avaliacoes(excel_path, tamanho_bloco=tamanho_bloco,
+                                     forcar_atualizacao=atualizar_cache)
+        return ler_em_blocos(excel_path, tamanho_bloco=tamanho_bloco)
+    
+    def importar_dados_excel(self, excel_path='Case_TechNova_Dados.xlsx', em_lote=True,
+                             tamanho_bloco=TAMANHO_BLOCO_PADRAO, usar_cache=True,
+                             atualizar_cache=False):
         """
         Importa dados do arquivo Excel para o banco de dados
         
+        Com usar_cache=True os dados vêm do cache colunar (ver
+        cache_avaliacoes), evitando o parsing do Excel quando o arquivo não
+        mudou. Sem cache, a planilha é lida em blocos direto do arquivo
+        (ver leitor_dados.ler_em_blocos) e o pico de memória não cresce com
+        o número de startups.
+        
         Args:
-            excel_path: Caminho para o arquivo Excel
+            excel_path: Caminho para o arquivo Excel (ou CSV equivalente)
+            em_lote: Se True, carrega cada tabela com um único executemany
+                     por bloco dentro de uma transação explícita; se False,
+                     usa o loop linha a linha (útil para comparar desempenho)
+            tamanho_bloco: Número de linhas lidas e inseridas por bloco
+            usar_cache: Se True, lê os dados através do cache colunar
+            atualizar_cache: Se True, força a releitura do Excel e regrava o cache
         """
         print("\n" + "=" * 80)
         print("IMPORTANDO DADOS DO EXCEL")
@@ -124,54 +805,194 @@ class TechNovaDatabase:
             print(f"✗ Arquivo não encontrado: {excel_path}")
             return False
         
-        # Carregar dados
-        df = pd.read_excel(excel_path, sheet_name='Avaliacoes_Startups')
-        print(f"✓ Dados carregados: {len(df)} startups")
-        
-        # Identificar colunas de notas
-        colunas_notas = [col for col in df.columns if col[0].isdigit() and '.' in col]
-        print(f"✓ Colunas de avaliação: {len(colunas_notas)}")
-        
-        # Calcular Score Global
-        df['Score_Global'] = df[colunas_notas].mean(axis=1)
-        
-        # Definir dimensões
-        dimensoes = {
-            'Grupo 1 - Performance Técnica': [col for col in colunas_notas if col.startswith('1.')],
-            'Grupo 2 - Viabilidade Econômica': [col for col in colunas_notas if col.startswith('2.')],
-            'Grupo 3 - Confiabilidade': [col for col in colunas_notas if col.startswith('3.')],
-            'Grupo 4 - Usabilidade': [col for col in colunas_notas if col.startswith('4.')],
-            'Grupo 5 - Eficiência Energética': [col for col in colunas_notas if col.startswith('5.')],
-            'Grupo 6 - Robustez Física': [col for col in colunas_notas if col.startswith('6.')],
-            'Grupo 7 - Conectividade': [col for col in colunas_notas if col.startswith('7.')],
-            'Grupo 8 - Sustentabilidade': [col for col in colunas_notas if col.startswith('8.')]
-        }
+        print("\n📊 Inserindo dados nas tabelas...")
         
-        # Calcular scores por dimensão
-        for nome_dim, colunas_dim in dimensoes.items():
-            df[nome_dim] = df[colunas_dim].mean(axis=1)
+        startups_inseridas = 0
+        total_linhas = 0
+        colunas_notas = None
+        resumos_setor = []
+        duracao = 0.0
         
-        # Calcular Score Performance + Viabilidade
-        df['Score_Performance_Viabilidade'] = (
-            df['Grupo 1 - Performance Técnica'] + 
-            df['Grupo 2 - Viabilidade Econômica']
-        ) / 2
+        if em_lote and not self.conn.in_transaction:
+            self.cursor.execute('BEGIN')
         
-        print("\n📊 Inserindo dados nas tabelas...")
+        try:
+            blocos = self._blocos_planilha(excel_path, tamanho_bloco, usar_cache, atualizar_cache)
+            
+            for df in medir_iteracao(blocos, 'ler bloco da planilha', 'banco'):
+                if colunas_notas is None:
+                    # Identificar colunas de notas e dimensões
+                    colunas_notas = identificar_colunas_notas(df.columns)
+                    print(f"✓ Colunas de avaliação: {len(colunas_notas)}")
+                    dimensoes = agrupar_dimensoes(colunas_notas)
+                    self._garantir_tabela_larga(colunas_notas)
+                
+                total_linhas += len(df)
+                
+                # Calcular Score Global, scores por dimensão e
+                # Score Performance + Viabilidade em uma única passada
+                with secao('calcular scores do bloco', 'banco', linhas=len(df)):
+                    aplicar_scores(df, colunas_notas)
+                    df['hash_conteudo'] = calcular_hashes(df, colunas_notas)
+                
+                inicio = time.perf_counter()
+                if em_lote:
+                    startups_inseridas += self._inserir_em_lote(df, dimensoes, colunas_notas)
+                else:
+                    startups_inseridas += self._inserir_linha_a_linha(df, dimensoes, colunas_notas)
+                duracao += time.perf_counter() - inicio
+                
+                # Guardar apenas as colunas necessárias para as estatísticas
+                resumos_setor.append(df[['setor', 'status', 'Score_Global']])
+            
+            if em_lote:
+                self.conn.commit()
+        except Exception as e:
+            if em_lote:
+                self.conn.rollback()
+                print(f"✗ Erro na importação em lote (nenhuma linha gravada): {e}")
+                return False
+            raise
         
-        # Inserir startups
+        print(f"✓ Dados carregados: {total_linhas} startups")
+        if not resumos_setor:
+            print("✗ Nenhuma startup encontrada na planilha")
+            return False
+        
+        print(f"✓ {startups_inseridas} startups inseridas")
+        taxa = startups_inseridas / duracao if duracao > 0 else float('inf')
+        modo = 'lote' if em_lote else 'linha a linha'
+        print(f"✓ Modo {modo}: {duracao:.3f}s ({taxa:,.0f} linhas/s)")
+        
+        import pandas as pd
+        df = pd.concat(resumos_setor, ignore_index=True)
+        
+        # Calcular e inserir estatísticas por setor
+        print("\n📈 Calculando estatísticas por setor...")
+        setores = self._gravar_estatisticas_setor(df)
+        
+        print(f"✓ Estatísticas calculadas para {len(setores)} setores")
+        
+        with secao('calcular posições no ranking', 'banco'):
+            self._gravar_posicoes()
+        self.registrar_alteracao(TABELAS_VERSIONADAS)
+        self.conn.commit()
+        self.estatisticas = None
+        self.otimizar_esquema()
+        print("\n✓ Importação concluída com sucesso!")
+        return True
+    
+    def _gravar_estatisticas_setor(self, df):
+        """
+        Calcula e grava as estatísticas dos setores presentes em `df`
+        
+        Args:
+            df: DataFrame com as colunas setor, status e Score_Global de
+                todas as startups dos setores a atualizar
+        
+        Returns:
+            Lista com os setores atualizados
+        """
+        linhas = calcular_estatisticas(df)
+        self._gravar_linhas_estatisticas(linhas)
+        return [linha.setor for linha in linhas]
+    
+    def _gravar_linhas_estatisticas(self, linhas):
+        """Grava linhas EstatisticasSetor (upsert pelo setor, mantendo o id)"""
+        self.cursor.executemany('''
+            INSERT INTO estatisticas_setor 
+            (setor, total_startups, startups_ativas, startups_inativas, 
+             score_medio, score_mediano, score_min, score_max)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(setor) DO UPDATE SET
+                total_startups = excluded.total_startups,
+                startups_ativas = excluded.startups_ativas,
+                startups_inativas = excluded.startups_inativas,
+                score_medio = excluded.score_medio,
+                score_mediano = excluded.score_mediano,
+                score_min = excluded.score_min,
+                score_max = excluded.score_max,
+                ultima_atualizacao = CURRENT_TIMESTAMP
+        ''', linhas)
+    
+    def _motor_estatisticas(self):
+        """
+        Estatísticas incrementais em memória, recarregadas da tabela
+        startups só na primeira vez ou se o banco mudou por fora
+        """
+        if self.estatisticas is None or self.versao_estatisticas != versao_banco(self.conn):
+            self.estatisticas = carregar_estatisticas(self.conn)
+        return self.estatisticas
+    
+    def _gravar_estatisticas_incrementais(self, setores):
+        """Grava (ou remove, se ficaram vazios) os setores a partir do motor incremental"""
+        linhas = []
+        vazios = []
+        for setor in setores:
+            linha = self.estatisticas.estatisticas(setor)
+            if linha is None:
+                vazios.append((setor,))
+            else:
+                linhas.append(linha)
+        self._gravar_linhas_estatisticas(linhas)
+        self.cursor.executemany('DELETE FROM estatisticas_setor WHERE setor = ?', vazios)
+    
+    def desativar_startup(self, nome_startup):
+        """
+        Marca uma startup como inativa e atualiza as estatísticas do setor
+        sem recalculá-lo
+        
+        Returns:
+            True se a startup foi desativada, False se não existe ou já
+            estava inativa
+        """
+        self.cursor.execute('SELECT id, setor, status, score_global FROM startups WHERE nome_startup = ?',
+                            (nome_startup,))
+        linha = self.cursor.fetchone()
+        if linha is None or linha[2] == 'Inativa':
+            return False
+        startup_id, setor, status, score = linha
+        
+        estatisticas = self._motor_estatisticas()
+        try:
+            self.cursor.execute("UPDATE startups SET status = 'Inativa' WHERE id = ?", (startup_id,))
+            if self._colunas_existentes(TABELA_LARGA):
+                self.cursor.execute(f"UPDATE {TABELA_LARGA} SET status = 'Inativa' WHERE id = ?", (startup_id,))
+            estatisticas.substituir((setor, status, score), (setor, 'Inativa', score))
+            self._gravar_estatisticas_incrementais([setor])
+            self._gravar_posicoes()
+            self.registrar_alteracao(['startups', TABELA_LARGA, 'estatisticas_setor', TABELA_POSICOES])
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            self.estatisticas = None
+            print(f"✗ Erro ao desativar '{nome_startup}': {e}")
+            return False
+        
+        self.versao_estatisticas = versao_banco(self.conn)
+        return True
+    
+    def _inserir_linha_a_linha(self, df, dimensoes, colunas_notas):
+        """Insere cada startup com seus INSERTs individuais (modo original)"""
         startups_inseridas = 0
-        for _, row in df.iterrows():
+        ids_inseridos = []
+        posicoes_inseridas = []
+        ids_origem, datas = _valores_origem(df)
+        for posicao, ((_, row), id_origem, data) in enumerate(zip(df.iterrows(), ids_origem, datas)):
             try:
                 self.cursor.execute('''
-                    INSERT INTO startups (nome_startup, setor, status, score_global, score_performance_viabilidade)
-                    VALUES (?, ?, ?, ?, ?)
+                    INSERT INTO startups (nome_startup, setor, status, score_global, score_performance_viabilidade,
+                                          id_origem, data_avaliacao, hash_conteudo)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     row['nome_startup'],
                     row['setor'],
                     row['status'],
                     float(row['Score_Global']),
-                    float(row['Score_Performance_Viabilidade'])
+                    float(row['Score_Performance_Viabilidade']),
+                    id_origem,
+                    data,
+                    row['hash_conteudo']
                 ))
                 startup_id = self.cursor.lastrowid
                 
@@ -183,64 +1004,319 @@ class TechNovaDatabase:
                     ''', (startup_id, dimensao, float(row[dimensao])))
                 
                 # Inserir avaliações detalhadas
-                for criterio in colunas_notas:
-                    self.cursor.execute('''
-                        INSERT INTO avaliacoes_detalhadas (startup_id, criterio, score)
-                        VALUES (?, ?, ?)
-                    ''', (startup_id, criterio, float(row[criterio])))
+                if self.compacto:
+                    self._gravar_notas_compactas([startup_id], df.iloc[[posicao]], colunas_notas)
+                else:
+                    for criterio in colunas_notas:
+                        self.cursor.execute('''
+                            INSERT INTO avaliacoes_detalhadas (startup_id, criterio, score)
+                            VALUES (?, ?, ?)
+                        ''', (startup_id, criterio, float(row[criterio])))
                 
                 startups_inseridas += 1
+                ids_inseridos.append(startup_id)
+                posicoes_inseridas.append(posicao)
                 
             except Exception as e:
                 print(f"✗ Erro ao inserir {row['nome_startup']}: {e}")
         
-        print(f"✓ {startups_inseridas} startups inseridas")
+        if ids_inseridos:
+            self._gravar_tabela_larga(ids_inseridos, df.iloc[posicoes_inseridas], colunas_notas)
         
-        # Calcular e inserir estatísticas por setor
-        print("\n📈 Calculando estatísticas por setor...")
-        setores = df['setor'].unique()
+        return startups_inseridas
+    
+    def _inserir_em_lote(self, df, dimensoes, colunas_notas):
+        """
+        Insere um bloco de startups com um executemany por tabela
         
-        for setor in setores:
-            df_setor = df[df['setor'] == setor]
-            
-            self.cursor.execute('''
-                INSERT OR REPLACE INTO estatisticas_setor 
-                (setor, total_startups, startups_ativas, startups_inativas, 
-                 score_medio, score_mediano, score_min, score_max)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                setor,
-                len(df_setor),
-                len(df_setor[df_setor['status'] == 'Ativa']),
-                len(df_setor[df_setor['status'] == 'Inativa']),
-                float(df_setor['Score_Global'].mean()),
-                float(df_setor['Score_Global'].median()),
-                float(df_setor['Score_Global'].min()),
-                float(df_setor['Score_Global'].max())
-            ))
+        As colunas são convertidas para listas Python uma única vez. O
+        controle da transação fica com importar_dados_excel, de modo que
+        qualquer erro desfaz a carga inteira.
         
-        print(f"✓ Estatísticas calculadas para {len(setores)} setores")
+        Returns:
+            Número de startups inseridas
+        """
+        nomes = df['nome_startup'].tolist()
+        ids_origem, datas = _valores_origem(df)
+        linhas_startups = list(zip(
+            nomes,
+            df['setor'].tolist(),
+            df['status'].tolist(),
+            df['Score_Global'].astype(float).tolist(),
+            df['Score_Performance_Viabilidade'].astype(float).tolist(),
+            ids_origem,
+            datas,
+            df['hash_conteudo'].tolist()
+        ))
         
-        self.conn.commit()
-        print("\n✓ Importação concluída com sucesso!")
+        self.cursor.execute('SELECT COALESCE(MAX(id), 0) FROM startups')
+        ultimo_id = self.cursor.fetchone()[0]
+        
+        self.cursor.executemany('''
+            INSERT INTO startups (nome_startup, setor, status, score_global, score_performance_viabilidade,
+                                  id_origem, data_avaliacao, hash_conteudo)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', linhas_startups)
+        
+        # Recuperar ids gerados pelo AUTOINCREMENT neste bloco
+        self.cursor.execute('SELECT nome_startup, id FROM startups WHERE id > ?', (ultimo_id,))
+        ids_por_nome = dict(self.cursor.fetchall())
+        ids = [ids_por_nome[nome] for nome in nomes]
+        
+        self._gravar_avaliacoes(ids, df, dimensoes, colunas_notas)
+        
+        return len(linhas_startups)
+    
+    def _gravar_avaliacoes(self, ids, df, dimensoes, colunas_notas, substituir=False):
+        """
+        Grava as avaliações por dimensão e por critério de um bloco, além
+        das linhas correspondentes da tabela larga
+        
+        Args:
+            ids: Ids (tabela startups) de cada linha de `df`, na mesma ordem
+            df: Bloco com os scores por dimensão e as notas
+            dimensoes: Mapeamento dimensão → critérios
+            colunas_notas: Colunas de critérios
+            substituir: Se True, atualiza o score de pares já existentes
+        """
+        conflito_dim = ' ON CONFLICT(startup_id, dimensao) DO UPDATE SET score = excluded.score' if substituir else ''
+        conflito_crit = ' ON CONFLICT(startup_id, criterio) DO UPDATE SET score = excluded.score' if substituir else ''
+        
+        nomes_dimensoes = list(dimensoes.keys())
+        matriz_dimensoes = df[nomes_dimensoes].to_numpy(dtype=float).tolist()
+        linhas_dimensoes = [
+            (startup_id, dimensao, score)
+            for startup_id, scores in zip(ids, matriz_dimensoes)
+            for dimensao, score in zip(nomes_dimensoes, scores)
+        ]
+        self.cursor.executemany(f'''
+            INSERT INTO avaliacoes_dimensoes (startup_id, dimensao, score)
+            VALUES (?, ?, ?){conflito_dim}
+        ''', linhas_dimensoes)
+        
+        if self.compacto:
+            self._gravar_notas_compactas(ids, df, colunas_notas, substituir)
+        else:
+            matriz_notas = df[colunas_notas].to_numpy(dtype=float).tolist()
+            linhas_criterios = [
+                (startup_id, criterio, score)
+                for startup_id, scores in zip(ids, matriz_notas)
+                for criterio, score in zip(colunas_notas, scores)
+            ]
+            self.cursor.executemany(f'''
+                INSERT INTO avaliacoes_detalhadas (startup_id, criterio, score)
+                VALUES (?, ?, ?){conflito_crit}
+            ''', linhas_criterios)
+        
+        self._gravar_tabela_larga(ids, df, colunas_notas)
+    
+    def _gravar_notas_compactas(self, ids, df, colunas_notas, substituir=False):
+        """
+        Grava as notas de um bloco como um BLOB por startup (modo compacto)
+        
+        Critérios novos recebem o próximo id em criterios. Ao substituir,
+        as notas de critérios gravados antes e ausentes do bloco são mantidas.
+        """
+        self.cursor.executemany(f'INSERT OR IGNORE INTO {TABELA_CRITERIOS} (nome) VALUES (?)',
+                                [(criterio,) for criterio in colunas_notas])
+        self.cursor.execute(f'SELECT nome, id FROM {TABELA_CRITERIOS}')
+        ids_criterios = dict(self.cursor.fetchall())
+        largura = max(ids_criterios.values())
+        posicoes = [ids_criterios[criterio] - 1 for criterio in colunas_notas]
+        
+        base = None
+        if substituir and len(set(posicoes)) < largura:
+            base = notas_gravadas(self.conn, ids, largura)
+        blobs = empacotar_notas(df[colunas_notas].to_numpy(dtype=float), posicoes, largura, base)
+        conflito = ' ON CONFLICT(startup_id) DO UPDATE SET notas = excluded.notas' if substituir else ''
+        self.cursor.executemany(f'''
+            INSERT INTO {TABELA_NOTAS} (startup_id, notas)
+            VALUES (?, ?){conflito}
+        ''', list(zip(ids, blobs)))
+    
+    def importar_incremental(self, excel_path='Case_TechNova_Dados.xlsx',
+                             tamanho_bloco=TAMANHO_BLOCO_PADRAO, usar_cache=True,
+                             atualizar_cache=False):
+        """
+        Importa apenas as startups novas ou alteradas (upsert)
+        
+        Cada linha da planilha é associada a uma startup já gravada pelo
+        id_startup de origem ou, na falta dele, pelo nome. Linhas cujo hash
+        de conteúdo não mudou são ignoradas; as alteradas têm a startup e
+        suas avaliações atualizadas; as demais são inseridas. As
+        estatísticas dos setores afetados são atualizadas incrementalmente
+        (ver motor_estatisticas), sem reler as startups desses setores.
+        
+        Args:
+            excel_path: Caminho para o arquivo Excel (ou CSV equivalente)
+            tamanho_bloco: Número de linhas processadas por bloco
+            usar_cache: Se True, lê os dados através do cache colunar
+            atualizar_cache: Se True, força a releitura do Excel e regrava o cache
+        """
+        print("\n" + "=" * 80)
+        print("IMPORTAÇÃO INCREMENTAL DO EXCEL")
+        print("=" * 80)
+        
+        if not Path(excel_path).exists():
+            print(f"✗ Arquivo não encontrado: {excel_path}")
+            return False
+        
+        self._migrar_esquema()
+        
+        # Estado atual do banco: id, origem, nome, setor, hash, status e
+        # score de cada startup
+        estatisticas = self._motor_estatisticas()
+        self.cursor.execute('''
+            SELECT id, id_origem, nome_startup, setor, hash_conteudo, status, score_global
+            FROM startups
+        ''')
+        por_origem = {}
+        por_nome = {}
+        for startup_id, id_origem, nome, setor, hash_atual, status, score in self.cursor.fetchall():
+            registro = (startup_id, setor, hash_atual, status, score)
+            if id_origem is not None:
+                por_origem[id_origem] = registro
+            por_nome[nome] = registro
+        
+        inseridas = atualizadas = inalteradas = 0
+        setores_afetados = set()
+        colunas_notas = None
+        inicio = time.perf_counter()
+        
+        if not self.conn.in_transaction:
+            self.cursor.execute('BEGIN')
+        
+        try:
+            blocos = self._blocos_planilha(excel_path, tamanho_bloco, usar_cache, atualizar_cache)
+            for df in medir_iteracao(blocos, 'ler bloco da planilha', 'banco'):
+                if colunas_notas is None:
+                    colunas_notas = identificar_colunas_notas(df.columns)
+                    dimensoes = agrupar_dimensoes(colunas_notas)
+                    tabela_larga_nova = self._garantir_tabela_larga(colunas_notas)
+                
+                with secao('calcular scores do bloco', 'banco', linhas=len(df)):
+                    aplicar_scores(df, colunas_notas)
+                    df['hash_conteudo'] = calcular_hashes(df, colunas_notas)
+                ids_origem, datas = _valores_origem(df)
+                
+                novas = []
+                alteradas = []
+                ids_alterados = []
+                for posicao, (id_origem, nome, setor, status, score, hash_novo) in enumerate(zip(
+                        ids_origem, df['nome_startup'], df['setor'], df['status'],
+                        df['Score_Global'].astype(float).tolist(), df['hash_conteudo'])):
+                    registro = por_origem.get(id_origem) if id_origem is not None else None
+                    if registro is None:
+                        registro = por_nome.get(nome)
+                    
+                    if registro is None:
+                        novas.append(posicao)
+                        setores_afetados.add(setor)
+                        estatisticas.adicionar(setor, status, score)
+                    elif registro[2] != hash_novo:
+                        alteradas.append(posicao)
+                        ids_alterados.append(registro[0])
+                        setores_afetados.update((registro[1], setor))
+                        estatisticas.substituir((registro[1], registro[3], registro[4]),
+                                                (setor, status, score))
+                    else:
+                        inalteradas += 1
+                
+                if novas:
+                    inseridas += self._inserir_em_lote(df.iloc[novas], dimensoes, colunas_notas)
+                
+                if alteradas:
+                    df_alteradas = df.iloc[alteradas]
+                    self.cursor.executemany('''
+                        UPDATE startups
+                        SET nome_startup = ?, setor = ?, status = ?, score_global = ?,
+                            score_performance_viabilidade = ?, id_origem = ?,
+                            data_avaliacao = ?, hash_conteudo = ?
+                        WHERE id = ?
+                    ''', list(zip(
+                        df_alteradas['nome_startup'].tolist(),
+                        df_alteradas['setor'].tolist(),
+                        df_alteradas['status'].tolist(),
+                        df_alteradas['Score_Global'].astype(float).tolist(),
+                        df_alteradas['Score_Performance_Viabilidade'].astype(float).tolist(),
+                        [ids_origem[i] for i in alteradas],
+                        [datas[i] for i in alteradas],
+                        df_alteradas['hash_conteudo'].tolist(),
+                        ids_alterados
+                    )))
+                    self._gravar_avaliacoes(ids_alterados, df_alteradas, dimensoes,
+                                            colunas_notas, substituir=True)
+                    atualizadas += len(alteradas)
+            
+            # Bancos anteriores à tabela larga: preencher as startups já existentes
+            if colunas_notas is not None and tabela_larga_nova and por_nome:
+                self.reconstruir_tabela_larga(commit=False)
+            
+            # Gravar as estatísticas dos setores afetados, já atualizadas
+            # linha a linha no motor incremental (setores que ficaram sem
+            # startups deixam de ter estatísticas)
+            if setores_afetados:
+                self._gravar_estatisticas_incrementais(setores_afetados)
+            
+            if inseridas or atualizadas:
+                self._gravar_posicoes()
+                self.registrar_alteracao(['startups', 'avaliacoes_dimensoes',
+                                          'avaliacoes_detalhadas', TABELA_LARGA, TABELA_POSICOES])
+            if setores_afetados:
+                self.registrar_alteracao(['estatisticas_setor'])
+            
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            self.estatisticas = None
+            print(f"✗ Erro na importação incremental (nenhuma linha gravada): {e}")
+            return False
+        
+        self.versao_estatisticas = versao_banco(self.conn)
+        duracao = time.perf_counter() - inicio
+        print(f"✓ {inseridas} startups inseridas")
+        print(f"✓ {atualizadas} startups atualizadas")
+        print(f"✓ {inalteradas} startups inalteradas")
+        print(f"✓ Estatísticas atualizadas para {len(setores_afetados)} setores")
+        self.otimizar_esquema()
+        print(f"✓ Importação incremental concluída em {duracao:.3f}s")
         return True
     
+    def _consultar(self, query, params=None, ler=_ler_sql):
+        """Resultado de ler(conn, query, params), do cache de resultados se o banco não mudou"""
+        conn = self.conn
+        if self.cache is None:
+            return ler(conn, query, params)
+        return self.cache.consultar(conn, query, params, lambda: ler(conn, query, params))
+    
+    def estatisticas_cache(self):
+        """Acertos, faltas e taxa de acerto do cache de resultados (None se desativado)"""
+        return self.cache.estatisticas() if self.cache is not None else None
+    
     def consultar_startup(self, nome_startup):
         """Consulta informações completas de uma startup"""
-        self.cursor.execute('''
+        return self._consultar('''
             SELECT * FROM startups WHERE nome_startup = ?
-        ''', (nome_startup,))
-        return self.cursor.fetchone()
+        ''', (nome_startup,), ler=_ler_linha)
     
-    def listar_startups_ativas(self):
-        """Lista todas as startups ativas ordenadas por score"""
+    def listar_startups_ativas(self, limite=None):
+        """
+        Lista as startups ativas ordenadas por score
+        
+        Args:
+            limite: Se informado, retorna apenas as `limite` primeiras (o
+                    LIMIT é aplicado no SQL, que para de ler o índice
+                    idx_startups_status_pv após as primeiras linhas)
+        """
         query = '''
             SELECT nome_startup, setor, score_global, score_performance_viabilidade
             FROM startups
             WHERE status = 'Ativa'
             ORDER BY score_performance_viabilidade DESC
         '''
-        return pd.read_sql_query(query, self.conn)
+        if limite is None:
+            return self._consultar(query)
+        return self._consultar(query + ' LIMIT ?', (int(limite),))
     
     def listar_startups_por_setor(self, setor):
         """Lista startups de um setor específico"""
@@ -250,7 +1326,7 @@ class TechNovaDatabase:
             WHERE setor = ?
             ORDER BY score_global DESC
         '''
-        return pd.read_sql_query(query, self.conn, params=(setor,))
+        return self._consultar(query, (setor,))
     
     def obter_melhor_startup(self):
         """Retorna a startup com melhor score de performance + viabilidade"""
@@ -264,17 +1340,75 @@ class TechNovaDatabase:
             ORDER BY s.score_performance_viabilidade DESC
             LIMIT 1
         '''
-        self.cursor.execute(query)
-        return self.cursor.fetchone()
+        return self._consultar(query, ler=_ler_linha)
+    
+    def obter_top_k(self, k=5):
+        """
+        Top-K das startups ativas: geral, por setor e por dimensão
+        
+        O ranking geral usa LIMIT; os rankings por setor e por dimensão usam
+        ROW_NUMBER() filtrado a K, de modo que só K linhas por grupo saem do
+        banco. Empates são desfeitos pelo id (ordem de importação).
+        
+        Returns:
+            Dicionário com 'geral' (DataFrame), 'por_setor' ({setor: DataFrame})
+            e 'por_dimensao' ({dimensão: DataFrame})
+        """
+        geral = self._consultar('''
+            SELECT nome_startup, setor, score_global, score_performance_viabilidade
+            FROM startups
+            WHERE status = 'Ativa'
+            ORDER BY score_performance_viabilidade DESC, id
+            LIMIT ?
+        ''', (k,))
+        
+        por_setor = self._consultar('''
+            SELECT setor, nome_startup, score_global, score_performance_viabilidade
+            FROM (
+                SELECT setor, nome_startup, score_global, score_performance_viabilidade, id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY setor ORDER BY score_performance_viabilidade DESC, id
+                       ) AS posicao
+                FROM startups
+                WHERE status = 'Ativa'
+            )
+            WHERE posicao <= ?
+            ORDER BY setor, posicao
+        ''', (k,))
+        
+        por_dimensao = self._consultar('''
+            SELECT dimensao, nome_startup, setor, score
+            FROM (
+                SELECT d.dimensao, s.nome_startup, s.setor, d.score,
+                       ROW_NUMBER() OVER (PARTITION BY d.dimensao ORDER BY d.score DESC, s.id) AS posicao
+                FROM avaliacoes_dimensoes d
+                JOIN startups s ON s.id = d.startup_id
+                WHERE s.status = 'Ativa'
+            )
+            WHERE posicao <= ?
+            ORDER BY dimensao, posicao
+        ''', (k,))
+        
+        return {
+            'geral': geral,
+            'por_setor': {
+                setor: grupo.drop(columns='setor').reset_index(drop=True)
+                for setor, grupo in por_setor.groupby('setor', sort=False)
+            },
+            'por_dimensao': {
+                dimensao: grupo.drop(columns='dimensao').reset_index(drop=True)
+                for dimensao, grupo in por_dimensao.groupby('dimensao', sort=False)
+            },
+        }
     
     def obter_estatisticas_setor(self, setor=None):
         """Retorna estatísticas de um setor ou de todos os setores"""
         if setor:
             query = 'SELECT * FROM estatisticas_setor WHERE setor = ?'
-            return pd.read_sql_query(query, self.conn, params=(setor,))
+            return self._consultar(query, (setor,))
         else:
             query = 'SELECT * FROM estatisticas_setor ORDER BY score_medio DESC'
-            return pd.read_sql_query(query, self.conn)
+            return self._consultar(query)
     
     def obter_avaliacoes_dimensoes(self, nome_startup):
         """Retorna as avaliações por dimensão de uma startup"""
@@ -285,14 +1419,32 @@ class TechNovaDatabase:
             WHERE s.nome_startup = ?
             ORDER BY d.dimensao
         '''
-        return pd.read_sql_query(query, self.conn, params=(nome_startup,))
+        return self._consultar(query, (nome_startup,))
+    
+    def obter_posicoes(self, nome_startup):
+        """
+        Posição geral, posição no setor e percentis de uma startup ativa em
+        cada métrica (Score_Global, Score_Performance_Viabilidade e as 8
+        dimensões), lidos da tabela pré-calculada pela importação
+        """
+        query = f'''
+            SELECT p.metrica, p.valor, p.posicao_geral, p.posicao_setor,
+                   p.percentil_geral, p.percentil_setor
+            FROM {TABELA_POSICOES} p
+            JOIN startups s ON s.id = p.startup_id
+            WHERE s.nome_startup = ?
+            ORDER BY p.metrica
+        '''
+        return self._consultar(query, (nome_startup,))
     
     def executar_query_personalizada(self, query, params=None):
-        """Executa uma query SQL personalizada"""
-        if params:
-            return pd.read_sql_query(query, self.conn, params=params)
-        else:
-            return pd.read_sql_query(query, self.conn)
+        """
+        Executa uma query SQL personalizada
+        
+        Leituras repetidas (mesmo SQL, a menos de espaços, e mesmos
+        parâmetros) saem do cache de resultados enquanto o banco não muda.
+        """
+        return self._consultar(query, params)
 
 
 def main():
@@ -301,8 +1453,12 @@ def main():
     print("SISTEMA DE BANCO DE DADOS - TECHNOVA IoT")
     print("=" * 80)
     
-    # Criar instância do banco
-    db = TechNovaDatabase('technova_iot.db')
+    # --trace ARQUIVO, --tempos, --tracemalloc e --perfil DIR (ver instrumentacao.py)
+    configurar_por_argumentos()
+    
+    # Criar instância do banco (--compacto grava as notas dos critérios
+    # empacotadas, e converte um banco existente)
+    db = TechNovaDatabase('technova_iot.db', armazenamento_compacto='--compacto' in sys.argv)
     
     # Conectar
     if not db.conectar():
@@ -311,8 +1467,15 @@ def main():
     # Criar tabelas
     db.criar_tabelas()
     
-    # Importar dados
-    if db.importar_dados_excel():
+    # Importar dados (--atualizar-cache força a releitura do Excel;
+    # --incremental grava apenas startups novas ou alteradas)
+    atualizar_cache = '--atualizar-cache' in sys.argv
+    if '--incremental' in sys.argv:
+        importado = db.importar_incremental(atualizar_cache=atualizar_cache)
+    else:
+        importado = db.importar_dados_excel(atualizar_cache=atualizar_cache)
+    
+    if importado:
         print("\n" + "=" * 80)
         print("VERIFICAÇÃO DOS DADOS IMPORTADOS")
         print("=" * 80)
@@ -345,6 +1508,11 @@ def main():
         print(f"   Total de Startups: {total_startups}")
         print(f"   Total de Avaliações por Dimensão: {total_avaliacoes_dim}")
         print(f"   Total de Avaliações Detalhadas: {total_avaliacoes_det}")
+        print(f"   Armazenamento das notas: {'compacto' if db.compacto else 'normalizado'}")
+        
+        # Relatório de planos de execução (opcional)
+        if '--planos' in sys.argv:
+            db.relatorio_planos_consultas()
         
         print("\n" + "=" * 80)
         print("✓ BANCO DE DADOS CRIADO E POPULADO COM SUCESSO!")
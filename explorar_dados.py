@@ -1,27 +1,37 @@
-import pandas as pd
+from leitor_dados import ler_em_blocos, listar_abas
 
-# Carregar arquivo Excel
-xl = pd.ExcelFile('Case_TechNova_Dados.xlsx')
+# Listar abas do arquivo Excel (sem carregar o conteúdo)
+arquivo = 'Case_TechNova_Dados.xlsx'
+abas = listar_abas(arquivo)
 
 # Salvar exploração em arquivo
 with open('exploracao_dados.txt', 'w', encoding='utf-8') as f:
     f.write("=" * 60 + "\n")
     f.write("ABAS DISPONÍVEIS NO ARQUIVO EXCEL\n")
     f.write("=" * 60 + "\n")
-    f.write(str(xl.sheet_names) + "\n\n")
+    f.write(str(abas) + "\n\n")
     
-    # Explorar cada aba
-    for sheet in xl.sheet_names:
-        df = pd.read_excel('Case_TechNova_Dados.xlsx', sheet_name=sheet)
+    # Explorar cada aba percorrendo-a em blocos: só o primeiro
+    # bloco fica em memória para a amostra das primeiras linhas
+    for sheet in abas:
+        primeiro_bloco = None
+        total_linhas = 0
+        for bloco in ler_em_blocos(arquivo, aba=sheet):
+            if primeiro_bloco is None:
+                primeiro_bloco = bloco
+            total_linhas += len(bloco)
+        
+        colunas = list(primeiro_bloco.columns) if primeiro_bloco is not None else []
         f.write("=" * 60 + "\n")
         f.write(f"ABA: {sheet}\n")
         f.write("=" * 60 + "\n")
-        f.write(f"Shape: {df.shape}\n\n")
-        f.write(f"Colunas ({len(df.columns)}):\n")
-        for i, col in enumerate(df.columns, 1):
+        f.write(f"Shape: {(total_linhas, len(colunas))}\n\n")
+        f.write(f"Colunas ({len(colunas)}):\n")
+        for i, col in enumerate(colunas, 1):
             f.write(f"  {i}. {col}\n")
         f.write("\n")
-        f.write("Primeiras 5 linhas:\n")
-        f.write(df.head().to_string() + "\n\n")
+        if primeiro_bloco is not None:
+            f.write("Primeiras 5 linhas:\n")
+            f.write(primeiro_bloco.head().to_string() + "\n\n")
 
 print("Exploração salva em 'exploracao_dados.txt'")
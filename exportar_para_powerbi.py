@@ -6,17 +6,136 @@ Autor: Sistema TechNova
 Data: 2026-01-16
 """
 
-import pandas as pd
-import sqlite3
+import sys
+import time
 from pathlib import Path
 
-def exportar_para_powerbi(db_path='technova_iot.db', output_dir='powerbi_export'):
+from instrumentacao import configurar_por_argumentos, cronometrado, registrar_evento, secao
+from motor_exportacao import TarefaExportacao, conectar_somente_leitura, exportar_alteradas
+
+# Colunas originais da tabela startups: as de rastreamento da importação
+# incremental (id_origem, data_avaliacao, hash_conteudo) ficam fora do Power BI
+QUERY_STARTUPS = """
+SELECT
+    id,
+    nome_startup,
+    setor,
+    status,
+    score_global,
+    score_performance_viabilidade,
+    data_cadastro
+FROM startups
+"""
+
+# Views consolidadas
+# Startups com todas as dimensões (formato largo), lida direto da tabela
+# materializada pelo importador
+QUERY_WIDE_MATERIALIZADA = """
+SELECT 
+    id,
+    nome_startup,
+    setor,
+    status,
+    score_global,
+    score_performance_viabilidade,
+    performance_tecnica,
+    viabilidade_economica,
+    confiabilidade,
+    usabilidade,
+    eficiencia_energetica,
+    robustez_fisica,
+    conectividade,
+    sustentabilidade
+FROM startups_completo
+ORDER BY id
+"""
+
+# Bancos antigos, sem startups_completo: pivot sobre avaliacoes_dimensoes
+QUERY_WIDE = """
+SELECT 
+    s.id,
+    s.nome_startup,
+    s.setor,
+    s.status,
+    s.score_global,
+    s.score_performance_viabilidade,
+    MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
+    MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
+    MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
+    MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
+    MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
+    MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
+    MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
+    MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
+FROM startups s
+LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+GROUP BY s.id, s.nome_startup, s.setor, s.status, s.score_global, s.score_performance_viabilidade
+ORDER BY s.id
+"""
+
+# Análise por setor com métricas
+QUERY_SETOR = """
+SELECT 
+    s.setor,
+    s.status,
+    COUNT(*) as quantidade,
+    ROUND(AVG(s.score_global), 2) as score_medio,
+    ROUND(MIN(s.score_global), 2) as score_min,
+    ROUND(MAX(s.score_global), 2) as score_max,
+    ROUND(AVG(s.score_performance_viabilidade), 2) as perf_viab_medio
+FROM startups s
+GROUP BY s.setor, s.status
+"""
+
+# Ranking de startups, lido das posições pré-calculadas pelo importador
+# (empates ordenados pelo setor e pela ordem de importação)
+QUERY_RANKING_MATERIALIZADO = """
+SELECT 
+    s.nome_startup,
+    s.setor,
+    s.status,
+    s.score_global,
+    s.score_performance_viabilidade,
+    p.posicao_geral as ranking_geral,
+    p.posicao_setor as ranking_setor
+FROM posicoes_startups p
+JOIN startups s ON s.id = p.startup_id
+WHERE p.metrica = 'Score_Performance_Viabilidade'
+ORDER BY p.posicao_geral, s.setor, s.id
+"""
+
+# Bancos antigos, sem posicoes_startups: funções de janela sobre startups
+QUERY_RANKING = """
+SELECT 
+    s.nome_startup,
+    s.setor,
+    s.status,
+    s.score_global,
+    s.score_performance_viabilidade,
+    RANK() OVER (ORDER BY s.score_performance_viabilidade DESC) as ranking_geral,
+    RANK() OVER (PARTITION BY s.setor ORDER BY s.score_performance_viabilidade DESC) as ranking_setor
+FROM startups s
+WHERE s.status = 'Ativa'
+ORDER BY s.score_performance_viabilidade DESC
+"""
+
+
+@cronometrado(categoria='exportacao')
+def exportar_para_powerbi(db_path='technova_iot.db', output_dir='powerbi_export', parquet=False,
+                          forcar=False):
     """
     Exporta todas as tabelas do banco SQLite para CSV otimizado para Power BI
     
+    As sete exportações rodam em paralelo (ver motor_exportacao.py), cada
+    uma com sua própria conexão somente leitura e gravando em blocos.
+    Arquivos cujas tabelas de origem não mudaram desde a última exportação
+    (segundo powerbi_export/manifesto_exportacao.json) não são regravados.
+    
     Args:
         db_path: Caminho para o banco de dados SQLite
         output_dir: Diretório de saída para os arquivos CSV
+        parquet: Se True, grava também arquivos .parquet (requer pyarrow)
+        forcar: Se True, regrava todos os arquivos
     """
     print("=" * 80)
     print("EXPORTAÇÃO DE DADOS PARA POWER BI")
@@ -32,8 +151,17 @@ def exportar_para_powerbi(db_path='technova_iot.db', output_dir='powerbi_export'
     output_path.mkdir(exist_ok=True)
     print(f"✓ Diretório de saída: {output_path.absolute()}")
     
-    # Conectar ao banco
-    conn = sqlite3.connect(db_path)
+    # Verificar se as tabelas materializadas existem (bancos antigos usam o
+    # pivot e as funções de janela)
+    with secao('verificar tabelas materializadas', 'exportacao'):
+        conn = conectar_somente_leitura(db_path)
+        materializadas = {nome for nome, in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name IN ('startups_completo', 'posicoes_startups')"
+        )}
+        conn.close()
+    tem_tabela_larga = 'startups_completo' in materializadas
+    tem_posicoes = 'posicoes_startups' in materializadas
     print(f"✓ Conectado ao banco: {db_path}")
     
     # Lista de tabelas para exportar
@@ -43,111 +171,65 @@ def exportar_para_powerbi(db_path='technova_iot.db', output_dir='powerbi_export'
         'avaliacoes_detalhadas': 'Avaliações detalhadas por critério',
         'estatisticas_setor': 'Estatísticas agregadas por setor'
     }
+    consultas = {'startups': QUERY_STARTUPS}
+    tarefas = [
+        TarefaExportacao(tabela, tabela, f"powerbi_{tabela}",
+                         consultas.get(tabela, f"SELECT * FROM {tabela}"), (tabela,))
+        for tabela in tabelas
+    ]
     
-    print("\n📊 EXPORTANDO TABELAS...")
-    print("-" * 80)
-    
-    arquivos_gerados = []
-    
-    for tabela, descricao in tabelas.items():
-        try:
-            # Ler dados da tabela
-            df = pd.read_sql_query(f"SELECT * FROM {tabela}", conn)
-            
-            # Nome do arquivo de saída
-            arquivo_csv = output_path / f"powerbi_{tabela}.csv"
-            
-            # Exportar para CSV
-            # UTF-8 com BOM para compatibilidade com Power BI
-            df.to_csv(
-                arquivo_csv, 
-                index=False, 
-                encoding='utf-8-sig',
-                date_format='%Y-%m-%d %H:%M:%S'
-            )
-            
-            arquivos_gerados.append(arquivo_csv)
-            
-            print(f"✓ {tabela:25s} → {arquivo_csv.name:30s} ({len(df):4d} registros)")
-            
-        except Exception as e:
-            print(f"✗ Erro ao exportar {tabela}: {e}")
-    
-    # Criar arquivo de view consolidada para análise rápida
-    print("\n📈 CRIANDO VIEWS CONSOLIDADAS...")
-    print("-" * 80)
-    
-    # View 1: Startups com todas as dimensões (formato largo)
-    query_wide = """
-    SELECT 
-        s.id,
-        s.nome_startup,
-        s.setor,
-        s.status,
-        s.score_global,
-        s.score_performance_viabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
-    FROM startups s
-    LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
-    GROUP BY s.id, s.nome_startup, s.setor, s.status, s.score_global, s.score_performance_viabilidade
-    """
-    
-    df_wide = pd.read_sql_query(query_wide, conn)
-    arquivo_wide = output_path / "powerbi_startups_completo.csv"
-    df_wide.to_csv(arquivo_wide, index=False, encoding='utf-8-sig')
-    arquivos_gerados.append(arquivo_wide)
-    print(f"✓ View Consolidada (Largo)  → {arquivo_wide.name:30s} ({len(df_wide):4d} registros)")
-    
-    # View 2: Análise por setor com métricas
-    query_setor = """
-    SELECT 
-        s.setor,
-        s.status,
-        COUNT(*) as quantidade,
-        ROUND(AVG(s.score_global), 2) as score_medio,
-        ROUND(MIN(s.score_global), 2) as score_min,
-        ROUND(MAX(s.score_global), 2) as score_max,
-        ROUND(AVG(s.score_performance_viabilidade), 2) as perf_viab_medio
-    FROM startups s
-    GROUP BY s.setor, s.status
-    """
+    # Views consolidadas para análise rápida
+    tarefas += [
+        TarefaExportacao('startups_completo', 'View Consolidada (Largo)', 'powerbi_startups_completo',
+                         QUERY_WIDE_MATERIALIZADA if tem_tabela_larga else QUERY_WIDE,
+                         ('startups_completo',) if tem_tabela_larga else ('startups', 'avaliacoes_dimensoes')),
+        TarefaExportacao('analise_setor', 'Análise por Setor', 'powerbi_analise_setor', QUERY_SETOR,
+                         ('startups',)),
+        TarefaExportacao('ranking_startups', 'Ranking de Startups', 'powerbi_ranking_startups',
+                         QUERY_RANKING_MATERIALIZADO if tem_posicoes else QUERY_RANKING,
+                         ('startups', 'posicoes_startups') if tem_posicoes else ('startups',)),
+    ]
     
-    df_setor = pd.read_sql_query(query_setor, conn)
-    arquivo_setor = output_path / "powerbi_analise_setor.csv"
-    df_setor.to_csv(arquivo_setor, index=False, encoding='utf-8-sig')
-    arquivos_gerados.append(arquivo_setor)
-    print(f"✓ Análise por Setor          → {arquivo_setor.name:30s} ({len(df_setor):4d} registros)")
-    
-    # View 3: Ranking de startups
-    query_ranking = """
-    SELECT 
-        s.nome_startup,
-        s.setor,
-        s.status,
-        s.score_global,
-        s.score_performance_viabilidade,
-        RANK() OVER (ORDER BY s.score_performance_viabilidade DESC) as ranking_geral,
-        RANK() OVER (PARTITION BY s.setor ORDER BY s.score_performance_viabilidade DESC) as ranking_setor
-    FROM startups s
-    WHERE s.status = 'Ativa'
-    ORDER BY s.score_performance_viabilidade DESC
-    """
+    # As exportações desatualizadas rodam ao mesmo tempo, cada uma com sua conexão
+    formatos = ('csv', 'parquet') if parquet else ('csv',)
+    inicio = time.perf_counter()
+    try:
+        with secao('exportar arquivos', 'exportacao') as medida:
+            resultados = exportar_alteradas(db_path, tarefas, output_path, formatos=formatos, forcar=forcar)
+            medida.linhas = sum(resultado.registros for resultado in resultados)
+            # Cada exportação roda em uma thread do pool: o trace recebe a
+            # duração informada por ela, na linha da thread que a executou
+            for resultado in resultados:
+                if not resultado.reaproveitado:
+                    registrar_evento(f"exportar {resultado.tarefa.nome}", resultado.segundos, 'exportacao',
+                                     linhas=resultado.registros, inicio=inicio, tid=resultado.thread)
+    except (ImportError, ValueError) as e:
+        print(f"✗ {e}")
+        return False
+    duracao = time.perf_counter() - inicio
     
-    df_ranking = pd.read_sql_query(query_ranking, conn)
-    arquivo_ranking = output_path / "powerbi_ranking_startups.csv"
-    df_ranking.to_csv(arquivo_ranking, index=False, encoding='utf-8-sig')
-    arquivos_gerados.append(arquivo_ranking)
-    print(f"✓ Ranking de Startups        → {arquivo_ranking.name:30s} ({len(df_ranking):4d} registros)")
+    arquivos_gerados = []
+    for i, resultado in enumerate(resultados):
+        if i == 0:
+            print("\n📊 EXPORTANDO TABELAS...")
+            print("-" * 80)
+        elif i == len(tabelas):
+            print("\n📈 CRIANDO VIEWS CONSOLIDADAS...")
+            print("-" * 80)
+        
+        tarefa = resultado.tarefa
+        if resultado.erro is not None:
+            print(f"✗ Erro ao exportar {tarefa.nome}: {resultado.erro}")
+            continue
+        arquivos_gerados.extend(resultado.arquivos)
+        nome_arquivo = resultado.arquivos[0].name
+        situacao = " - inalterado" if resultado.reaproveitado else ""
+        print(f"✓ {tarefa.rotulo:25s} → {nome_arquivo:30s} ({resultado.registros:4d} registros{situacao})")
     
-    # Fechar conexão
-    conn.close()
+    refeitas = [resultado for resultado in resultados if not resultado.reaproveitado]
+    soma = sum(resultado.segundos for resultado in refeitas)
+    print(f"\n⏱ {len(refeitas)} exportações em {duracao:.3f}s (soma individual: {soma:.3f}s), "
+          f"{len(resultados) - len(refeitas)} arquivos inalterados")
     
     # Resumo
     print("\n" + "=" * 80)
@@ -174,6 +256,7 @@ def exportar_para_powerbi(db_path='technova_iot.db', output_dir='powerbi_export'
     return True
 
 
+@cronometrado(categoria='exportacao')
 def criar_arquivo_conexao_python():
     """Cria arquivo Python para usar no Power BI"""
     script_content = """# Script Python para Power BI
@@ -188,28 +271,56 @@ db_path = r'c:\\Users\\Eduar\\Desktop\\Case_TechNova_Dados\\technova_iot.db'
 # Conectar ao banco
 conn = sqlite3.connect(db_path)
 
-# Carregar tabelas
-startups = pd.read_sql_query("SELECT * FROM startups", conn)
+# Carregar tabelas (startups sem as colunas de controle da importação incremental)
+startups = pd.read_sql_query('''
+    SELECT id, nome_startup, setor, status, score_global, score_performance_viabilidade, data_cadastro
+    FROM startups
+''', conn)
 avaliacoes_dimensoes = pd.read_sql_query("SELECT * FROM avaliacoes_dimensoes", conn)
 avaliacoes_detalhadas = pd.read_sql_query("SELECT * FROM avaliacoes_detalhadas", conn)
 estatisticas_setor = pd.read_sql_query("SELECT * FROM estatisticas_setor", conn)
 
-# View consolidada
-startups_completo = pd.read_sql_query('''
-    SELECT 
-        s.*,
-        MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
-    FROM startups s
-    LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
-    GROUP BY s.id
-''', conn)
+# View consolidada (uma linha por startup, com as 8 dimensões), com as
+# dimensões lidas da tabela materializada pelo importador em
+# criar_banco_dados.py; as notas dos critérios estão em avaliacoes_detalhadas
+tem_tabela_larga = conn.execute(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'startups_completo'"
+).fetchone()
+
+if tem_tabela_larga:
+    startups_completo = pd.read_sql_query('''
+        SELECT
+            s.id, s.nome_startup, s.setor, s.status, s.score_global,
+            s.score_performance_viabilidade, s.data_cadastro,
+            c.performance_tecnica, c.viabilidade_economica, c.confiabilidade, c.usabilidade,
+            c.eficiencia_energetica, c.robustez_fisica, c.conectividade, c.sustentabilidade
+        FROM startups s
+        LEFT JOIN startups_completo c ON c.id = s.id
+        ORDER BY s.id
+    ''', conn)
+else:
+    # Bancos antigos, sem a tabela startups_completo: pivot das dimensões
+    startups_completo = pd.read_sql_query('''
+        SELECT
+            s.id, s.nome_startup, s.setor, s.status, s.score_global,
+            s.score_performance_viabilidade, s.data_cadastro,
+            MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
+        FROM startups s
+        LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        GROUP BY s.id
+    ''', conn)
+
+# Posições de cada startup ativa (geral, no setor e percentis) por métrica,
+# pré-calculadas pelo importador
+if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posicoes_startups'").fetchone():
+    posicoes_startups = pd.read_sql_query("SELECT * FROM posicoes_startups", conn)
 
 conn.close()
 
@@ -223,8 +334,11 @@ conn.close()
 
 
 if __name__ == "__main__":
-    # Executar exportação
-    sucesso = exportar_para_powerbi()
+    # Executar exportação (use --parquet para gerar também arquivos .parquet
+    # e --forcar para regravar mesmo os arquivos inalterados; --trace ARQUIVO,
+    # --tempos, --tracemalloc e --perfil DIR ligam a instrumentação)
+    configurar_por_argumentos()
+    sucesso = exportar_para_powerbi(parquet='--parquet' in sys.argv, forcar='--forcar' in sys.argv)
     
     if sucesso:
         # Criar script de conexão Python
@@ -0,0 +1,445 @@
+"""
+Instrumentação das Etapas - TechNova IoT
+Mede duração, memória (RSS e tracemalloc) e linhas processadas de cada
+seção dos scripts e grava um trace legível por máquina (JSON lines ou
+formato Chrome trace) para comparar execuções
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import atexit
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from utilitarios import valor_opcao
+
+# Estado global da instrumentação; desativada, cada seção custa apenas
+# uma verificação de `ativo`
+_CONFIG = {
+    'ativo': False,
+    'trace': None,
+    'resumo': False,
+    'tracemalloc': False,
+    'diretorio_perfil': None,
+}
+_EVENTOS = []
+_PILHA = threading.local()
+_ORIGEM = time.perf_counter()
+_FINALIZACAO_REGISTRADA = []
+
+# Linhas exibidas no resumo impresso ao final (--tempos)
+LIMITE_RESUMO = 25
+
+
+def configurar(trace=None, resumo=False, usar_tracemalloc=False, diretorio_perfil=None):
+    """
+    Ativa a instrumentação
+
+    Args:
+        trace: Arquivo do trace gravado ao final (.json: formato Chrome
+               trace, aberto em chrome://tracing ou ui.perfetto.dev; outra
+               extensão: uma linha JSON por seção)
+        resumo: Se True, imprime ao final o tempo acumulado por seção
+        usar_tracemalloc: Se True, registra a memória alocada pelo Python
+                          em cada seção (deixa a execução mais lenta)
+        diretorio_perfil: Se informado, grava um .prof do cProfile para
+                          cada seção de primeiro nível
+    """
+    _CONFIG.update(ativo=True, trace=trace, resumo=resumo, tracemalloc=usar_tracemalloc,
+                   diretorio_perfil=diretorio_perfil)
+    if usar_tracemalloc and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if diretorio_perfil:
+        Path(diretorio_perfil).mkdir(parents=True, exist_ok=True)
+    if not _FINALIZACAO_REGISTRADA:
+        atexit.register(finalizar)
+        _FINALIZACAO_REGISTRADA.append(True)
+
+
+def configurar_por_argumentos(argv=None):
+    """
+    Ativa a instrumentação a partir da linha de comando:
+    --trace ARQUIVO, --tempos, --tracemalloc e --perfil DIRETORIO
+
+    Returns:
+        True se alguma opção de instrumentação foi informada
+    """
+    argv = sys.argv if argv is None else argv
+    trace = valor_opcao('--trace', argv=argv)
+    diretorio_perfil = valor_opcao('--perfil', argv=argv)
+    resumo = '--tempos' in argv
+    usar_tracemalloc = '--tracemalloc' in argv
+    if not (trace or diretorio_perfil or resumo or usar_tracemalloc):
+        return False
+    configurar(trace, resumo, usar_tracemalloc, diretorio_perfil)
+    return True
+
+
+def ativo():
+    """True se a instrumentação está ligada"""
+    return _CONFIG['ativo']
+
+
+def _rss_atual_kb():
+    """Memória residente atual do processo (só Linux; None nos demais)"""
+    try:
+        with open('/proc/self/statm') as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _rss_pico_kb():
+    """Pico de memória residente do processo (None no Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+def _pilha():
+    if not hasattr(_PILHA, 'secoes'):
+        _PILHA.secoes = []
+    return _PILHA.secoes
+
+
+def _nome_arquivo(nome):
+    return re.sub(r'[^\w.-]+', '_', nome).strip('_') or 'secao'
+
+
+class Secao:
+    """
+    Seção medida com `with`: duração, RSS, memória do tracemalloc, linhas
+    processadas (atributo `linhas`, que pode ser atribuído dentro do
+    bloco) e, nas seções de primeiro nível, perfil do cProfile
+    """
+
+    def __init__(self, nome, categoria='geral', linhas=None):
+        self.nome = nome
+        self.categoria = categoria
+        self.linhas = linhas
+        self.duracao = None
+
+    def __enter__(self):
+        self._registrar = _CONFIG['ativo']
+        if self._registrar:
+            pilha = _pilha()
+            self.pai = pilha[-1].nome if pilha else None
+            self.profundidade = len(pilha)
+            self.pico_filhos = 0
+            self.rss_inicio = _rss_atual_kb()
+            self.rss_pico_inicio = _rss_pico_kb()
+            if _CONFIG['tracemalloc'] and tracemalloc.is_tracing():
+                self.memoria_inicio, pico = tracemalloc.get_traced_memory()
+                if pilha:
+                    pilha[-1].pico_filhos = max(pilha[-1].pico_filhos, pico)
+                tracemalloc.reset_peak()
+            self.perfil = None
+            # cProfile admite um perfil ativo por vez: só as seções de
+            # primeiro nível da thread principal são perfiladas
+            if (_CONFIG['diretorio_perfil'] and not pilha
+                    and threading.current_thread() is threading.main_thread()):
+                import cProfile
+                self.perfil = cProfile.Profile()
+                self.perfil.enable()
+            pilha.append(self)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, erro, rastreamento):
+        fim = time.perf_counter()
+        self.duracao = fim - self.inicio
+        if not self._registrar:
+            return False
+
+        pilha = _pilha()
+        if pilha and pilha[-1] is self:
+            pilha.pop()
+        evento = {
+            'nome': self.nome,
+            'categoria': self.categoria,
+            'inicio_ms': round((self.inicio - _ORIGEM) * 1000, 3),
+            'duracao_ms': round(self.duracao * 1000, 3),
+            'profundidade': self.profundidade,
+            'pai': self.pai,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'linhas': self.linhas,
+        }
+
+        rss_fim = _rss_atual_kb()
+        rss_pico = _rss_pico_kb()
+        evento['rss_kb'] = rss_fim
+        evento['rss_delta_kb'] = None if rss_fim is None or self.rss_inicio is None else rss_fim - self.rss_inicio
+        evento['rss_pico_kb'] = rss_pico
+        evento['rss_pico_delta_kb'] = (None if rss_pico is None or self.rss_pico_inicio is None
+                                       else rss_pico - self.rss_pico_inicio)
+
+        if hasattr(self, 'memoria_inicio') and tracemalloc.is_tracing():
+            # reset_peak() das seções internas apaga o pico desta; por isso o
+            # pico anterior a cada reset é repassado à seção de fora
+            atual, pico = tracemalloc.get_traced_memory()
+            pico = max(pico, self.pico_filhos)
+            evento['memoria_delta_kb'] = round((atual - self.memoria_inicio) / 1024, 1)
+            evento['memoria_pico_kb'] = round((pico - self.memoria_inicio) / 1024, 1)
+            if pilha:
+                pilha[-1].pico_filhos = max(pilha[-1].pico_filhos, pico)
+
+        if self.perfil is not None:
+            self.perfil.disable()
+            destino = Path(_CONFIG['diretorio_perfil']) / f"{len(_EVENTOS):04d}_{_nome_arquivo(self.nome)}.prof"
+            self.perfil.dump_stats(destino)
+            evento['perfil'] = str(destino)
+
+        if erro is not None:
+            evento['erro'] = f"{tipo.__name__}: {erro}"
+        _EVENTOS.append(evento)
+        return False
+
+
+def secao(nome, categoria='geral', linhas=None):
+    """Atalho para `with Secao(...)`"""
+    return Secao(nome, categoria, linhas)
+
+
+def _contar_linhas(resultado):
+    """Número de linhas de um DataFrame/array devolvido por uma função medida"""
+    forma = getattr(resultado, 'shape', None)
+    return int(forma[0]) if forma else None
+
+
+def cronometrado(nome=None, categoria='geral'):
+    """
+    Decorador que mede cada chamada da função como uma seção; quando a
+    função devolve um DataFrame, o número de linhas é registrado
+    """
+    def decorador(funcao):
+        rotulo = nome or funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            if not _CONFIG['ativo']:
+                return funcao(*args, **kwargs)
+            with Secao(rotulo, categoria) as medida:
+                resultado = funcao(*args, **kwargs)
+                medida.linhas = _contar_linhas(resultado)
+            return resultado
+        return envoltorio
+    return decorador
+
+
+def instrumentar_metodos(categoria):
+    """
+    Decorador de classe: mede todos os métodos definidos na classe (exceto
+    os especiais, como __init__)
+    """
+    def decorador(classe):
+        for nome, atributo in list(vars(classe).items()):
+            if callable(atributo) and not nome.startswith('__'):
+                setattr(classe, nome, cronometrado(f'{classe.__name__}.{nome}', categoria)(atributo))
+        return classe
+    return decorador
+
+
+def medir_iteracao(iteravel, nome, categoria='geral'):
+    """
+    Repassa os itens de `iteravel` medindo a produção de cada um como uma
+    seção (ex.: a leitura de cada bloco da planilha)
+    """
+    iterador = iter(iteravel)
+    if not _CONFIG['ativo']:
+        yield from iterador
+        return
+    fim = object()
+    while True:
+        with Secao(nome, categoria) as medida:
+            item = next(iterador, fim)
+            medida.linhas = 0 if item is fim else _contar_linhas(item)
+        if item is fim:
+            return
+        yield item
+
+
+def registrar_evento(nome, segundos, categoria='geral', linhas=None, inicio=None, tid=None):
+    """
+    Registra uma medida feita fora de uma Secao (ex.: a duração informada
+    por um processo de trabalho)
+
+    Args:
+        inicio: Instante de início (time.perf_counter()); padrão: agora - segundos
+        tid: Identificador da linha no trace (padrão: a thread atual)
+    """
+    if not _CONFIG['ativo']:
+        return
+    if inicio is None:
+        inicio = time.perf_counter() - segundos
+    pilha = _pilha()
+    _EVENTOS.append({
+        'nome': nome,
+        'categoria': categoria,
+        'inicio_ms': round((inicio - _ORIGEM) * 1000, 3),
+        'duracao_ms': round(segundos * 1000, 3),
+        'profundidade': len(pilha),
+        'pai': pilha[-1].nome if pilha else None,
+        'pid': os.getpid(),
+        'tid': threading.get_ident() if tid is None else tid,
+        'linhas': linhas,
+    })
+
+
+class Sequencia:
+    """
+    Seções consecutivas sem aninhar o código: iniciar() encerra a seção
+    anterior e abre a próxima (usado nas etapas numeradas das análises)
+    """
+
+    def __init__(self, categoria='geral'):
+        self.categoria = categoria
+        self.atual = None
+
+    def iniciar(self, nome, linhas=None):
+        """Encerra a seção em andamento (se houver) e inicia `nome`"""
+        self.encerrar()
+        self.atual = Secao(nome, self.categoria, linhas).__enter__()
+        return self.atual
+
+    def encerrar(self):
+        """Encerra a seção em andamento"""
+        if self.atual is not None:
+            self.atual.__exit__(None, None, None)
+            self.atual = None
+
+
+def eventos():
+    """Cópia dos eventos registrados até agora"""
+    return list(_EVENTOS)
+
+
+def gravar_trace(caminho, lista_eventos=None):
+    """
+    Grava os eventos em `caminho`: formato Chrome trace se a extensão for
+    .json, senão uma linha JSON por evento
+    """
+    lista_eventos = _EVENTOS if lista_eventos is None else lista_eventos
+    if Path(caminho).suffix.lower() == '.json':
+        campos_base = {'nome', 'categoria', 'inicio_ms', 'duracao_ms', 'pid', 'tid'}
+        conteudo = {'traceEvents': [
+            {
+                'name': e['nome'], 'cat': e['categoria'], 'ph': 'X',
+                'ts': round(e['inicio_ms'] * 1000), 'dur': round(e['duracao_ms'] * 1000),
+                'pid': e['pid'], 'tid': e['tid'],
+                'args': {k: v for k, v in e.items() if k not in campos_base and v is not None},
+            }
+            for e in lista_eventos
+        ], 'displayTimeUnit': 'ms'}
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(conteudo, f, ensure_ascii=False)
+    else:
+        with open(caminho, 'w', encoding='utf-8') as f:
+            for evento in lista_eventos:
+                f.write(json.dumps(evento, ensure_ascii=False) + '\n')
+
+
+def carregar_trace(caminho):
+    """Lê um trace gravado por gravar_trace (qualquer dos dois formatos)"""
+    with open(caminho, encoding='utf-8') as f:
+        if Path(caminho).suffix.lower() == '.json':
+            return [
+                {'nome': e['name'], 'categoria': e.get('cat', 'geral'),
+                 'inicio_ms': e['ts'] / 1000, 'duracao_ms': e['dur'] / 1000, **e.get('args', {})}
+                for e in json.load(f)['traceEvents'] if e.get('ph') == 'X'
+            ]
+        return [json.loads(linha) for linha in f if linha.strip()]
+
+
+def totais_por_secao(lista_eventos):
+    """{(categoria, nome): [chamadas, total_ms, maior_ms]}, na ordem de aparição"""
+    totais = {}
+    for evento in lista_eventos:
+        total = totais.setdefault((evento['categoria'], evento['nome']), [0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += evento['duracao_ms']
+        total[2] = max(total[2], evento['duracao_ms'])
+    return totais
+
+
+def imprimir_resumo(lista_eventos=None, limite=LIMITE_RESUMO):
+    """Imprime as seções com maior tempo acumulado"""
+    totais = totais_por_secao(_EVENTOS if lista_eventos is None else lista_eventos)
+    if not totais:
+        return
+    print("\n" + "=" * 80)
+    print("⏱ TEMPO POR SEÇÃO")
+    print("=" * 80)
+    print(f"{'Seção':<52} {'Chamadas':>8} {'Total (ms)':>10} {'Maior (ms)':>10}")
+    print("-" * 80)
+    ordenados = sorted(totais.items(), key=lambda item: item[1][1], reverse=True)
+    for (categoria, nome), (chamadas, total, maior) in ordenados[:limite]:
+        print(f"{f'[{categoria}] {nome}'[:52]:<52} {chamadas:>8} {total:>10.1f} {maior:>10.1f}")
+    if len(ordenados) > limite:
+        print(f"... e mais {len(ordenados) - limite} seções")
+
+
+def finalizar():
+    """Grava o trace e imprime o resumo configurados (chamada ao sair do processo)"""
+    if not _CONFIG['ativo']:
+        return
+    if _CONFIG['trace']:
+        gravar_trace(_CONFIG['trace'])
+        print(f"✓ Trace gravado: {_CONFIG['trace']} ({len(_EVENTOS)} seções)")
+    if _CONFIG['resumo']:
+        imprimir_resumo()
+    _CONFIG['ativo'] = False
+
+
+def comparar_traces(caminho_a, caminho_b):
+    """
+    Compara o tempo acumulado de cada seção entre dois traces
+
+    Returns:
+        Lista de (categoria, nome, total_ms_a, total_ms_b), com None
+        quando a seção não aparece em um dos traces
+    """
+    totais_a = totais_por_secao(carregar_trace(caminho_a))
+    totais_b = totais_por_secao(carregar_trace(caminho_b))
+    chaves = list(totais_a) + [chave for chave in totais_b if chave not in totais_a]
+    return [
+        (categoria, nome,
+         totais_a[(categoria, nome)][1] if (categoria, nome) in totais_a else None,
+         totais_b[(categoria, nome)][1] if (categoria, nome) in totais_b else None)
+        for categoria, nome in chaves
+    ]
+
+
+def main():
+    """Uso: python instrumentacao.py antes.jsonl depois.jsonl"""
+    if len(sys.argv) < 3:
+        print(main.__doc__)
+        sys.exit(1)
+    print(f"{'Seção':<52} {'Antes (ms)':>10} {'Depois (ms)':>11} {'Variação':>9}")
+    print("-" * 86)
+    for categoria, nome, antes, depois in comparar_traces(sys.argv[1], sys.argv[2]):
+        rotulo = f'[{categoria}] {nome}'[:52]
+        if antes is None or depois is None:
+            texto_antes = '-' if antes is None else f'{antes:.1f}'
+            texto_depois = '-' if depois is None else f'{depois:.1f}'
+            print(f"{rotulo:<52} {texto_antes:>10} {texto_depois:>11} {'-':>9}")
+        else:
+            variacao = (depois - antes) / antes if antes > 0 else 0.0
+            print(f"{rotulo:<52} {antes:>10.1f} {depois:>11.1f} {variacao:>+9.1%}")
+
+
+if __name__ == "__main__":
+    main()
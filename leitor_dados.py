@@ -0,0 +1,173 @@
+"""
+Leitor de Dados em Blocos - TechNova IoT
+Lê a planilha de avaliações (Excel ou CSV) em blocos de tamanho fixo,
+sem carregar o arquivo inteiro na memória
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+# pandas é importado dentro das funções de leitura: quem só precisa das
+# constantes e de eh_coluna_nota (ex.: o banco) não paga a sua importação
+ABA_AVALIACOES = 'Avaliacoes_Startups'
+TAMANHO_BLOCO_PADRAO = 5000
+
+
+def eh_coluna_nota(coluna):
+    """Indica se a coluna é um critério de avaliação (ex.: '1.1_precisao_basica')"""
+    return isinstance(coluna, str) and coluna[:1].isdigit() and '.' in coluna
+
+
+def listar_abas(caminho):
+    """Lista as abas de um arquivo Excel sem carregar seu conteúdo"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(caminho, read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def compactar_notas(df, dtype_notas=np.uint8):
+    """
+    Converte as colunas de critérios para tipos numéricos compactos
+
+    As notas são inteiras de 1 a 5 e cabem em uint8. Se um bloco tiver
+    valores ausentes ou fracionários, as colunas do bloco usam float32.
+
+    Args:
+        df: DataFrame com as colunas de critérios
+        dtype_notas: Tipo preferencial das notas (np.uint8 ou np.float32)
+    """
+    import pandas as pd
+
+    colunas_notas = [col for col in df.columns if eh_coluna_nota(col)]
+    if not colunas_notas:
+        return df
+
+    matriz = df[colunas_notas].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+    inteiras = (
+        np.dtype(dtype_notas) == np.uint8
+        and not np.isnan(matriz).any()
+        and np.array_equal(matriz, np.round(matriz))
+        and (matriz.size == 0 or (matriz.min() >= 0 and matriz.max() <= 255))
+    )
+    matriz = matriz.astype(np.uint8) if inteiras else matriz
+
+    notas = pd.DataFrame(matriz, columns=colunas_notas, index=df.index)
+    outras = [col for col in df.columns if col not in colunas_notas]
+    return pd.concat([df[outras], notas], axis=1)[list(df.columns)]
+
+
+def _montar_bloco(linhas, colunas, inicio):
+    """Cria o DataFrame de um bloco, com células vazias como NaN (igual ao read_excel)"""
+    import pandas as pd
+
+    largura = len(colunas)
+    bloco = pd.DataFrame.from_records(
+        [linha[:largura] for linha in linhas], columns=colunas,
+        index=pd.RangeIndex(inicio, inicio + len(linhas))
+    )
+    return bloco.fillna(np.nan).infer_objects()
+
+
+def _blocos_excel(caminho, aba, tamanho_bloco):
+    """
+    Gera DataFrames brutos a partir de uma aba do Excel (openpyxl read-only)
+
+    Segue as convenções do pd.read_excel: linhas em branco no meio da aba
+    são mantidas, linhas em branco no final são descartadas e colunas sem
+    cabeçalho no fim da aba só são mantidas se tiverem valores no primeiro
+    bloco.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        linhas = wb[aba].iter_rows(values_only=True)
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        colunas = [
+            col if col is not None else f'Unnamed: {i}'
+            for i, col in enumerate(cabecalho)
+        ]
+        sem_nome = [col is None for col in cabecalho]
+
+        buffer = []
+        brancas_pendentes = []
+        inicio = 0
+        for linha in linhas:
+            if all(valor is None for valor in linha):
+                brancas_pendentes.append(linha)
+                continue
+            buffer.extend(brancas_pendentes)
+            brancas_pendentes = []
+            buffer.append(linha)
+            if len(buffer) >= tamanho_bloco:
+                if inicio == 0:
+                    colunas = _aparar_colunas(colunas, sem_nome, buffer)
+                yield _montar_bloco(buffer[:tamanho_bloco], colunas, inicio)
+                inicio += tamanho_bloco
+                buffer = buffer[tamanho_bloco:]
+
+        if buffer:
+            if inicio == 0:
+                colunas = _aparar_colunas(colunas, sem_nome, buffer)
+            yield _montar_bloco(buffer, colunas, inicio)
+    finally:
+        wb.close()
+
+
+def _aparar_colunas(colunas, sem_nome, linhas):
+    """Remove colunas finais sem cabeçalho e sem nenhum valor nas linhas dadas"""
+    largura = len(colunas)
+    while largura and sem_nome[largura - 1] and all(
+        len(linha) < largura or linha[largura - 1] is None for linha in linhas
+    ):
+        largura -= 1
+    return colunas[:largura]
+
+
+def ler_em_blocos(caminho, aba=ABA_AVALIACOES, tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                  dtype_notas=np.uint8):
+    """
+    Lê a planilha em blocos de até `tamanho_bloco` linhas
+
+    Arquivos .csv são lidos com `pd.read_csv(chunksize=...)`; os demais
+    são abertos com openpyxl em modo somente leitura. O pico de memória
+    depende do tamanho do bloco, não do total de linhas.
+
+    Args:
+        caminho: Caminho para o arquivo Excel ou CSV
+        aba: Nome da aba (ignorado para CSV)
+        tamanho_bloco: Número máximo de linhas por bloco
+        dtype_notas: Tipo preferencial das colunas de critérios
+
+    Yields:
+        DataFrame com as linhas do bloco e critérios compactados
+    """
+    if Path(caminho).suffix.lower() == '.csv':
+        import pandas as pd
+        blocos = pd.read_csv(caminho, chunksize=tamanho_bloco)
+    else:
+        blocos = _blocos_excel(caminho, aba, tamanho_bloco)
+
+    for bloco in blocos:
+        yield compactar_notas(bloco, dtype_notas)
+
+
+def ler_avaliacoes(caminho, aba=ABA_AVALIACOES, tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                   dtype_notas=np.uint8):
+    """Lê a planilha inteira, bloco a bloco, em um único DataFrame compacto"""
+    import pandas as pd
+
+    blocos = list(ler_em_blocos(caminho, aba, tamanho_bloco, dtype_notas))
+    if not blocos:
+        return pd.DataFrame()
+    return pd.concat(blocos, ignore_index=True)
@@ -0,0 +1,175 @@
+"""
+Motor de Estatísticas por Setor - TechNova IoT
+Calcula as estatísticas de todos os setores em uma única passada e as
+mantém atualizadas incrementalmente conforme startups entram, mudam ou
+são desativadas
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import math
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+# Mesma ordem das colunas da tabela estatisticas_setor
+EstatisticasSetor = namedtuple(
+    'EstatisticasSetor',
+    ['setor', 'total_startups', 'startups_ativas', 'startups_inativas',
+     'score_medio', 'score_mediano', 'score_min', 'score_max']
+)
+
+
+def calcular_estatisticas(df, coluna_score='Score_Global'):
+    """
+    Estatísticas de todos os setores com um único groupby
+
+    Args:
+        df: DataFrame com as colunas setor, status e `coluna_score`
+        coluna_score: Coluna com o score de cada startup
+
+    Returns:
+        Lista de EstatisticasSetor, na ordem em que os setores aparecem
+    """
+    setores = df['setor']
+    scores = df[coluna_score].astype(float).groupby(setores, sort=False)
+    status = df['status']
+    contagens = (
+        status.eq('Ativa').groupby(setores, sort=False).sum(),
+        status.eq('Inativa').groupby(setores, sort=False).sum(),
+    )
+    resumo = scores.agg(['size', 'mean', 'median', 'min', 'max'])
+
+    return [
+        EstatisticasSetor(setor, int(total), int(ativas), int(inativas),
+                          float(medio), float(mediano), float(minimo), float(maximo))
+        for setor, total, ativas, inativas, medio, mediano, minimo, maximo in zip(
+            resumo.index, resumo['size'], contagens[0].reindex(resumo.index),
+            contagens[1].reindex(resumo.index), resumo['mean'], resumo['median'],
+            resumo['min'], resumo['max']
+        )
+    ]
+
+
+def carregar_estatisticas(conn):
+    """EstatisticasIncrementais com o estado atual da tabela startups (uma leitura)"""
+    estatisticas = EstatisticasIncrementais()
+    estatisticas.carregar(conn.execute('SELECT setor, status, score_global FROM startups'))
+    return estatisticas
+
+
+class _AcumuladorSetor:
+    """Contagens, soma compensada e scores ordenados de um setor"""
+
+    def __init__(self):
+        self.total = self.ativas = self.inativas = 0
+        self.soma = self.compensacao = 0.0
+        self.ordenados = []
+
+    def _somar(self, valor):
+        # Soma de Neumaier: inserções e remoções sucessivas não acumulam erro
+        total = self.soma + valor
+        if abs(self.soma) >= abs(valor):
+            self.compensacao += (self.soma - total) + valor
+        else:
+            self.compensacao += (valor - total) + self.soma
+        self.soma = total
+
+    def alterar(self, status, score, sinal):
+        self.total += sinal
+        if status == 'Ativa':
+            self.ativas += sinal
+        elif status == 'Inativa':
+            self.inativas += sinal
+
+        if score is None or math.isnan(score):
+            return
+        if sinal > 0:
+            insort(self.ordenados, score)
+        else:
+            posicao = bisect_left(self.ordenados, score)
+            if posicao == len(self.ordenados) or self.ordenados[posicao] != score:
+                raise ValueError(f"Score {score} não está registrado no setor")
+            del self.ordenados[posicao]
+        self._somar(sinal * score)
+
+    def mediana(self):
+        n = len(self.ordenados)
+        meio = n // 2
+        if n % 2:
+            return self.ordenados[meio]
+        return (self.ordenados[meio - 1] + self.ordenados[meio]) / 2
+
+
+class EstatisticasIncrementais:
+    """
+    Estatísticas por setor mantidas a cada startup inserida, alterada ou
+    removida
+
+    Contagens e soma (para a média) são atualizadas em O(1); os scores de
+    cada setor ficam em uma lista ordenada, de onde mediana, mínimo e
+    máximo saem por posição. Inserir ou remover um score custa uma busca
+    binária mais o deslocamento da lista, sem recalcular o setor.
+    """
+
+    def __init__(self):
+        self.setores = {}
+
+    def carregar(self, registros):
+        """
+        Registra muitas startups de uma vez: os scores de cada setor são
+        ordenados uma única vez em vez de inseridos um a um
+
+        Args:
+            registros: Iterável de (setor, status, score)
+        """
+        por_setor = {}
+        for setor, status, score in registros:
+            por_setor.setdefault(setor, []).append((status, score))
+
+        for setor, linhas in por_setor.items():
+            acumulador = self.setores.setdefault(setor, _AcumuladorSetor())
+            novos = [score for _, score in linhas if score is not None and not math.isnan(score)]
+            acumulador.total += len(linhas)
+            acumulador.ativas += sum(1 for status, _ in linhas if status == 'Ativa')
+            acumulador.inativas += sum(1 for status, _ in linhas if status == 'Inativa')
+            acumulador.ordenados = sorted(acumulador.ordenados + novos)
+            acumulador._somar(math.fsum(novos))
+
+    def adicionar(self, setor, status, score):
+        """Registra uma startup"""
+        if setor not in self.setores:
+            self.setores[setor] = _AcumuladorSetor()
+        self.setores[setor].alterar(status, score, 1)
+
+    def remover(self, setor, status, score):
+        """Retira uma startup (mesmos valores com que foi registrada)"""
+        acumulador = self.setores[setor]
+        acumulador.alterar(status, score, -1)
+        if acumulador.total == 0:
+            del self.setores[setor]
+
+    def substituir(self, anterior, atual):
+        """Troca os valores (setor, status, score) de uma startup"""
+        self.remover(*anterior)
+        self.adicionar(*atual)
+
+    def estatisticas(self, setor):
+        """EstatisticasSetor do setor, ou None se ele não tem startups"""
+        acumulador = self.setores.get(setor)
+        if acumulador is None:
+            return None
+        nan = float('nan')
+        ordenados = acumulador.ordenados
+        if not ordenados:
+            return EstatisticasSetor(setor, acumulador.total, acumulador.ativas,
+                                     acumulador.inativas, nan, nan, nan, nan)
+        return EstatisticasSetor(
+            setor, acumulador.total, acumulador.ativas, acumulador.inativas,
+            (acumulador.soma + acumulador.compensacao) / len(ordenados),
+            acumulador.mediana(), ordenados[0], ordenados[-1]
+        )
+
+    def todas(self):
+        """EstatisticasSetor de todos os setores"""
+        return [self.estatisticas(setor) for setor in self.setores]
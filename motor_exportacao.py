@@ -0,0 +1,338 @@
+"""
+Motor de Exportação - TechNova IoT
+Executa as exportações do pacote Power BI em paralelo, cada uma com sua
+própria conexão SQLite somente leitura, gravando as linhas em blocos
+direto no disco (CSV e, se o pyarrow estiver instalado, Parquet). Um
+manifesto permite regerar apenas os arquivos desatualizados
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+
+from pool_conexoes import uri_somente_leitura
+from utilitarios import gravar_json_atomico, hash_arquivo
+
+FORMATOS_SUPORTADOS = ('csv', 'parquet')
+TAMANHO_BLOCO_EXPORTACAO = 50000
+ARQUIVO_MANIFESTO = 'manifesto_exportacao.json'
+VERSAO_MANIFESTO = 1
+
+# Uma exportação: consulta SQL, nome base do arquivo (sem extensão) e as
+# tabelas de origem cujas alterações tornam o arquivo desatualizado
+TarefaExportacao = namedtuple(
+    'TarefaExportacao',
+    ['nome', 'rotulo', 'arquivo', 'query', 'fontes'],
+    defaults=((),)
+)
+
+# `thread` é o identificador da thread que fez a exportação (None se reaproveitada)
+ResultadoExportacao = namedtuple(
+    'ResultadoExportacao',
+    ['tarefa', 'arquivos', 'registros', 'segundos', 'erro', 'reaproveitado', 'thread'],
+    defaults=(False, None)
+)
+
+
+def parquet_disponivel():
+    """Indica se o pyarrow (necessário para gravar Parquet) está instalado"""
+    return find_spec('pyarrow') is not None
+
+
+def conectar_somente_leitura(db_path):
+    """Abre uma conexão SQLite somente leitura (URI mode=ro)"""
+    return sqlite3.connect(uri_somente_leitura(db_path), uri=True, check_same_thread=False)
+
+
+class _GravadorCSV:
+    """Grava blocos em CSV UTF-8 com BOM (um único BOM e um único cabeçalho)"""
+
+    def __init__(self, arquivo):
+        self.arquivo = open(arquivo, 'w', encoding='utf-8-sig', newline='')
+        self.primeiro = True
+
+    def gravar(self, bloco):
+        bloco.to_csv(self.arquivo, index=False, header=self.primeiro,
+                     date_format='%Y-%m-%d %H:%M:%S')
+        self.primeiro = False
+
+    def fechar(self):
+        self.arquivo.close()
+
+
+class _GravadorParquet:
+    """Grava blocos como row groups de um arquivo Parquet (pyarrow)"""
+
+    def __init__(self, arquivo):
+        import pyarrow.parquet as pq
+
+        self._pq = pq
+        self.arquivo = arquivo
+        self.escritor = None
+        self.esquema = None
+
+    def gravar(self, bloco):
+        import pyarrow as pa
+
+        if self.escritor is None:
+            tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+            # Colunas totalmente nulas no primeiro bloco não definem o tipo
+            self.esquema = pa.schema([
+                campo.with_type(pa.string()) if pa.types.is_null(campo.type) else campo
+                for campo in tabela.schema
+            ])
+            self.escritor = self._pq.ParquetWriter(self.arquivo, self.esquema)
+        tabela = pa.Table.from_pandas(bloco, schema=self.esquema, preserve_index=False)
+        self.escritor.write_table(tabela)
+
+    def fechar(self):
+        if self.escritor is not None:
+            self.escritor.close()
+
+
+GRAVADORES = {
+    'csv': _GravadorCSV,
+    'parquet': _GravadorParquet,
+}
+
+
+def exportar_consulta(db_path, tarefa, output_dir, formatos=('csv',),
+                      tamanho_bloco=TAMANHO_BLOCO_EXPORTACAO):
+    """
+    Exporta o resultado de uma consulta, bloco a bloco, em cada formato
+
+    Abre sua própria conexão somente leitura, de modo que pode rodar em
+    paralelo com as demais exportações. Só um bloco fica em memória.
+
+    Returns:
+        ResultadoExportacao (com `erro` preenchido em caso de falha)
+    """
+    # pandas só é importado quando há algo a exportar: com todos os
+    # arquivos atualizados, exportar_alteradas responde apenas com sqlite3
+    import pandas as pd
+
+    inicio = time.perf_counter()
+    output_dir = Path(output_dir)
+    arquivos = [output_dir / f'{tarefa.arquivo}.{formato}' for formato in formatos]
+    gravadores = []
+    registros = 0
+
+    try:
+        conn = conectar_somente_leitura(db_path)
+        try:
+            gravadores = [GRAVADORES[formato](arquivo) for formato, arquivo in zip(formatos, arquivos)]
+            colunas = None
+            for bloco in pd.read_sql_query(tarefa.query, conn, chunksize=tamanho_bloco):
+                colunas = bloco.columns
+                for gravador in gravadores:
+                    gravador.gravar(bloco)
+                registros += len(bloco)
+            if colunas is None:
+                # Consulta sem linhas: grava ao menos o cabeçalho
+                vazio = pd.DataFrame(columns=[d[0] for d in conn.execute(tarefa.query).description])
+                for gravador in gravadores:
+                    gravador.gravar(vazio)
+        finally:
+            for gravador in gravadores:
+                gravador.fechar()
+            conn.close()
+    except Exception as e:
+        return ResultadoExportacao(tarefa, [], registros, time.perf_counter() - inicio, e,
+                                   thread=threading.get_ident())
+
+    return ResultadoExportacao(tarefa, arquivos, registros, time.perf_counter() - inicio, None,
+                               thread=threading.get_ident())
+
+
+def exportar_em_paralelo(db_path, tarefas, output_dir, formatos=('csv',), max_workers=None,
+                         tamanho_bloco=TAMANHO_BLOCO_EXPORTACAO):
+    """
+    Executa todas as exportações simultaneamente em um pool de threads
+
+    O SQLite e a escrita em disco liberam o GIL, então o tempo total fica
+    limitado pela exportação mais lenta e não pela soma de todas.
+
+    Args:
+        db_path: Caminho para o banco SQLite
+        tarefas: Lista de TarefaExportacao
+        output_dir: Diretório de saída
+        formatos: Formatos a gravar ('csv' e/ou 'parquet')
+        max_workers: Número de threads (padrão: uma por tarefa)
+        tamanho_bloco: Linhas lidas do banco por vez
+
+    Returns:
+        Lista de ResultadoExportacao, na mesma ordem de `tarefas`
+    """
+    desconhecidos = set(formatos) - set(FORMATOS_SUPORTADOS)
+    if desconhecidos:
+        raise ValueError(f"Formatos não suportados: {sorted(desconhecidos)}")
+    if 'parquet' in formatos and not parquet_disponivel():
+        raise ImportError("Exportação em Parquet requer o pacote pyarrow (pip install pyarrow)")
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(tarefas), 1)) as executor:
+        futuros = [
+            executor.submit(exportar_consulta, db_path, tarefa, output_dir, formatos, tamanho_bloco)
+            for tarefa in tarefas
+        ]
+        return [futuro.result() for futuro in futuros]
+
+
+def marcadores_alteracao(conn, tabelas):
+    """
+    Marcador de alteração de cada tabela: [linhas, maior rowid, versão, geração]
+
+    A versão vem de controle_alteracoes (incrementada pelo importador e,
+    em UPDATEs e DELETEs feitos fora dele, pelos triggers de versão) e
+    detecta atualizações que não mudam a contagem nem o maior id. A
+    geração, sorteada quando a tabela é registrada pela primeira vez,
+    distingue um banco apagado e recriado com outros dados, cujas
+    contagens e versões coincidem com as do anterior. Bancos sem essa
+    tabela usam apenas os dois primeiros valores. Visões (como
+    avaliacoes_detalhadas no modo compacto) não têm rowid e contá-las
+    exigiria decodificá-las: o marcador delas é só a versão e a geração.
+    """
+    controle = {}
+    colunas = [linha[1] for linha in conn.execute('PRAGMA table_info(controle_alteracoes)')]
+    if colunas:
+        geracao = 'geracao' if 'geracao' in colunas else 'NULL'
+        controle = {tabela: (versao, gerada) for tabela, versao, gerada in
+                    conn.execute(f'SELECT tabela, versao, {geracao} FROM controle_alteracoes')}
+
+    visoes = {nome for nome, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'view'")}
+
+    marcadores = {}
+    for tabela in sorted(set(tabelas)):
+        versao, geracao = controle.get(tabela, (None, None))
+        if tabela in visoes:
+            marcadores[tabela] = [None, None, versao, geracao]
+            continue
+        linhas, maior_id = conn.execute(f'SELECT COUNT(*), MAX(rowid) FROM "{tabela}"').fetchone()
+        marcadores[tabela] = [linhas, maior_id, versao, geracao]
+    return marcadores
+
+
+def hash_consulta(query):
+    """SHA-256 da consulta com os espaços normalizados"""
+    return hashlib.sha256(' '.join(query.split()).encode('utf-8')).hexdigest()
+
+
+def carregar_manifesto(output_dir):
+    """Lê o manifesto de exportação (vazio se ausente ou inválido)"""
+    try:
+        with open(Path(output_dir) / ARQUIVO_MANIFESTO, encoding='utf-8') as f:
+            manifesto = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifesto.get('arquivos', {}) if manifesto.get('versao') == VERSAO_MANIFESTO else {}
+
+
+def gravar_manifesto(output_dir, arquivos):
+    """Grava o manifesto de exportação de forma atômica"""
+    gravar_json_atomico(Path(output_dir) / ARQUIVO_MANIFESTO, {'versao': VERSAO_MANIFESTO, 'arquivos': arquivos})
+
+
+def _arquivo_atualizado(arquivo, entrada, marcadores, hash_query):
+    """
+    Indica se o arquivo ainda corresponde à entrada do manifesto
+
+    Exige os mesmos marcadores de origem e a mesma consulta. O conteúdo
+    é conferido pelo mtime/tamanho e, se esses mudaram, pelo hash (a
+    entrada é então atualizada com o novo mtime/tamanho).
+    """
+    if entrada is None or entrada['marcadores'] != marcadores or entrada['hash_consulta'] != hash_query:
+        return False
+    try:
+        estado = os.stat(arquivo)
+    except OSError:
+        return False
+    if estado.st_mtime_ns == entrada['mtime_ns'] and estado.st_size == entrada['tamanho']:
+        return True
+    if hash_arquivo(arquivo) != entrada['hash_saida']:
+        return False
+    entrada.update(mtime_ns=estado.st_mtime_ns, tamanho=estado.st_size)
+    return True
+
+
+def exportar_alteradas(db_path, tarefas, output_dir, formatos=('csv',), forcar=False,
+                       max_workers=None, tamanho_bloco=TAMANHO_BLOCO_EXPORTACAO):
+    """
+    Exporta apenas as tarefas cujos arquivos estão desatualizados
+
+    Para cada arquivo, o manifesto em `output_dir` guarda os marcadores
+    das tabelas de origem (ver marcadores_alteracao), o hash da consulta
+    e o hash do arquivo gerado. Uma tarefa é refeita se algum deles mudou
+    ou se o arquivo foi apagado ou editado; as demais não são tocadas.
+
+    Args:
+        db_path: Caminho para o banco SQLite
+        tarefas: Lista de TarefaExportacao (com `fontes` preenchido)
+        output_dir: Diretório de saída (onde fica o manifesto)
+        formatos: Formatos a gravar ('csv' e/ou 'parquet')
+        forcar: Se True, refaz todas as exportações
+        max_workers: Número de threads (padrão: uma por tarefa)
+        tamanho_bloco: Linhas lidas do banco por vez
+
+    Returns:
+        Lista de ResultadoExportacao, na mesma ordem de `tarefas`
+        (`reaproveitado=True` nas que não foram refeitas)
+    """
+    manifesto = carregar_manifesto(output_dir)
+
+    conn = conectar_somente_leitura(db_path)
+    try:
+        marcadores = marcadores_alteracao(conn, [t for tarefa in tarefas for t in tarefa.fontes])
+    finally:
+        conn.close()
+
+    situacao = []
+    for tarefa in tarefas:
+        marcadores_tarefa = {tabela: marcadores[tabela] for tabela in sorted(set(tarefa.fontes))}
+        hash_query = hash_consulta(tarefa.query)
+        arquivos = [Path(output_dir) / f'{tarefa.arquivo}.{formato}' for formato in formatos]
+        atualizada = not forcar and bool(tarefa.fontes) and all(
+            _arquivo_atualizado(arquivo, manifesto.get(arquivo.name), marcadores_tarefa, hash_query)
+            for arquivo in arquivos
+        )
+        situacao.append((tarefa, arquivos, marcadores_tarefa, hash_query, atualizada))
+
+    pendentes = [tarefa for tarefa, _, _, _, atualizada in situacao if not atualizada]
+    refeitas = iter(exportar_em_paralelo(db_path, pendentes, output_dir, formatos,
+                                         max_workers, tamanho_bloco) if pendentes else [])
+
+    resultados = []
+    for tarefa, arquivos, marcadores_tarefa, hash_query, atualizada in situacao:
+        if atualizada:
+            registros = manifesto[arquivos[0].name]['registros']
+            resultados.append(ResultadoExportacao(tarefa, arquivos, registros, 0.0, None, True))
+            continue
+
+        resultado = next(refeitas)
+        resultados.append(resultado)
+        if resultado.erro is not None:
+            for arquivo in arquivos:
+                manifesto.pop(arquivo.name, None)
+            continue
+        for arquivo in resultado.arquivos:
+            estado = os.stat(arquivo)
+            manifesto[arquivo.name] = {
+                'marcadores': marcadores_tarefa,
+                'hash_consulta': hash_query,
+                'hash_saida': hash_arquivo(arquivo),
+                'registros': resultado.registros,
+                'mtime_ns': estado.st_mtime_ns,
+                'tamanho': estado.st_size,
+            }
+
+    gravar_manifesto(output_dir, manifesto)
+    return resultados
@@ -0,0 +1,123 @@
+"""
+Motor de Scores - TechNova IoT
+Cálculo vetorizado dos scores por dimensão, Score_Global e
+Score_Performance_Viabilidade a partir da matriz N×40 de critérios
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from leitor_dados import eh_coluna_nota
+
+# Dimensões de avaliação e o prefixo dos critérios de cada uma
+DIMENSOES = {
+    'Grupo 1 - Performance Técnica': '1.',
+    'Grupo 2 - Viabilidade Econômica': '2.',
+    'Grupo 3 - Confiabilidade': '3.',
+    'Grupo 4 - Usabilidade': '4.',
+    'Grupo 5 - Eficiência Energética': '5.',
+    'Grupo 6 - Robustez Física': '6.',
+    'Grupo 7 - Conectividade': '7.',
+    'Grupo 8 - Sustentabilidade': '8.',
+}
+NOMES_DIMENSOES = list(DIMENSOES.keys())
+DIMENSAO_PERFORMANCE = 'Grupo 1 - Performance Técnica'
+DIMENSAO_VIABILIDADE = 'Grupo 2 - Viabilidade Econômica'
+
+ScoresCalculados = namedtuple(
+    'ScoresCalculados',
+    ['dimensoes', 'score_global', 'score_performance_viabilidade']
+)
+
+
+def identificar_colunas_notas(colunas):
+    """Retorna as colunas de critérios (1.1 a 8.5) na ordem em que aparecem"""
+    return [col for col in colunas if eh_coluna_nota(col)]
+
+
+def agrupar_dimensoes(colunas_notas):
+    """Mapeia cada dimensão para a lista de critérios que a compõem"""
+    return {
+        nome: [col for col in colunas_notas if col.startswith(prefixo)]
+        for nome, prefixo in DIMENSOES.items()
+    }
+
+
+def matriz_pertencimento(colunas_notas):
+    """
+    Matriz C×(D+1) de pertencimento dos critérios às dimensões
+
+    As D primeiras colunas marcam com 1 os critérios de cada dimensão; a
+    última é toda 1 e produz a soma usada no Score_Global.
+    """
+    matriz = np.zeros((len(colunas_notas), len(DIMENSOES) + 1))
+    for j, prefixo in enumerate(DIMENSOES.values()):
+        for i, col in enumerate(colunas_notas):
+            if col.startswith(prefixo):
+                matriz[i, j] = 1.0
+    matriz[:, -1] = 1.0
+    return matriz
+
+
+def calcular_scores(notas, colunas_notas):
+    """
+    Calcula todos os scores em uma única passada sobre a matriz de notas
+
+    Somas e contagens por dimensão saem de um único produto matricial com
+    a matriz de pertencimento. Notas ausentes (NaN) são ignoradas, como no
+    `DataFrame.mean(axis=1)` usado anteriormente.
+
+    Args:
+        notas: Matriz N×C com as notas (qualquer dtype numérico)
+        colunas_notas: Nomes das C colunas, na ordem da matriz
+
+    Returns:
+        ScoresCalculados com `dimensoes` (N×8, na ordem de NOMES_DIMENSOES),
+        `score_global` (N) e `score_performance_viabilidade` (N)
+    """
+    notas = np.ascontiguousarray(notas, dtype=np.float64)
+    pertencimento = matriz_pertencimento(colunas_notas)
+
+    validas = ~np.isnan(notas)
+    if validas.all():
+        somas = notas @ pertencimento
+        contagens = pertencimento.sum(axis=0)
+    else:
+        somas = np.where(validas, notas, 0.0) @ pertencimento
+        contagens = validas.astype(np.float64) @ pertencimento
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        medias = somas / contagens
+
+    dimensoes = medias[:, :-1]
+    score_global = medias[:, -1]
+    i_perf = NOMES_DIMENSOES.index(DIMENSAO_PERFORMANCE)
+    i_viab = NOMES_DIMENSOES.index(DIMENSAO_VIABILIDADE)
+    score_pv = (dimensoes[:, i_perf] + dimensoes[:, i_viab]) / 2
+
+    return ScoresCalculados(dimensoes, score_global, score_pv)
+
+
+def aplicar_scores(df, colunas_notas=None):
+    """
+    Calcula os scores de um DataFrame e os adiciona como colunas
+
+    Adiciona 'Score_Global', uma coluna por dimensão e
+    'Score_Performance_Viabilidade'.
+
+    Returns:
+        ScoresCalculados com os arrays calculados
+    """
+    if colunas_notas is None:
+        colunas_notas = identificar_colunas_notas(df.columns)
+    scores = calcular_scores(df[colunas_notas].to_numpy(), colunas_notas)
+
+    df['Score_Global'] = scores.score_global
+    for j, nome_dim in enumerate(NOMES_DIMENSOES):
+        df[nome_dim] = scores.dimensoes[:, j]
+    df['Score_Performance_Viabilidade'] = scores.score_performance_viabilidade
+    return scores
@@ -0,0 +1,152 @@
+"""
+Armazenamento Compacto das Notas - TechNova IoT
+Grava as notas dos critérios de cada startup como um BLOB de um byte por
+critério e as decodifica para arrays NumPy sem cópia
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import numpy as np
+
+# Dimensão dos critérios: ids pequenos, na ordem em que aparecem na planilha
+TABELA_CRITERIOS = 'criterios'
+# Uma linha por startup; o byte i do BLOB é a nota do critério de id i + 1
+TABELA_NOTAS = 'notas_compactas'
+# No modo compacto avaliacoes_detalhadas vira uma visão com o mesmo formato
+# longo (id, startup_id, criterio, score), lida pelo Power BI
+VISAO_DETALHADA = 'avaliacoes_detalhadas'
+
+# 0 marca critério sem nota. Acima de 127 o byte não é UTF-8 válido e a
+# visão (que lê o byte com unicode()) não conseguiria decodificá-lo
+NOTA_AUSENTE = 0
+NOTA_MAXIMA = 127
+
+# Ids por consulta em notas_gravadas (abaixo do limite de 999 parâmetros
+# das versões antigas do SQLite)
+MAX_PARAMETROS_CONSULTA = 900
+
+ESQUEMA_COMPACTO = [
+    f'''
+    CREATE TABLE IF NOT EXISTS {TABELA_CRITERIOS} (
+        id INTEGER PRIMARY KEY,
+        nome TEXT NOT NULL UNIQUE
+    )
+    ''',
+    f'''
+    CREATE TABLE IF NOT EXISTS {TABELA_NOTAS} (
+        startup_id INTEGER PRIMARY KEY REFERENCES startups(id),
+        notas BLOB NOT NULL
+    )
+    ''',
+]
+
+
+def sql_nota(blob, criterio_id):
+    """Expressão SQL que lê a nota (REAL, ou NULL se ausente) do critério no BLOB"""
+    return f'CAST(unicode(CAST(substr({blob}, {criterio_id}, 1) AS TEXT)) AS REAL)'
+
+
+# O id da visão reproduz o AUTOINCREMENT da tabela original quando as
+# startups são importadas em ordem: (startup_id - 1) * critérios + criterio_id
+SQL_VISAO_DETALHADA = f'''
+    CREATE VIEW IF NOT EXISTS {VISAO_DETALHADA} AS
+    SELECT (n.startup_id - 1) * (SELECT MAX(id) FROM {TABELA_CRITERIOS}) + c.id AS id,
+           n.startup_id,
+           c.nome AS criterio,
+           {sql_nota('n.notas', 'c.id')} AS score
+    FROM {TABELA_NOTAS} n
+    JOIN {TABELA_CRITERIOS} c ON c.id <= length(n.notas)
+    WHERE {sql_nota('n.notas', 'c.id')} IS NOT NULL
+'''
+
+
+def empacotar_notas(matriz, posicoes, largura, base=None):
+    """
+    Converte as notas de um bloco em um BLOB por startup
+
+    Args:
+        matriz: Array (startups x critérios) com as notas (NaN = ausente)
+        posicoes: Índice no BLOB (criterio_id - 1) de cada coluna de `matriz`
+        largura: Tamanho de cada BLOB (maior id de critério)
+        base: Array uint8 (startups x largura) com as notas já gravadas,
+              preservadas nos critérios fora de `posicoes`
+
+    Returns:
+        Lista de bytes, um por linha de `matriz`
+
+    Raises:
+        ValueError: Se alguma nota não for inteira entre 1 e NOTA_MAXIMA
+    """
+    matriz = np.asarray(matriz, dtype=np.float64)
+    presentes = ~np.isnan(matriz)
+    validas = presentes & (matriz >= 1) & (matriz <= NOTA_MAXIMA) & (matriz == np.round(matriz))
+    if not np.array_equal(validas, presentes):
+        invalida = matriz[presentes & ~validas][0]
+        raise ValueError(f"o modo compacto só armazena notas inteiras de 1 a {NOTA_MAXIMA} (encontrada {invalida})")
+
+    if base is None:
+        compacta = np.full((len(matriz), largura), NOTA_AUSENTE, dtype=np.uint8)
+    else:
+        compacta = np.array(base, dtype=np.uint8)
+    compacta[:, posicoes] = np.where(presentes, matriz, NOTA_AUSENTE).astype(np.uint8)
+    return [linha.tobytes() for linha in compacta]
+
+
+def notas_gravadas(conn, startup_ids, largura):
+    """
+    Notas já gravadas das startups como matriz uint8 (startups x largura)
+
+    Startups sem notas e critérios além do BLOB ficam com NOTA_AUSENTE.
+    Os BLOBs são lidos com um SELECT ... IN por lote de até
+    MAX_PARAMETROS_CONSULTA ids, e não com uma consulta por startup.
+    """
+    ids = list(dict.fromkeys(startup_ids))
+    blobs = {}
+    for inicio in range(0, len(ids), MAX_PARAMETROS_CONSULTA):
+        lote = ids[inicio:inicio + MAX_PARAMETROS_CONSULTA]
+        blobs.update(conn.execute(
+            f"SELECT startup_id, notas FROM {TABELA_NOTAS} WHERE startup_id IN ({', '.join('?' * len(lote))})",
+            lote
+        ))
+
+    matriz = np.full((len(startup_ids), largura), NOTA_AUSENTE, dtype=np.uint8)
+    for i, startup_id in enumerate(startup_ids):
+        blob = blobs.get(startup_id)
+        if blob is not None:
+            notas = decodificar_notas(blob)[:largura]
+            matriz[i, :len(notas)] = notas
+    return matriz
+
+
+def decodificar_notas(blob):
+    """Notas de uma startup como array uint8 de leitura, sem copiar o BLOB"""
+    return np.frombuffer(blob, dtype=np.uint8)
+
+
+def carregar_matriz_notas(conn):
+    """
+    Lê todas as notas compactas em uma matriz
+
+    Os BLOBs são concatenados uma única vez e a matriz é uma visão sobre
+    esse buffer (np.frombuffer); BLOBs mais curtos (gravados antes de um
+    critério novo) são completados com NOTA_AUSENTE.
+
+    Returns:
+        (startup_ids, nomes dos critérios, matriz uint8 startups x critérios),
+        em ordem de startup_id e de id do critério
+    """
+    criterios = [nome for nome, in conn.execute(f'SELECT nome FROM {TABELA_CRITERIOS} ORDER BY id')]
+    linhas = conn.execute(f'SELECT startup_id, notas FROM {TABELA_NOTAS} ORDER BY startup_id').fetchall()
+    largura = len(criterios)
+    startup_ids = np.array([startup_id for startup_id, _ in linhas], dtype=np.int64)
+    blobs = [blob if len(blob) == largura else bytes(blob[:largura]).ljust(largura, b'\0')
+             for _, blob in linhas]
+    matriz = np.frombuffer(b''.join(blobs), dtype=np.uint8).reshape(len(blobs), largura)
+    return startup_ids, criterios, matriz
+
+
+def usa_armazenamento_compacto(conn):
+    """Indica se o banco usa o modo compacto (avaliacoes_detalhadas é uma visão)"""
+    linha = conn.execute('SELECT type FROM sqlite_master WHERE name = ?', (VISAO_DETALHADA,)).fetchone()
+    return linha is not None and linha[0] == 'view'
@@ -0,0 +1,187 @@
+"""
+Perfis de Score Ponderados - TechNova IoT
+Pontua todas as startups sob K perfis de pesos (por dimensão e por
+critério) com um único produto matricial N×40 · 40×K e gera os rankings
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+from motor_scores import DIMENSOES, NOMES_DIMENSOES, identificar_colunas_notas
+
+# Perfis embutidos: reproduzem os scores já usados no projeto
+PERFIS_PADRAO = {
+    'global': {
+        'descricao': 'Todas as dimensões com o mesmo peso (equivale ao Score_Global)',
+        'pesos_grupos': {},
+        'pesos_criterios': {},
+    },
+    'performance_viabilidade': {
+        'descricao': 'Apenas Performance Técnica e Viabilidade Econômica '
+                     '(equivale ao Score_Performance_Viabilidade)',
+        'peso_grupo_padrao': 0.0,
+        'pesos_grupos': {
+            'Grupo 1 - Performance Técnica': 1.0,
+            'Grupo 2 - Viabilidade Econômica': 1.0,
+        },
+        'pesos_criterios': {},
+    },
+}
+
+# Casas decimais usadas antes de ranquear, para que empates exatos no
+# score não sejam desfeitos por diferenças de arredondamento do produto
+CASAS_RANKING = 10
+
+
+def carregar_perfis(caminho_json=None, incluir_padrao=True):
+    """
+    Carrega perfis de um arquivo JSON no formato {nome: perfil}
+
+    Cada perfil aceita 'pesos_grupos' (dimensão → peso), 'pesos_criterios'
+    (critério → peso), 'peso_grupo_padrao' (peso das dimensões omitidas,
+    1.0 se ausente) e 'descricao'.
+
+    Args:
+        caminho_json: Arquivo com os perfis (None usa só os perfis padrão)
+        incluir_padrao: Se True, inclui PERFIS_PADRAO no resultado
+    """
+    perfis = dict(PERFIS_PADRAO) if incluir_padrao else {}
+    if caminho_json:
+        with open(caminho_json, encoding='utf-8') as f:
+            perfis.update(json.load(f))
+    return perfis
+
+
+def matriz_pesos(perfis, colunas_notas):
+    """
+    Monta a matriz C×K de pesos efetivos por critério
+
+    O score de um perfil é a média ponderada dos scores das dimensões
+    (pesos_grupos), onde o score de cada dimensão é a média ponderada dos
+    seus critérios (pesos_criterios). Como tudo é linear, isso se reduz a
+    um peso por critério; cada coluna da matriz soma 1.
+
+    Returns:
+        Tupla (matriz C×K, lista com os nomes dos perfis)
+    """
+    nomes = list(perfis.keys())
+    pesos = np.zeros((len(colunas_notas), len(nomes)))
+
+    for k, nome in enumerate(nomes):
+        perfil = perfis[nome]
+        pesos_grupos = perfil.get('pesos_grupos', {})
+        pesos_criterios = perfil.get('pesos_criterios', {})
+        desconhecidos = (set(pesos_grupos) - set(NOMES_DIMENSOES)) | (set(pesos_criterios) - set(colunas_notas))
+        if desconhecidos:
+            raise ValueError(f"Perfil '{nome}' referencia itens inexistentes: {sorted(desconhecidos)}")
+
+        peso_padrao = float(perfil.get('peso_grupo_padrao', 1.0))
+        total_grupos = 0.0
+        for nome_dim, prefixo in DIMENSOES.items():
+            indices = [i for i, col in enumerate(colunas_notas) if col.startswith(prefixo)]
+            peso_grupo = float(pesos_grupos.get(nome_dim, peso_padrao))
+            if not indices or peso_grupo == 0:
+                continue
+            pesos_dim = np.array([float(pesos_criterios.get(colunas_notas[i], 1.0)) for i in indices])
+            if pesos_dim.sum() <= 0:
+                continue
+            pesos[indices, k] = peso_grupo * pesos_dim / pesos_dim.sum()
+            total_grupos += peso_grupo
+
+        if total_grupos <= 0:
+            raise ValueError(f"Perfil '{nome}' não tem nenhum peso positivo")
+        pesos[:, k] /= total_grupos
+
+    return pesos, nomes
+
+
+def pontuar_perfis(notas, colunas_notas, perfis):
+    """
+    Calcula o score de cada startup em cada perfil
+
+    Notas ausentes (NaN) são ignoradas e os pesos restantes renormalizados.
+
+    Args:
+        notas: Matriz N×C com as notas
+        colunas_notas: Nomes das C colunas, na ordem da matriz
+        perfis: Dicionário {nome: perfil}
+
+    Returns:
+        DataFrame N×K com um score por perfil
+    """
+    pesos, nomes = matriz_pesos(perfis, colunas_notas)
+    notas = np.ascontiguousarray(notas, dtype=np.float64)
+
+    validas = ~np.isnan(notas)
+    if validas.all():
+        scores = notas @ pesos
+    else:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = (np.where(validas, notas, 0.0) @ pesos) / (validas.astype(np.float64) @ pesos)
+
+    return pd.DataFrame(scores, columns=nomes)
+
+
+def ranquear_perfis(df, perfis=None, colunas_notas=None, somente_ativas=True):
+    """
+    Pontua e ranqueia as startups em todos os perfis de uma só vez
+
+    Os rankings seguem a semântica de RANK() do SQL (empates recebem a
+    mesma posição e a seguinte é pulada), com as mesmas colunas
+    'ranking_geral' e 'ranking_setor' de powerbi_ranking_startups.csv.
+
+    Args:
+        df: DataFrame com nome_startup, setor, status e os critérios
+        perfis: Dicionário {nome: perfil} (padrão: PERFIS_PADRAO)
+        colunas_notas: Colunas de critérios (detectadas se None)
+        somente_ativas: Se True, considera apenas startups ativas
+
+    Returns:
+        Dicionário {nome do perfil: DataFrame ordenado pelo ranking}
+    """
+    perfis = perfis or PERFIS_PADRAO
+    if colunas_notas is None:
+        colunas_notas = identificar_colunas_notas(df.columns)
+    if somente_ativas:
+        df = df[df['status'] == 'Ativa']
+
+    scores = pontuar_perfis(df[colunas_notas].to_numpy(), colunas_notas, perfis)
+    base = df[['nome_startup', 'setor', 'status']].reset_index(drop=True)
+
+    rankings = {}
+    for nome in scores.columns:
+        ranking = base.copy()
+        ranking['score'] = scores[nome].to_numpy()
+        chave = ranking['score'].round(CASAS_RANKING)
+        ranking['ranking_geral'] = chave.rank(method='min', ascending=False).astype('Int64')
+        ranking['ranking_setor'] = chave.groupby(ranking['setor']).rank(method='min', ascending=False).astype('Int64')
+        rankings[nome] = ranking.sort_values(['ranking_geral', 'nome_startup'], kind='stable').reset_index(drop=True)
+    return rankings
+
+
+def main():
+    """Exibe o top 5 de cada perfil (perfis extras via: python perfis_score.py perfis.json)"""
+    from cache_avaliacoes import carregar_avaliacoes
+
+    print("=" * 80)
+    print("RANKINGS POR PERFIL DE PONDERAÇÃO - TECHNOVA")
+    print("=" * 80)
+
+    perfis = carregar_perfis(sys.argv[1] if len(sys.argv) > 1 else None)
+    df = carregar_avaliacoes('Case_TechNova_Dados.xlsx')
+    rankings = ranquear_perfis(df, perfis)
+
+    for nome, ranking in rankings.items():
+        print(f"\n📊 PERFIL '{nome}': {perfis[nome].get('descricao', '')}")
+        print("-" * 80)
+        print(ranking.head(5).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
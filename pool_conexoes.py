@@ -0,0 +1,206 @@
+"""
+Pool de Conexões - TechNova IoT
+Conexões SQLite por thread com limite de conexões abertas, modo somente
+leitura (URI mode=ro) e reconexão automática
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import quote
+
+TAMANHO_POOL_PADRAO = 8
+# Segundos que uma thread espera por uma conexão livre com o pool cheio
+ESPERA_PADRAO = 30.0
+# Intervalo (s) entre verificações da conexão já associada a uma thread;
+# conexões devolvidas ao pool são verificadas sempre que reaproveitadas
+INTERVALO_VERIFICACAO = 5.0
+
+# PRAGMAs que alteram o arquivo e não se aplicam a conexões somente leitura
+PRAGMAS_ESCRITA = ('journal_mode', 'synchronous')
+
+
+def uri_somente_leitura(db_path):
+    """URI SQLite que abre o arquivo somente para leitura"""
+    return f'file:{quote(str(Path(db_path).resolve()))}?mode=ro'
+
+
+def _identidade_arquivo(db_path):
+    """(dispositivo, inode) do arquivo, para perceber que ele foi recriado (None se não existe)"""
+    try:
+        estado = os.stat(db_path)
+    except OSError:
+        return None
+    return (estado.st_dev, estado.st_ino)
+
+
+def _em_transacao(conn):
+    """Indica se a conexão tem uma transação aberta (False se já foi fechada)"""
+    try:
+        return conn.in_transaction
+    except sqlite3.ProgrammingError:
+        return False
+
+
+class _Conexao:
+    """Conexão do pool com a identidade do arquivo aberto e a última verificação"""
+
+    def __init__(self, conn, identidade):
+        self.conn = conn
+        self.identidade = identidade
+        self.verificada = time.monotonic()
+
+
+class PoolConexoes:
+    """
+    Conexões SQLite por thread, limitadas a `tamanho` abertas ao mesmo tempo
+
+    Cada thread recebe a sua conexão na primeira chamada a obter() e a
+    mantém até liberar() (ou até terminar: conexões de threads encerradas
+    são recuperadas quando o pool enche). Com o pool cheio, obter() espera
+    uma conexão livre por até `espera` segundos.
+
+    Conexões fechadas por fora ou cujo arquivo foi recriado (outro inode,
+    como após apagar e recriar technova_iot.db) são reabertas: as livres
+    ao serem reaproveitadas e as associadas a threads a cada
+    INTERVALO_VERIFICACAO segundos, exceto durante uma transação aberta.
+    """
+
+    def __init__(self, db_path, tamanho=TAMANHO_POOL_PADRAO, somente_leitura=False, pragmas=(),
+                 espera=ESPERA_PADRAO):
+        if tamanho < 1:
+            raise ValueError(f"o pool precisa de ao menos uma conexão (recebido {tamanho})")
+        self.db_path = db_path
+        self.tamanho = tamanho
+        self.somente_leitura = somente_leitura
+        self.pragmas = [pragma for pragma in pragmas
+                        if not (somente_leitura and any(nome in pragma for nome in PRAGMAS_ESCRITA))]
+        self.espera = espera
+        self.fechado = False
+        self.em_uso = {}
+        self.livres = []
+        self.condicao = threading.Condition()
+        self.contadores = {'aberturas': 0, 'reconexoes': 0, 'esperas': 0, 'recuperadas': 0}
+
+    def _abrir(self):
+        if self.somente_leitura:
+            conn = sqlite3.connect(uri_somente_leitura(self.db_path), uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            for pragma in self.pragmas:
+                conn.execute(pragma)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self.contadores['aberturas'] += 1
+        return _Conexao(conn, _identidade_arquivo(self.db_path))
+
+    def _valida(self, conexao):
+        """Confere que a conexão está aberta e aponta para o arquivo atual"""
+        try:
+            conexao.conn.execute('SELECT 1')
+        except sqlite3.Error:
+            return False
+        return conexao.identidade == _identidade_arquivo(self.db_path)
+
+    def _renovar(self, conexao):
+        """Reabre a conexão se ela não for mais válida"""
+        conexao.verificada = time.monotonic()
+        if self._valida(conexao):
+            return conexao
+        try:
+            conexao.conn.close()
+        except sqlite3.Error:
+            pass
+        self.contadores['reconexoes'] += 1
+        return self._abrir()
+
+    def obter(self):
+        """Conexão da thread atual (associada a ela na primeira chamada)"""
+        thread = threading.current_thread()
+        conexao = self.em_uso.get(thread)
+        if conexao is not None:
+            # Com uma transação aberta a conexão nunca é trocada: fechá-la
+            # descartaria a transação sem aviso (a verificação fica para
+            # depois do commit ou rollback)
+            if (time.monotonic() - conexao.verificada < INTERVALO_VERIFICACAO
+                    or _em_transacao(conexao.conn)):
+                return conexao.conn
+            conexao = self.em_uso[thread] = self._renovar(conexao)
+            return conexao.conn
+
+        with self.condicao:
+            if self.fechado:
+                raise sqlite3.ProgrammingError("o pool de conexões foi fechado")
+            limite = time.monotonic() + self.espera
+            while not self.livres and len(self.em_uso) >= self.tamanho:
+                if self._recuperar_encerradas():
+                    continue
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    raise TimeoutError(f"nenhuma das {self.tamanho} conexões do pool ficou livre "
+                                       f"em {self.espera:g}s")
+                self.contadores['esperas'] += 1
+                self.condicao.wait(restante)
+                if self.fechado:
+                    raise sqlite3.ProgrammingError("o pool de conexões foi fechado")
+            conexao = self._renovar(self.livres.pop()) if self.livres else self._abrir()
+            self.em_uso[thread] = conexao
+        return conexao.conn
+
+    def _recuperar_encerradas(self):
+        """Devolve ao pool as conexões de threads que já terminaram"""
+        encerradas = [thread for thread in self.em_uso if not thread.is_alive()]
+        for thread in encerradas:
+            self.livres.append(self.em_uso.pop(thread))
+        self.contadores['recuperadas'] += len(encerradas)
+        return bool(encerradas)
+
+    def liberar(self):
+        """Devolve ao pool a conexão da thread atual (transações abertas são desfeitas)"""
+        with self.condicao:
+            conexao = self.em_uso.pop(threading.current_thread(), None)
+            if conexao is None:
+                return
+            if self.fechado:
+                conexao.conn.close()
+                return
+            if conexao.conn.in_transaction:
+                conexao.conn.rollback()
+            self.livres.append(conexao)
+            self.condicao.notify()
+
+    @contextmanager
+    def conexao(self):
+        """
+        Conexão da thread atual durante o bloco `with`; se a thread não
+        tinha uma antes, ela é devolvida ao pool ao final
+        """
+        ja_tinha = threading.current_thread() in self.em_uso
+        try:
+            yield self.obter()
+        finally:
+            if not ja_tinha:
+                self.liberar()
+
+    def estatisticas(self):
+        """Contadores do pool e o número de conexões em uso e livres"""
+        with self.condicao:
+            return dict(self.contadores, em_uso=len(self.em_uso), livres=len(self.livres))
+
+    def fechar(self):
+        """Fecha todas as conexões (threads à espera recebem ProgrammingError)"""
+        with self.condicao:
+            self.fechado = True
+            for conexao in list(self.em_uso.values()) + self.livres:
+                conexao.conn.close()
+            self.em_uso.clear()
+            self.livres.clear()
+            self.condicao.notify_all()
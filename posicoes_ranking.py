@@ -0,0 +1,112 @@
+"""
+Posições no Ranking - TechNova IoT
+Posição geral, posição no setor e percentis de cada startup ativa no
+Score Global, no Score Performance + Viabilidade e nas 8 dimensões
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+from motor_scores import NOMES_DIMENSOES
+
+TABELA_POSICOES = 'posicoes_startups'
+
+# Métricas com posição calculada (nomes das colunas do DataFrame de scores
+# e, para as dimensões, de avaliacoes_dimensoes.dimensao)
+METRICAS_STARTUP = {
+    'Score_Global': 'score_global',
+    'Score_Performance_Viabilidade': 'score_performance_viabilidade',
+}
+METRICAS_POSICAO = list(METRICAS_STARTUP) + NOMES_DIMENSOES
+
+# Chave (startup_id, metrica) para "onde está a startup X"; o índice
+# (metrica, posicao_geral) atende o ranking completo de uma métrica
+ESQUEMA_POSICOES = [
+    f'''
+    CREATE TABLE IF NOT EXISTS {TABELA_POSICOES} (
+        startup_id INTEGER NOT NULL REFERENCES startups(id),
+        metrica TEXT NOT NULL,
+        valor REAL NOT NULL,
+        posicao_geral INTEGER NOT NULL,
+        posicao_setor INTEGER NOT NULL,
+        percentil_geral REAL NOT NULL,
+        percentil_setor REAL NOT NULL,
+        PRIMARY KEY (startup_id, metrica)
+    )
+    ''',
+    f'''
+    CREATE INDEX IF NOT EXISTS idx_{TABELA_POSICOES}_metrica
+    ON {TABELA_POSICOES} (metrica, posicao_geral, startup_id, posicao_setor)
+    ''',
+]
+
+# Posições das startups ativas: RANK() decrescente (empates dividem a
+# posição, como "quantas têm score maior + 1") e percentil = percentual das
+# demais startups com score menor ou igual (100 para a única do grupo)
+_METRICAS_SQL = '\n    UNION ALL\n'.join(
+    f"    SELECT id AS startup_id, setor, '{metrica}' AS metrica, {coluna} AS valor "
+    f"FROM startups WHERE status = 'Ativa'"
+    for metrica, coluna in METRICAS_STARTUP.items()
+)
+SQL_GRAVAR_POSICOES = f'''
+INSERT INTO {TABELA_POSICOES}
+    (startup_id, metrica, valor, posicao_geral, posicao_setor, percentil_geral, percentil_setor)
+SELECT startup_id, metrica, valor,
+       RANK() OVER geral,
+       RANK() OVER no_setor,
+       100.0 * (1 - PERCENT_RANK() OVER geral),
+       100.0 * (1 - PERCENT_RANK() OVER no_setor)
+FROM (
+{_METRICAS_SQL}
+    UNION ALL
+    SELECT s.id, s.setor, d.dimensao, d.score
+    FROM avaliacoes_dimensoes d
+    JOIN startups s ON s.id = d.startup_id
+    WHERE s.status = 'Ativa'
+)
+WHERE valor IS NOT NULL
+WINDOW geral AS (PARTITION BY metrica ORDER BY valor DESC),
+       no_setor AS (PARTITION BY metrica, setor ORDER BY valor DESC)
+'''
+
+
+def _percentil(posicoes, totais):
+    """Percentual das demais startups do grupo com score menor ou igual"""
+    return (100.0 * (totais - posicoes) / (totais - 1)).where(totais > 1, 100.0)
+
+
+def calcular_posicoes(df, metricas=None, coluna_setor='setor'):
+    """
+    Mesmas posições de SQL_GRAVAR_POSICOES, calculadas sobre um DataFrame
+    de scores (ex.: as startups ativas da análise)
+
+    Args:
+        df: DataFrame com a coluna do setor e as colunas das métricas
+        metricas: Colunas a posicionar (padrão: as de METRICAS_POSICAO presentes)
+        coluna_setor: Coluna que define os grupos das posições no setor
+
+    Returns:
+        DataFrame com as colunas de TABELA_POSICOES (valor, posicao_geral,
+        posicao_setor, percentil_geral, percentil_setor) indexado por (índice de df, métrica),
+        para consultas como posicoes.loc[(indice, 'Score_Global'), 'posicao_setor']
+    """
+    import pandas as pd
+    if metricas is None:
+        metricas = [metrica for metrica in METRICAS_POSICAO if metrica in df.columns]
+    valores = df[metricas]
+    setores = valores.groupby(df[coluna_setor])
+
+    posicao_geral = valores.rank(method='min', ascending=False)
+    posicao_setor = setores.rank(method='min', ascending=False)
+    total_geral = pd.DataFrame({metrica: valores[metrica].count() for metrica in metricas}, index=df.index)
+    colunas = {
+        'valor': valores,
+        'posicao_geral': posicao_geral,
+        'posicao_setor': posicao_setor,
+        'percentil_geral': _percentil(posicao_geral, total_geral),
+        'percentil_setor': _percentil(posicao_setor, setores.transform('count')),
+    }
+    posicoes = pd.concat({nome: tabela.stack() for nome, tabela in colunas.items()}, axis=1)
+    posicoes = posicoes.dropna(subset=['valor'])
+    posicoes.index.names = [df.index.name, 'metrica']
+    return posicoes.astype({'posicao_geral': int, 'posicao_setor': int})
@@ -10,28 +10,56 @@ db_path = r'c:\Users\Eduar\Desktop\Case_TechNova_Dados\technova_iot.db'
 # Conectar ao banco
 conn = sqlite3.connect(db_path)
 
-# Carregar tabelas
-startups = pd.read_sql_query("SELECT * FROM startups", conn)
+# Carregar tabelas (startups sem as colunas de controle da importação incremental)
+startups = pd.read_sql_query('''
+    SELECT id, nome_startup, setor, status, score_global, score_performance_viabilidade, data_cadastro
+    FROM startups
+''', conn)
 avaliacoes_dimensoes = pd.read_sql_query("SELECT * FROM avaliacoes_dimensoes", conn)
 avaliacoes_detalhadas = pd.read_sql_query("SELECT * FROM avaliacoes_detalhadas", conn)
 estatisticas_setor = pd.read_sql_query("SELECT * FROM estatisticas_setor", conn)
 
-# View consolidada
-startups_completo = pd.read_sql_query('''
-    SELECT 
-        s.*,
-        MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
-        MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
-        MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
-    FROM startups s
-    LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
-    GROUP BY s.id
-''', conn)
+# View consolidada (uma linha por startup, com as 8 dimensões), com as
+# dimensões lidas da tabela materializada pelo importador em
+# criar_banco_dados.py; as notas dos critérios estão em avaliacoes_detalhadas
+tem_tabela_larga = conn.execute(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'startups_completo'"
+).fetchone()
+
+if tem_tabela_larga:
+    startups_completo = pd.read_sql_query('''
+        SELECT
+            s.id, s.nome_startup, s.setor, s.status, s.score_global,
+            s.score_performance_viabilidade, s.data_cadastro,
+            c.performance_tecnica, c.viabilidade_economica, c.confiabilidade, c.usabilidade,
+            c.eficiencia_energetica, c.robustez_fisica, c.conectividade, c.sustentabilidade
+        FROM startups s
+        LEFT JOIN startups_completo c ON c.id = s.id
+        ORDER BY s.id
+    ''', conn)
+else:
+    # Bancos antigos, sem a tabela startups_completo: pivot das dimensões
+    startups_completo = pd.read_sql_query('''
+        SELECT
+            s.id, s.nome_startup, s.setor, s.status, s.score_global,
+            s.score_performance_viabilidade, s.data_cadastro,
+            MAX(CASE WHEN d.dimensao = 'Grupo 1 - Performance Técnica' THEN d.score END) as performance_tecnica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 2 - Viabilidade Econômica' THEN d.score END) as viabilidade_economica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 3 - Confiabilidade' THEN d.score END) as confiabilidade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 4 - Usabilidade' THEN d.score END) as usabilidade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 5 - Eficiência Energética' THEN d.score END) as eficiencia_energetica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 6 - Robustez Física' THEN d.score END) as robustez_fisica,
+            MAX(CASE WHEN d.dimensao = 'Grupo 7 - Conectividade' THEN d.score END) as conectividade,
+            MAX(CASE WHEN d.dimensao = 'Grupo 8 - Sustentabilidade' THEN d.score END) as sustentabilidade
+        FROM startups s
+        LEFT JOIN avaliacoes_dimensoes d ON s.id = d.startup_id
+        GROUP BY s.id
+    ''', conn)
+
+# Posições de cada startup ativa (geral, no setor e percentis) por métrica,
+# pré-calculadas pelo importador
+if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posicoes_startups'").fetchone():
+    posicoes_startups = pd.read_sql_query("SELECT * FROM posicoes_startups", conn)
 
 conn.close()
 
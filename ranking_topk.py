@@ -0,0 +1,43 @@
+"""
+Ranking Top-K - TechNova IoT
+Seleção das K melhores startups de um portfólio em memória por seleção
+parcial, sem ordenar o portfólio inteiro (no banco, o top-K é feito em SQL
+por TechNovaDatabase.obter_top_k)
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import numpy as np
+
+
+def top_k_indices(valores, k):
+    """
+    Posições dos K maiores valores, do maior para o menor
+
+    Usa seleção parcial (O(N)) e ordena só os K escolhidos (O(K log K)).
+    Empates seguem `Series.nlargest(keep='first')` e `ORDER BY ... DESC`
+    estável: vence quem aparece primeiro. Valores NaN são ignorados.
+
+    Args:
+        valores: Array 1-D de scores
+        k: Quantidade de posições desejadas
+
+    Returns:
+        Array com até K posições de `valores`
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    validos = np.flatnonzero(~np.isnan(valores))
+    if k <= 0 or validos.size == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < validos.size:
+        # Valor de corte = K-ésimo maior; entram todos os maiores que o corte
+        # e, entre os iguais ao corte, os primeiros na ordem original
+        corte = -np.partition(-valores[validos], k - 1)[k - 1]
+        acima = validos[valores[validos] > corte]
+        iguais = validos[valores[validos] == corte][:k - acima.size]
+        validos = np.concatenate([acima, iguais])
+
+    ordem = np.lexsort((validos, -valores[validos]))
+    return validos[ordem]
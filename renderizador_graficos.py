@@ -0,0 +1,427 @@
+"""
+Renderizador de Gráficos - TechNova IoT
+Renderiza em processos paralelos os gráficos descritos por especificações
+(radar Plotly, boxplot e scatter Matplotlib), reaproveitando uma sessão
+do kaleido por lote de exportações Plotly e pulando os gráficos cujos
+dados de entrada não mudaram. Inclui o pacote HTML com os radares de
+várias startups em um único arquivo
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from utilitarios import gravar_json_atomico
+
+ARQUIVO_MANIFESTO_GRAFICOS = '.manifesto_graficos.json'
+
+# Incrementar ao mudar a aparência de algum gráfico, para invalidar o manifesto
+VERSAO_GRAFICOS = 1
+
+ESTILO_MATPLOTLIB = 'seaborn-v0_8-darkgrid'
+PALETA_SEABORN = 'husl'
+
+# Figuras Plotly por lote: cada lote é exportado por um processo, com uma
+# única sessão do kaleido
+TAMANHO_LOTE_PLOTLY = 50
+
+# Layout polar comum a todos os radares, montado uma única vez; cada
+# figura acrescenta apenas o título e o trace com os dados da startup
+LAYOUT_RADAR = {
+    'polar': {
+        'radialaxis': {
+            'visible': True,
+            'range': [0, 5],
+            'tickmode': 'linear',
+            'tick0': 0,
+            'dtick': 1,
+        }
+    },
+    'showlegend': True,
+    'height': 600,
+    'width': 800,
+}
+
+# Um gráfico: tipo ('radar', 'radar_pacote', 'boxplot' ou 'scatter'),
+# arquivos de saída ({formato: caminho}) e dados de entrada (apenas tipos
+# serializáveis em JSON)
+EspecGrafico = namedtuple('EspecGrafico', ['nome', 'tipo', 'saidas', 'dados'])
+
+ResultadoRenderizacao = namedtuple(
+    'ResultadoRenderizacao',
+    ['espec', 'segundos', 'reaproveitado', 'erro']
+)
+
+TIPOS_PLOTLY = {'radar'}
+
+
+def espec_radar(nome, setor, score_global, categorias, valores, saidas):
+    """Especificação do gráfico de radar das dimensões de uma startup"""
+    return EspecGrafico(f'radar {nome}', 'radar', dict(saidas), {
+        'nome': str(nome),
+        'setor': str(setor),
+        'score_global': float(score_global),
+        'categorias': list(categorias),
+        'valores': [float(v) for v in valores],
+    })
+
+
+def espec_pacote_radares(radares, saida_html):
+    """
+    Especificação do pacote HTML com vários radares em um único arquivo
+
+    Args:
+        radares: Lista de especificações criadas por espec_radar
+        saida_html: Caminho do arquivo HTML
+    """
+    return EspecGrafico(f'pacote com {len(radares)} radares', 'radar_pacote', {'html': saida_html},
+                        {'radares': [espec.dados for espec in radares]})
+
+
+def nome_arquivo_seguro(nome):
+    """Converte um nome (ex.: de startup) em um trecho de nome de arquivo"""
+    return re.sub(r'[^\w.-]+', '_', str(nome)).strip('_') or 'sem_nome'
+
+
+def espec_boxplot(setores, scores, saida):
+    """Especificação do boxplot do Score Global por setor"""
+    return EspecGrafico('boxplot por setor', 'boxplot', {'png': saida}, {
+        'setor': [str(s) for s in setores],
+        'score': [float(v) for v in scores],
+    })
+
+
+def espec_scatter(setores, performance, viabilidade, destaque, saida):
+    """
+    Especificação do scatter Performance x Viabilidade por setor
+
+    Args:
+        destaque: Tupla (nome, performance, viabilidade) da startup destacada
+    """
+    nome, x, y = destaque
+    return EspecGrafico('scatter performance x viabilidade', 'scatter', {'png': saida}, {
+        'setor': [str(s) for s in setores],
+        'performance': [float(v) for v in performance],
+        'viabilidade': [float(v) for v in viabilidade],
+        'destaque': {'nome': str(nome), 'x': float(x), 'y': float(y)},
+    })
+
+
+def hash_espec(espec):
+    """Hash dos dados de entrada e das saídas de uma especificação"""
+    conteudo = json.dumps([VERSAO_GRAFICOS, espec.tipo, espec.saidas, espec.dados],
+                          sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+
+def _trace_radar(dados):
+    """Trace polar com as notas das dimensões de uma startup"""
+    return {
+        'type': 'scatterpolar',
+        'r': dados['valores'],
+        'theta': dados['categorias'],
+        'fill': 'toself',
+        'name': dados['nome'],
+        'line': {'color': '#1f77b4', 'width': 2},
+        'fillcolor': 'rgba(31, 119, 180, 0.3)',
+    }
+
+
+def _titulo_radar(dados):
+    return {
+        'text': f"Análise Multidimensional - {dados['nome']}<br>" +
+                f"<sub>Setor: {dados['setor']} | Score Global: {dados['score_global']:.2f}</sub>",
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': 18},
+    }
+
+
+@lru_cache(maxsize=None)
+def _layout_radar_base():
+    """LAYOUT_RADAR com o template padrão do Plotly (que go.Figure aplicaria sozinho)"""
+    import plotly.io as pio
+
+    template = pio.templates[pio.templates.default].to_plotly_json() if pio.templates.default else {}
+    return dict(LAYOUT_RADAR, template=template)
+
+
+def figura_radar(dados):
+    """
+    Monta a figura do gráfico de radar a partir dos dados da especificação
+
+    A figura é um dicionário no formato do Plotly sobre o LAYOUT_RADAR
+    compartilhado, sem a validação de go.Figure (que domina o custo
+    quando há milhares de radares).
+    """
+    return {'data': [_trace_radar(dados)], 'layout': dict(_layout_radar_base(), title=_titulo_radar(dados))}
+
+
+def figura_pacote_radares(radares):
+    """
+    Monta uma única figura com um frame por radar e um menu para escolhê-lo
+
+    O tamanho do HTML cresce linearmente com o número de radares (cada
+    frame guarda apenas seu trace e seu título).
+    """
+    frames = [
+        {'name': dados['nome'], 'data': [_trace_radar(dados)], 'layout': {'title': _titulo_radar(dados)}}
+        for dados in radares
+    ]
+    menu = {
+        'type': 'dropdown',
+        'direction': 'down',
+        'x': 0,
+        'xanchor': 'left',
+        'y': 1.15,
+        'yanchor': 'top',
+        'buttons': [
+            {
+                'label': dados['nome'],
+                'method': 'animate',
+                'args': [[dados['nome']], {'mode': 'immediate', 'frame': {'duration': 0, 'redraw': True},
+                                           'transition': {'duration': 0}}],
+            }
+            for dados in radares
+        ],
+    }
+    layout = dict(_layout_radar_base(), title=_titulo_radar(radares[0]), updatemenus=[menu])
+    return {'data': [_trace_radar(radares[0])], 'layout': layout, 'frames': frames}
+
+
+def _inicializar_worker():
+    """Configura Matplotlib/Seaborn nos processos de renderização"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    import warnings
+
+    warnings.filterwarnings('ignore')
+    plt.style.use(ESTILO_MATPLOTLIB)
+    sns.set_palette(PALETA_SEABORN)
+
+
+def _renderizar_boxplot(dados, saidas):
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    df = pd.DataFrame({'setor': dados['setor'], 'Score_Global': dados['score']})
+    plt.figure(figsize=(12, 6))
+    sns.boxplot(data=df, x='setor', y='Score_Global', palette='Set2')
+    plt.title('Distribuição do Score Global por Setor\n(Startups Ativas)',
+              fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Setor', fontsize=12, fontweight='bold')
+    plt.ylabel('Score Global', fontsize=12, fontweight='bold')
+    plt.xticks(rotation=45, ha='right')
+    plt.grid(axis='y', alpha=0.3, linestyle='--')
+    plt.tight_layout()
+    plt.savefig(saidas['png'], dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def _renderizar_scatter(dados, saidas):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    setores = np.array(dados['setor'])
+    performance = np.array(dados['performance'])
+    viabilidade = np.array(dados['viabilidade'])
+    destaque = dados['destaque']
+
+    plt.figure(figsize=(12, 8))
+    setores_unicos = list(dict.fromkeys(dados['setor']))
+    cores = plt.cm.Set3(np.linspace(0, 1, len(setores_unicos)))
+
+    for setor, cor in zip(setores_unicos, cores):
+        mascara = setores == setor
+        plt.scatter(
+            performance[mascara],
+            viabilidade[mascara],
+            label=setor,
+            s=100,
+            alpha=0.6,
+            c=[cor],
+            edgecolors='black',
+            linewidth=1
+        )
+
+    # Destacar a melhor startup
+    plt.scatter(
+        destaque['x'],
+        destaque['y'],
+        s=500,
+        c='gold',
+        marker='*',
+        edgecolors='red',
+        linewidth=2,
+        label=f'🏆 {destaque["nome"]}',
+        zorder=10
+    )
+
+    plt.title('Performance Técnica vs Viabilidade Econômica\n(Startups Ativas)',
+              fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Grupo 1 - Performance Técnica', fontsize=12, fontweight='bold')
+    plt.ylabel('Grupo 2 - Viabilidade Econômica', fontsize=12, fontweight='bold')
+    plt.legend(loc='best', framealpha=0.9)
+    plt.grid(True, alpha=0.3, linestyle='--')
+    plt.tight_layout()
+    plt.savefig(saidas['png'], dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def _renderizar_pacote_radares(dados, saidas):
+    import plotly.io as pio
+
+    pio.write_html(figura_pacote_radares(dados['radares']), saidas['html'],
+                   auto_play=False, validate=False)
+
+
+# Gráficos renderizados um por tarefa (os radares individuais vão em lotes)
+RENDERIZADORES = {
+    'boxplot': _renderizar_boxplot,
+    'scatter': _renderizar_scatter,
+    'radar_pacote': _renderizar_pacote_radares,
+}
+
+
+def _tarefa_individual(espec):
+    """Renderiza um gráfico de RENDERIZADORES (executado em um processo do pool)"""
+    inicio = time.perf_counter()
+    RENDERIZADORES[espec.tipo](espec.dados, espec.saidas)
+    return time.perf_counter() - inicio
+
+
+def _tarefa_plotly(especs):
+    """
+    Renderiza um lote de radares Plotly (executado em um processo do pool)
+
+    As imagens do lote são geradas com um único `plotly.io.write_images`,
+    que usa a mesma sessão do kaleido para todas as figuras; com versões
+    antigas do Plotly, ou se o lote falhar, cai em `write_image` figura a
+    figura, para que o erro de uma figura não seja atribuído às demais.
+
+    Returns:
+        Lista de (segundos, erro) por figura, na ordem de `especs` (o
+        tempo do lote é dividido igualmente entre as figuras)
+    """
+    import plotly.io as pio
+
+    inicio = time.perf_counter()
+    erros = [None] * len(especs)
+    imagens = []
+    for i, espec in enumerate(especs):
+        try:
+            fig = figura_radar(espec.dados)
+            if 'html' in espec.saidas:
+                pio.write_html(fig, espec.saidas['html'], validate=False)
+            if 'png' in espec.saidas:
+                imagens.append((i, fig))
+        except Exception as e:
+            erros[i] = e
+
+    if imagens and hasattr(pio, 'write_images'):
+        try:
+            pio.write_images([fig for _, fig in imagens], [especs[i].saidas['png'] for i, _ in imagens],
+                             width=800, height=600, scale=2, validate=False)
+            imagens = []
+        except Exception:
+            pass
+    for i, fig in imagens:
+        try:
+            pio.write_image(fig, especs[i].saidas['png'], width=800, height=600, scale=2, validate=False)
+        except Exception as e:
+            erros[i] = e
+
+    segundos = (time.perf_counter() - inicio) / len(especs)
+    return [(segundos, erro) for erro in erros]
+
+
+def _carregar_manifesto(caminho):
+    try:
+        with open(caminho, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def renderizar_graficos(especs, max_workers=None, forcar=False,
+                        manifesto=ARQUIVO_MANIFESTO_GRAFICOS):
+    """
+    Renderiza as especificações em paralelo, pulando as que não mudaram
+
+    Boxplot, scatter e pacote HTML são uma tarefa cada; os radares são
+    divididos em lotes de pelo menos TAMANHO_LOTE_PLOTLY figuras (no
+    máximo um por processo), para que cada lote inicie o kaleido uma só
+    vez. Um gráfico é pulado quando todas as suas saídas existem e o hash
+    dos dados (hash_espec) é o mesmo registrado no manifesto.
+
+    Args:
+        especs: Lista de EspecGrafico
+        max_workers: Número de processos (padrão: os.cpu_count())
+        forcar: Se True, renderiza tudo
+        manifesto: Arquivo JSON com o hash de cada saída
+
+    Returns:
+        Lista de ResultadoRenderizacao, na mesma ordem de `especs`
+    """
+    registro = _carregar_manifesto(manifesto)
+    hashes = [hash_espec(espec) for espec in especs]
+
+    pendentes = []
+    for i, (espec, hash_atual) in enumerate(zip(especs, hashes)):
+        atualizado = not forcar and all(
+            registro.get(str(saida)) == hash_atual and Path(saida).exists()
+            for saida in espec.saidas.values()
+        )
+        if not atualizado:
+            pendentes.append(i)
+
+    resultados = [ResultadoRenderizacao(espec, 0.0, True, None) for espec in especs]
+    radares = [i for i in pendentes if especs[i].tipo in TIPOS_PLOTLY]
+    individuais = [i for i in pendentes if especs[i].tipo not in TIPOS_PLOTLY]
+
+    if pendentes:
+        limite = max_workers or os.cpu_count() or 1
+        quantidade_lotes = min(limite, math.ceil(len(radares) / TAMANHO_LOTE_PLOTLY))
+        lotes = [radares[k::quantidade_lotes] for k in range(quantidade_lotes)]
+        processos = min(limite, len(individuais) + len(lotes))
+
+        with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_worker) as executor:
+            futuros = {i: executor.submit(_tarefa_individual, especs[i]) for i in individuais}
+            futuros_lotes = [executor.submit(_tarefa_plotly, [especs[i] for i in lote]) for lote in lotes]
+
+            for i, futuro in futuros.items():
+                try:
+                    resultados[i] = ResultadoRenderizacao(especs[i], futuro.result(), False, None)
+                except Exception as e:
+                    resultados[i] = ResultadoRenderizacao(especs[i], 0.0, False, e)
+
+            for lote, futuro in zip(lotes, futuros_lotes):
+                try:
+                    por_figura = futuro.result()
+                except Exception as e:
+                    # O processo do lote falhou por inteiro (ex.: foi encerrado)
+                    por_figura = [(0.0, e)] * len(lote)
+                for i, (segundos, erro) in zip(lote, por_figura):
+                    resultados[i] = ResultadoRenderizacao(especs[i], segundos, False, erro)
+
+    for resultado, hash_atual in zip(resultados, hashes):
+        for saida in resultado.espec.saidas.values():
+            if resultado.erro is None:
+                registro[str(saida)] = hash_atual
+            else:
+                registro.pop(str(saida), None)
+    gravar_json_atomico(manifesto, registro)
+    return resultados
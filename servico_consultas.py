@@ -0,0 +1,226 @@
+"""
+Serviço de Consultas - TechNova IoT
+Servidor HTTP local (asyncio) que expõe os métodos de consulta do
+TechNovaDatabase a vários clientes ao mesmo tempo
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+from criar_banco_dados import TechNovaDatabase
+from utilitarios import valor_opcao
+
+ENDERECO_PADRAO = '127.0.0.1'
+PORTA_PADRAO = 8765
+TRABALHADORES_PADRAO = 4
+
+# Métodos expostos (GET /<método>?parâmetro=valor): parâmetro → conversor.
+# As conexões são somente leitura, então nem a consulta personalizada escreve
+METODOS = {
+    'listar_startups_ativas': {'limite': int},
+    'listar_startups_por_setor': {'setor': str},
+    'obter_melhor_startup': {},
+    'obter_top_k': {'k': int},
+    'obter_estatisticas_setor': {'setor': str},
+    'obter_avaliacoes_dimensoes': {'nome_startup': str},
+    'obter_posicoes': {'nome_startup': str},
+    'obter_startup_completa': {'nome_startup': str},
+    'consultar_startup': {'nome_startup': str},
+    'executar_query_personalizada': {'query': str},
+}
+
+MOTIVOS_HTTP = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+}
+
+
+def serializar(resultado):
+    """Converte o retorno de um método em valores JSON (DataFrames viram colunas + linhas)"""
+    if hasattr(resultado, 'columns'):
+        valores = resultado.astype(object).where(resultado.notna(), None)
+        return {'colunas': [str(coluna) for coluna in resultado.columns],
+                'linhas': valores.to_numpy().tolist()}
+    if isinstance(resultado, dict):
+        return {str(chave): serializar(valor) for chave, valor in resultado.items()}
+    if isinstance(resultado, (tuple, list)):
+        return [serializar(valor) for valor in resultado]
+    return resultado
+
+
+def _valor_json(valor):
+    """Valores que o json não conhece (escalares NumPy, datas)"""
+    return valor.item() if hasattr(valor, 'item') else str(valor)
+
+
+def _json(corpo):
+    return json.dumps(corpo, ensure_ascii=False, default=_valor_json).encode('utf-8')
+
+
+class ServicoConsultas:
+    """
+    Atende GET /<método>?parâmetros com o resultado em JSON
+
+    O laço de eventos só faz E/S: cada consulta roda em uma thread do
+    executor, todas sobre um único TechNovaDatabase somente leitura em
+    que cada thread tem a sua conexão (ver pool_conexoes). Requisições
+    idênticas (mesmo método e parâmetros) que chegam enquanto a primeira
+    ainda está em execução aguardam o mesmo resultado em vez de consultar
+    o banco de novo, e as repetidas depois disso saem do cache de
+    resultados do TechNovaDatabase (ver cache_consultas). GET /estatisticas
+    devolve os contadores do serviço, do pool de conexões e do cache.
+    """
+
+    def __init__(self, db_path='technova_iot.db', trabalhadores=TRABALHADORES_PADRAO, coalescer=True,
+                 cache_resultados=True):
+        self.db = TechNovaDatabase(db_path, somente_leitura=True, max_conexoes=trabalhadores,
+                                   cache_resultados=cache_resultados)
+        if not self.db.conectar():
+            raise sqlite3.OperationalError(f"não foi possível abrir {db_path}")
+        self.executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix='consulta')
+        self.coalescer = coalescer
+        self.em_andamento = {}
+        self.contadores = {'requisicoes': 0, 'consultas': 0, 'coalescidas': 0, 'erros': 0}
+
+    def _executar(self, metodo, parametros):
+        """Roda na thread do executor: consulta e serializa, devolvendo (status, corpo)"""
+        try:
+            return 200, _json({'resultado': serializar(getattr(self.db, metodo)(**parametros))})
+        except Exception as e:
+            # O pandas embrulha os erros do SQLite em DatabaseError (com a causa original)
+            erro_consulta = (isinstance(e, (TypeError, ValueError, sqlite3.Error))
+                             or isinstance(e.__cause__, sqlite3.Error))
+            return 400 if erro_consulta else 500, _json({'erro': str(e)})
+
+    async def responder(self, metodo, parametros):
+        """Resposta (status, corpo JSON em bytes) para um método e seus parâmetros (texto)"""
+        self.contadores['requisicoes'] += 1
+        if metodo == 'estatisticas':
+            return 200, _json(dict(self.contadores, pool=self.db.pool.estatisticas(),
+                                   cache=self.db.estatisticas_cache()))
+        status, corpo = await self._consultar(metodo, parametros)
+        if status != 200:
+            self.contadores['erros'] += 1
+        return status, corpo
+
+    async def _consultar(self, metodo, parametros):
+        conversores = METODOS.get(metodo)
+        if conversores is None:
+            return 404, _json({'erro': f"método desconhecido: {metodo}"})
+        try:
+            argumentos = {nome: conversores[nome](valor) for nome, valor in parametros.items()}
+        except KeyError as e:
+            return 400, _json({'erro': f"parâmetro desconhecido: {e.args[0]}"})
+        except ValueError as e:
+            return 400, _json({'erro': f"parâmetro inválido: {e}"})
+
+        chave = (metodo, tuple(sorted(argumentos.items())))
+        futuro = self.em_andamento.get(chave)
+        if futuro is not None:
+            self.contadores['coalescidas'] += 1
+        else:
+            self.contadores['consultas'] += 1
+            futuro = asyncio.get_running_loop().run_in_executor(
+                self.executor, self._executar, metodo, argumentos
+            )
+            if self.coalescer:
+                self.em_andamento[chave] = futuro
+                futuro.add_done_callback(lambda _: self.em_andamento.pop(chave, None))
+        # shield: um cliente que desconecta não cancela quem aguarda o mesmo resultado
+        return await asyncio.shield(futuro)
+
+    async def _atender(self, leitor, escritor):
+        """Conexão HTTP/1.1 com keep-alive: uma requisição GET por vez"""
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                try:
+                    metodo_http, alvo, versao = linha.decode('latin-1').split()
+                except ValueError:
+                    break
+                manter = versao == 'HTTP/1.1'
+                while True:
+                    cabecalho = await leitor.readline()
+                    if cabecalho in (b'\r\n', b'\n', b''):
+                        break
+                    nome, _, valor = cabecalho.decode('latin-1').partition(':')
+                    if nome.strip().lower() == 'connection':
+                        manter = valor.strip().lower() == 'keep-alive'
+
+                if metodo_http == 'GET':
+                    partes = urlsplit(alvo)
+                    status, corpo = await self.responder(partes.path.strip('/'), dict(parse_qsl(partes.query)))
+                else:
+                    status, corpo = 405, _json({'erro': 'apenas GET é aceito'})
+
+                escritor.write(
+                    f"HTTP/1.1 {status} {MOTIVOS_HTTP[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(corpo)}\r\n"
+                    f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode('latin-1') + corpo
+                )
+                await escritor.drain()
+                if not manter:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, endereco=ENDERECO_PADRAO, porta=PORTA_PADRAO):
+        """Abre o socket (porta 0 escolhe uma livre) e devolve o asyncio.Server"""
+        return await asyncio.start_server(self._atender, endereco, porta)
+
+    def fechar(self):
+        self.executor.shutdown(wait=True)
+        self.db.desconectar()
+
+
+async def _servir(db_path, endereco, porta, trabalhadores):
+    servico = ServicoConsultas(db_path, trabalhadores)
+    servidor = await servico.iniciar(endereco, porta)
+    porta = servidor.sockets[0].getsockname()[1]
+    print(f"✓ Serviço de consultas em http://{endereco}:{porta}/ ({trabalhadores} conexões somente leitura)")
+    print(f"  Métodos: {', '.join(METODOS)}, estatisticas")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.fechar()
+
+
+def main():
+    """
+    Uso: python servico_consultas.py [--db technova_iot.db] [--endereco 127.0.0.1]
+         [--porta 8765] [--trabalhadores 4]
+    """
+    try:
+        porta = int(valor_opcao('--porta', PORTA_PADRAO))
+        trabalhadores = int(valor_opcao('--trabalhadores', TRABALHADORES_PADRAO))
+    except ValueError as e:
+        print(f"✗ Argumento inválido: {e}")
+        sys.exit(1)
+    try:
+        asyncio.run(_servir(valor_opcao('--db', 'technova_iot.db'), valor_opcao('--endereco', ENDERECO_PADRAO),
+                            porta, trabalhadores))
+    except KeyboardInterrupt:
+        print("\n✓ Serviço encerrado")
+    except (OSError, sqlite3.Error) as e:
+        print(f"✗ Erro ao iniciar o serviço: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Snapshot em Memória do Banco - TechNova IoT
+Carrega startups, scores por dimensão e por critério uma única vez em
+arrays indexados por id e por nome, para consultas interativas sem SQL
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from busca_nomes import LIMITE_RESULTADOS, IndiceNomes
+from notas_compactas import carregar_matriz_notas, usa_armazenamento_compacto
+from utilitarios import versao_banco
+
+
+class SnapshotBanco:
+    """
+    Cópia somente leitura dos dados usados pelo visualizador
+
+    As ordenações e os arredondamentos vêm das mesmas consultas SQL do
+    visualizador, executadas uma vez na carga; depois disso cada consulta
+    é apenas indexação em arrays. O snapshot é recarregado quando o banco
+    muda: `PRAGMA data_version` detecta commits de outras conexões e
+    `total_changes` os da própria conexão.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.versao = None
+        self.atualizar()
+
+    def atualizar(self):
+        """Recarrega o snapshot se o banco mudou desde a última carga (retorna True se recarregou)"""
+        versao = versao_banco(self.conn)
+        if versao == self.versao:
+            return False
+        self._carregar()
+        self.versao = versao
+        return True
+
+    def _carregar(self):
+        conn = self.conn
+
+        # Startups, na ordem do id
+        linhas = conn.execute('''
+            SELECT id, nome_startup, setor, status, score_global, score_performance_viabilidade,
+                   ROUND(score_global, 2), ROUND(score_performance_viabilidade, 2)
+            FROM startups
+            ORDER BY id
+        ''').fetchall()
+        colunas = list(zip(*linhas)) if linhas else [()] * 8
+        self.ids = np.array(colunas[0], dtype=np.int64)
+        self.nomes = np.array(colunas[1], dtype=object)
+        self.setores = np.array(colunas[2], dtype=object)
+        self.status = np.array(colunas[3], dtype=object)
+        self.score_global = np.array(colunas[4], dtype=np.float64)
+        self.score_pv = np.array(colunas[5], dtype=np.float64)
+        self.score_global_2 = np.array(colunas[6], dtype=np.float64)
+        self.score_pv_2 = np.array(colunas[7], dtype=np.float64)
+        self.posicao_por_id = {startup_id: i for i, startup_id in enumerate(colunas[0])}
+        self.posicao_por_nome = {nome: i for i, nome in enumerate(colunas[1])}
+        self.indice_nomes = IndiceNomes(self.nomes)
+
+        # Ordenações usadas pelas listagens, com o id desempatando como nas
+        # consultas do visualizador
+        self.ordem_por_status = {
+            status: self._posicoes(conn.execute(
+                'SELECT id FROM startups WHERE status = ? ORDER BY score_global DESC, id', (status,)
+            ))
+            for status in ('Ativa', 'Inativa')
+        }
+        self.ordem_top = self._posicoes(conn.execute('''
+            SELECT id FROM startups
+            WHERE status = 'Ativa'
+            ORDER BY score_performance_viabilidade DESC, id
+        '''))
+        self.ordem_busca = self._posicoes(conn.execute(
+            'SELECT id FROM startups ORDER BY score_global DESC, id'
+        ))
+
+        # Dimensões e critérios em layout CSR: as linhas de cada startup
+        # ficam contíguas, entre inicio[posicao] e inicio[posicao + 1]
+        self.dimensoes = self._carregar_csr('''
+            SELECT startup_id, dimensao, ROUND(score, 2)
+            FROM avaliacoes_dimensoes
+            ORDER BY startup_id, dimensao
+        ''')
+        if usa_armazenamento_compacto(conn):
+            self.criterios = self._carregar_criterios_compactos()
+        else:
+            self.criterios = self._carregar_csr('''
+                SELECT startup_id, criterio, ROUND(score, 2)
+                FROM avaliacoes_detalhadas
+                ORDER BY startup_id, score DESC, id
+            ''')
+
+        self.estatisticas = pd.read_sql_query('''
+            SELECT setor, total_startups, startups_ativas, startups_inativas,
+                   ROUND(score_medio, 2) as score_medio,
+                   ROUND(score_min, 2) as score_min,
+                   ROUND(score_max, 2) as score_max
+            FROM estatisticas_setor
+            ORDER BY score_medio DESC, setor
+        ''', conn)
+
+    def _posicoes(self, cursor):
+        """Converte ids retornados por uma consulta em posições dos arrays"""
+        return np.array([self.posicao_por_id[linha[0]] for linha in cursor], dtype=np.intp)
+
+    def _carregar_csr(self, query):
+        """Carrega (startup_id, rótulo, score) como rótulos/scores contíguos por startup"""
+        linhas = self.conn.execute(query).fetchall()
+        startup_ids = np.array([linha[0] for linha in linhas], dtype=np.int64)
+        rotulos = np.array([linha[1] for linha in linhas], dtype=object)
+        scores = np.array([linha[2] for linha in linhas], dtype=np.float64)
+        return self._montar_csr(startup_ids, rotulos, scores)
+
+    def _carregar_criterios_compactos(self):
+        """
+        Critérios do modo compacto direto da matriz de notas, na mesma ordem
+        da visão avaliacoes_detalhadas (startup, score decrescente, critério)
+        """
+        ids, criterios, matriz = carregar_matriz_notas(self.conn)
+        linhas, colunas = np.nonzero(matriz)
+        notas = matriz[linhas, colunas]
+        ordem = np.lexsort((colunas, -notas.astype(np.int64), ids[linhas]))
+        return self._montar_csr(ids[linhas[ordem]], np.array(criterios, dtype=object)[colunas[ordem]],
+                                notas[ordem].astype(np.float64))
+
+    def _montar_csr(self, startup_ids, rotulos, scores):
+        """Delimita o intervalo de cada startup em linhas já ordenadas por startup_id"""
+        # Linhas órfãs (startup inexistente) ficam fora de qualquer intervalo
+        inicio = np.searchsorted(startup_ids, self.ids, side='left')
+        fim = np.searchsorted(startup_ids, self.ids, side='right')
+        return {'rotulos': rotulos, 'scores': scores, 'inicio': inicio, 'fim': fim}
+
+    def startups_por_status(self, status):
+        """(nome, setor, score_global, score_pv) das startups com o status, por score_global"""
+        ordem = self.ordem_por_status.get(status, np.empty(0, dtype=np.intp))
+        return list(zip(self.nomes[ordem], self.setores[ordem],
+                        self.score_global[ordem], self.score_pv[ordem]))
+
+    def buscar(self, termo):
+        """
+        Busca por parte do nome com a semântica de LIKE '%termo%' do SQLite
+        (maiúsculas/minúsculas ignoradas só em ASCII; % e _ são curingas)
+        """
+        padrao = ''.join('.*' if c == '%' else '.' if c == '_' else re.escape(c) for c in termo)
+        regex = re.compile(f'.*{padrao}.*', re.IGNORECASE | re.ASCII | re.DOTALL)
+        return [
+            (self.nomes[i], self.setores[i], self.status[i], self.score_global[i], self.score_pv[i])
+            for i in self.ordem_busca if regex.fullmatch(self.nomes[i])
+        ]
+
+    def buscar_rapido(self, termo, limite=LIMITE_RESULTADOS):
+        """
+        Busca ranqueada pelo índice de n-gramas (exata, prefixo, trecho e
+        aproximada, ignorando maiúsculas e acentos)
+
+        Returns:
+            Lista de (nome, setor, status, score_global, score_pv,
+            correspondência), da mais para a menos relevante
+        """
+        return [
+            (self.nomes[r.posicao], self.setores[r.posicao], self.status[r.posicao],
+             self.score_global[r.posicao], self.score_pv[r.posicao], r.tipo)
+            for r in self.indice_nomes.buscar(termo, limite)
+        ]
+
+    def top(self, limite=None):
+        """
+        (nome, setor, score_global, score_pv) arredondados das `limite`
+        melhores ativas; como o LIMIT do SQLite, None ou negativo devolve todas
+        """
+        ordem = self.ordem_top if limite is None or limite < 0 else self.ordem_top[:limite]
+        return list(zip(self.nomes[ordem], self.setores[ordem],
+                        self.score_global_2[ordem], self.score_pv_2[ordem]))
+
+    def _linhas_csr(self, tabela, posicao):
+        inicio, fim = tabela['inicio'][posicao], tabela['fim'][posicao]
+        return list(zip(tabela['rotulos'][inicio:fim], tabela['scores'][inicio:fim]))
+
+    def detalhes(self, nome):
+        """
+        Dados completos de uma startup pelo nome exato
+
+        Returns:
+            Dicionário com 'startup' (id, nome, setor, status, score_global,
+            score_pv), 'dimensoes' e 'criterios' (listas de (rótulo, score
+            arredondado), critérios do maior para o menor), ou None
+        """
+        posicao = self.posicao_por_nome.get(nome)
+        if posicao is None:
+            return None
+        return {
+            'startup': (int(self.ids[posicao]), self.nomes[posicao], self.setores[posicao],
+                        self.status[posicao], self.score_global[posicao], self.score_pv[posicao]),
+            'dimensoes': self._linhas_csr(self.dimensoes, posicao),
+            'criterios': self._linhas_csr(self.criterios, posicao),
+        }
@@ -0,0 +1,45 @@
+"""
+Fixtures dos testes - TechNova IoT
+Aba Avaliacoes_Startups da planilha do case gravada em CSV e importada num
+banco novo a cada teste
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from criar_banco_dados import TechNovaDatabase  # noqa: E402
+
+PLANILHA_CASE = Path(__file__).resolve().parent.parent / 'Case_TechNova_Dados.xlsx'
+
+
+@pytest.fixture(scope='session')
+def avaliacoes():
+    """Aba Avaliacoes_Startups lida uma única vez"""
+    return pd.read_excel(PLANILHA_CASE, sheet_name='Avaliacoes_Startups')
+
+
+@pytest.fixture
+def planilha(tmp_path, avaliacoes):
+    """CSV com as colunas da aba Avaliacoes_Startups"""
+    caminho = tmp_path / 'avaliacoes.csv'
+    avaliacoes.to_csv(caminho, index=False)
+    return caminho
+
+
+@pytest.fixture
+def banco(tmp_path, planilha):
+    """Banco criado e populado a partir da planilha sintética"""
+    db = TechNovaDatabase(str(tmp_path / 'technova.db'))
+    assert db.conectar()
+    db.criar_tabelas()
+    assert db.importar_dados_excel(str(planilha), usar_cache=False)
+    yield db
+    db.desconectar()
@@ -0,0 +1,38 @@
+"""
+Testes do cache colunar da planilha de avaliações (cache_avaliacoes)
+"""
+
+import pandas as pd
+
+from cache_avaliacoes import blocos_avaliacoes, carregar_avaliacoes
+from leitor_dados import ler_avaliacoes
+
+
+def test_cache_igual_a_leitura_direta(planilha, tmp_path, capsys):
+    dir_cache = tmp_path / 'cache'
+    direta = ler_avaliacoes(str(planilha))
+
+    pd.testing.assert_frame_equal(carregar_avaliacoes(str(planilha), dir_cache=dir_cache), direta)
+    assert 'Cache atualizado' in capsys.readouterr().out
+    pd.testing.assert_frame_equal(carregar_avaliacoes(str(planilha), dir_cache=dir_cache), direta)
+    assert 'Cache válido' in capsys.readouterr().out
+
+
+def test_blocos_do_cache_iguais_a_leitura_direta(planilha, tmp_path):
+    dir_cache = tmp_path / 'cache'
+    direta = ler_avaliacoes(str(planilha))
+    for _ in range(2):
+        blocos = list(blocos_avaliacoes(str(planilha), tamanho_bloco=10, dir_cache=dir_cache))
+        assert [len(bloco) for bloco in blocos[:-1]] == [10] * (len(blocos) - 1)
+        pd.testing.assert_frame_equal(pd.concat(blocos), direta)
+
+
+def test_leitura_interrompida_nao_grava_cache(planilha, tmp_path, capsys):
+    dir_cache = tmp_path / 'cache'
+    blocos = blocos_avaliacoes(str(planilha), tamanho_bloco=10, dir_cache=dir_cache)
+    next(blocos)
+    blocos.close()
+    assert not list(dir_cache.rglob('*.npy')) and not list(dir_cache.rglob('meta.json'))
+
+    carregar_avaliacoes(str(planilha), dir_cache=dir_cache)
+    assert 'Cache atualizado' in capsys.readouterr().out
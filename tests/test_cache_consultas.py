@@ -0,0 +1,69 @@
+"""
+Testes da invalidação do cache de resultados (cache_consultas.CacheConsultas)
+"""
+
+import sqlite3
+
+from cache_consultas import CacheConsultas
+
+CONSULTA = "SELECT COUNT(*) FROM startups WHERE status = 'Ativa'"
+
+
+def _ativas(db):
+    return db.executar_query_personalizada(CONSULTA).iloc[0, 0]
+
+
+def test_consulta_repetida_vem_do_cache(banco):
+    primeira = _ativas(banco)
+    assert _ativas(banco) == primeira
+    estatisticas = banco.estatisticas_cache()
+    assert estatisticas['acertos'] == 1 and estatisticas['faltas'] == 1
+
+
+def test_escrita_na_mesma_conexao_invalida(banco):
+    antes = _ativas(banco)
+    banco.cursor.execute("UPDATE startups SET status = 'Inativa' WHERE id = "
+                         "(SELECT MIN(id) FROM startups WHERE status = 'Ativa')")
+    # Ainda sem commit: a própria conexão já enxerga a escrita
+    assert _ativas(banco) == antes - 1
+    banco.conn.commit()
+    assert _ativas(banco) == antes - 1
+    assert banco.estatisticas_cache()['invalidacoes'] >= 1
+
+
+def test_rollback_nao_deixa_resultado_desfeito_no_cache(banco):
+    antes = _ativas(banco)
+    banco.cursor.execute("UPDATE startups SET status = 'Inativa' WHERE status = 'Ativa'")
+    assert _ativas(banco) == 0
+    banco.conn.rollback()
+    assert _ativas(banco) == antes
+    assert _ativas(banco) == antes
+    assert banco.estatisticas_cache()['acertos'] == 1
+
+
+def test_commit_de_outra_conexao_invalida(banco):
+    antes = _ativas(banco)
+    outra = sqlite3.connect(banco.db_path)
+    try:
+        outra.execute("UPDATE startups SET status = 'Ativa' WHERE status = 'Inativa'")
+        outra.commit()
+    finally:
+        outra.close()
+    assert _ativas(banco) == banco.cursor.execute('SELECT COUNT(*) FROM startups').fetchone()[0] > antes
+
+
+def test_metodos_de_escrita_invalidam(banco):
+    nome, = banco.cursor.execute("SELECT nome_startup FROM startups WHERE status = 'Ativa'").fetchone()
+    assert banco.consultar_startup(nome)[3] == 'Ativa'
+    assert banco.desativar_startup(nome)
+    assert banco.consultar_startup(nome)[3] == 'Inativa'
+
+
+def test_escritas_nao_sao_guardadas():
+    conn = sqlite3.connect(':memory:')
+    cache = CacheConsultas()
+    conn.execute('CREATE TABLE t (x)')
+    for _ in range(2):
+        cache.consultar(conn, 'INSERT INTO t VALUES (1)', None, lambda: conn.execute('INSERT INTO t VALUES (1)'))
+    assert conn.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 2
+    assert cache.estatisticas()['entradas'] == 0
@@ -0,0 +1,104 @@
+"""
+Testes da exportação incremental (motor_exportacao.exportar_alteradas)
+"""
+
+import sqlite3
+from pathlib import Path
+
+from criar_banco_dados import TechNovaDatabase
+from motor_exportacao import TarefaExportacao, exportar_alteradas
+
+TAREFAS = [
+    TarefaExportacao('startups', 'startups', 'powerbi_startups',
+                     'SELECT * FROM startups ORDER BY id', ('startups',)),
+    TarefaExportacao('avaliacoes_dimensoes', 'avaliacoes_dimensoes', 'powerbi_avaliacoes_dimensoes',
+                     'SELECT * FROM avaliacoes_dimensoes ORDER BY id', ('avaliacoes_dimensoes',)),
+]
+
+
+def _refeitas(resultados):
+    assert all(resultado.erro is None for resultado in resultados)
+    return {resultado.tarefa.nome for resultado in resultados if not resultado.reaproveitado}
+
+
+def test_exportacao_repetida_reaproveita_arquivos(banco, tmp_path):
+    saida = tmp_path / 'export'
+    resultados = exportar_alteradas(banco.db_path, TAREFAS, saida)
+    assert _refeitas(resultados) == {'startups', 'avaliacoes_dimensoes'}
+    assert all(resultado.thread is not None for resultado in resultados)
+    conteudo = (saida / 'powerbi_startups.csv').read_bytes()
+
+    resultados = exportar_alteradas(banco.db_path, TAREFAS, saida)
+    assert _refeitas(resultados) == set()
+    assert all(resultado.thread is None for resultado in resultados)
+    assert resultados[0].registros == banco.cursor.execute('SELECT COUNT(*) FROM startups').fetchone()[0]
+    assert (saida / 'powerbi_startups.csv').read_bytes() == conteudo
+
+
+def test_alteracao_refaz_apenas_tabelas_afetadas(banco, tmp_path):
+    saida = tmp_path / 'export'
+    exportar_alteradas(banco.db_path, TAREFAS, saida)
+
+    nome = banco.cursor.execute("SELECT nome_startup FROM startups WHERE status = 'Ativa'").fetchone()[0]
+    assert banco.desativar_startup(nome)
+
+    assert _refeitas(exportar_alteradas(banco.db_path, TAREFAS, saida)) == {'startups'}
+    assert f'{nome},' in (saida / 'powerbi_startups.csv').read_text(encoding='utf-8-sig')
+
+
+def test_arquivo_editado_ou_apagado_e_refeito(banco, tmp_path):
+    saida = tmp_path / 'export'
+    exportar_alteradas(banco.db_path, TAREFAS, saida)
+
+    with open(saida / 'powerbi_startups.csv', 'a', encoding='utf-8') as f:
+        f.write('linha editada\n')
+    (saida / 'powerbi_avaliacoes_dimensoes.csv').unlink()
+    assert _refeitas(exportar_alteradas(banco.db_path, TAREFAS, saida)) == {'startups', 'avaliacoes_dimensoes'}
+    assert 'linha editada' not in (saida / 'powerbi_startups.csv').read_text(encoding='utf-8-sig')
+
+
+def test_forcar_e_consulta_alterada_refazem(banco, tmp_path):
+    saida = tmp_path / 'export'
+    exportar_alteradas(banco.db_path, TAREFAS, saida)
+
+    assert _refeitas(exportar_alteradas(banco.db_path, TAREFAS, saida, forcar=True)) == {
+        'startups', 'avaliacoes_dimensoes'}
+
+    outra_consulta = [TAREFAS[0]._replace(query='SELECT id, nome_startup FROM startups ORDER BY id'), TAREFAS[1]]
+    assert _refeitas(exportar_alteradas(banco.db_path, outra_consulta, saida)) == {'startups'}
+
+
+def test_banco_recriado_com_mesmas_contagens_e_refeito(banco, tmp_path, planilha):
+    saida = tmp_path / 'export'
+    exportar_alteradas(banco.db_path, TAREFAS, saida)
+
+    # Mesma planilha: contagens, maiores ids e versões iguais às do banco anterior
+    banco.desconectar()
+    for sufixo in ('', '-wal', '-shm'):
+        Path(banco.db_path + sufixo).unlink(missing_ok=True)
+    recriado = TechNovaDatabase(banco.db_path)
+    assert recriado.conectar()
+    recriado.criar_tabelas()
+    assert recriado.importar_dados_excel(str(planilha), usar_cache=False)
+    recriado.desconectar()
+
+    assert _refeitas(exportar_alteradas(banco.db_path, TAREFAS, saida)) == {'startups', 'avaliacoes_dimensoes'}
+
+
+def test_escrita_fora_do_importador_refaz_exportacao(banco, tmp_path):
+    saida = tmp_path / 'export'
+    tarefas = TAREFAS + [TarefaExportacao('startups_completo', 'startups_completo', 'powerbi_startups_completo',
+                                          'SELECT * FROM startups_completo ORDER BY id', ('startups_completo',))]
+    banco.criar_gatilhos_tabela_larga()
+    exportar_alteradas(banco.db_path, tarefas, saida)
+
+    # UPDATE manual que não muda contagens nem ids, propagado à tabela larga pelos triggers dela
+    outra = sqlite3.connect(banco.db_path)
+    try:
+        outra.execute('UPDATE avaliacoes_dimensoes SET score = score / 2 WHERE id = 1')
+        outra.commit()
+    finally:
+        outra.close()
+
+    assert _refeitas(exportar_alteradas(banco.db_path, tarefas, saida)) == {
+        'avaliacoes_dimensoes', 'startups_completo'}
@@ -0,0 +1,88 @@
+"""
+Testes da importação incremental (TechNovaDatabase.importar_incremental)
+"""
+
+import pandas as pd
+import pytest
+
+TABELAS = ['startups', 'avaliacoes_dimensoes', 'avaliacoes_detalhadas', 'estatisticas_setor',
+           'startups_completo', 'posicoes_startups', 'controle_alteracoes']
+
+
+def _estado(db):
+    """Conteúdo de todas as tabelas alteradas pela importação"""
+    return {tabela: db.cursor.execute(f'SELECT * FROM {tabela} ORDER BY 1, 2').fetchall() for tabela in TABELAS}
+
+
+@pytest.fixture
+def planilha_alterada(planilha):
+    """Planilha com uma startup alterada e uma nova"""
+    df = pd.read_csv(planilha)
+    criterio = df.columns[-1]
+    df.loc[0, criterio] = 5 if df.loc[0, criterio] != 5 else 1
+    nova = df.iloc[[1]].assign(id_startup=len(df) + 1, nome_startup='Startup Nova')
+    pd.concat([df, nova], ignore_index=True).to_csv(planilha, index=False)
+    return planilha
+
+
+def test_planilha_inalterada_nao_grava(banco, planilha):
+    antes = _estado(banco)
+    assert banco.importar_incremental(str(planilha), usar_cache=False)
+    assert _estado(banco) == antes
+
+
+def test_falha_desfaz_toda_a_importacao(banco, planilha_alterada, capsys):
+    antes = _estado(banco)
+
+    gravar = banco._gravar_avaliacoes
+
+    def falha(*args, substituir=False, **kwargs):
+        # Falha ao gravar as startups alteradas, depois de inserida a nova
+        if substituir:
+            raise RuntimeError('falha simulada')
+        return gravar(*args, substituir=substituir, **kwargs)
+    banco._gravar_avaliacoes = falha
+
+    assert banco.importar_incremental(str(planilha_alterada), usar_cache=False) is False
+    assert 'falha simulada' in capsys.readouterr().out
+    assert not banco.conn.in_transaction
+    assert _estado(banco) == antes
+
+    # Sem a falha, a mesma planilha é importada normalmente
+    del banco._gravar_avaliacoes
+    assert banco.importar_incremental(str(planilha_alterada), usar_cache=False)
+    saida = capsys.readouterr().out
+    assert '✓ 1 startups inseridas' in saida and '✓ 1 startups atualizadas' in saida
+    total = banco.cursor.execute('SELECT COUNT(*) FROM startups').fetchone()[0]
+    assert total == len(pd.read_csv(planilha_alterada))
+    assert banco.cursor.execute(
+        "SELECT COUNT(*) FROM posicoes_startups p JOIN startups s ON s.id = p.startup_id "
+        "WHERE s.nome_startup = 'Startup Nova'"
+    ).fetchone()[0] > 0
+
+
+def test_estatisticas_incrementais_iguais_as_recalculadas(banco, planilha_alterada):
+    assert banco.importar_incremental(str(planilha_alterada), usar_cache=False)
+    incrementais = banco.cursor.execute('''
+        SELECT setor, total_startups, startups_ativas, startups_inativas, score_medio, score_min, score_max
+        FROM estatisticas_setor ORDER BY setor
+    ''').fetchall()
+    recalculadas = banco.cursor.execute('''
+        SELECT setor, COUNT(*), SUM(status = 'Ativa'), SUM(status = 'Inativa'),
+               AVG(score_global), MIN(score_global), MAX(score_global)
+        FROM startups GROUP BY setor ORDER BY setor
+    ''').fetchall()
+    assert [linha[:4] for linha in incrementais] == [linha[:4] for linha in recalculadas]
+    for incremental, recalculada in zip(incrementais, recalculadas):
+        assert incremental[4:] == pytest.approx(recalculada[4:])
+
+
+def test_exportacao_de_startups_sem_colunas_de_controle(banco, planilha_alterada, tmp_path):
+    from exportar_para_powerbi import exportar_para_powerbi
+
+    assert banco.importar_incremental(str(planilha_alterada), usar_cache=False)
+    saida = tmp_path / 'export'
+    exportar_para_powerbi(banco.db_path, str(saida))
+    assert list(pd.read_csv(saida / 'powerbi_startups.csv').columns) == [
+        'id', 'nome_startup', 'setor', 'status', 'score_global', 'score_performance_viabilidade',
+        'data_cadastro']
@@ -0,0 +1,48 @@
+"""
+Testes do armazenamento compacto das notas (notas_compactas)
+"""
+
+import pandas as pd
+import pytest
+
+from criar_banco_dados import TechNovaDatabase
+from snapshot_banco import SnapshotBanco
+from visualizador_banco import CONSULTAS
+
+NOTAS = 'SELECT startup_id, criterio, score FROM avaliacoes_detalhadas ORDER BY startup_id, criterio'
+
+
+@pytest.fixture
+def banco_compacto(tmp_path, planilha):
+    """Banco compacto populado a partir da mesma planilha do fixture `banco`"""
+    db = TechNovaDatabase(str(tmp_path / 'compacto.db'), armazenamento_compacto=True)
+    assert db.conectar()
+    db.criar_tabelas()
+    assert db.importar_dados_excel(str(planilha), usar_cache=False)
+    yield db
+    db.desconectar()
+
+
+def test_visao_igual_a_tabela_normalizada(banco, banco_compacto):
+    assert banco_compacto.conn.execute(NOTAS).fetchall() == banco.conn.execute(NOTAS).fetchall()
+
+
+def test_criterios_do_snapshot_iguais_ao_sql(banco_compacto):
+    snapshot = SnapshotBanco(banco_compacto.conn)
+    for nome in snapshot.nomes[:10]:
+        assert snapshot.detalhes(nome)['criterios'] == banco_compacto.conn.execute(
+            CONSULTAS['criterios_startup'], (nome,)).fetchall()
+
+
+def test_importacao_incremental_atualiza_notas(banco_compacto, planilha):
+    df = pd.read_csv(planilha)
+    criterio = df.columns[-1]
+    df.loc[0, criterio] = 5 if df.loc[0, criterio] != 5 else 1
+    df.to_csv(planilha, index=False)
+
+    assert banco_compacto.importar_incremental(str(planilha), usar_cache=False)
+    nota = banco_compacto.conn.execute('''
+        SELECT a.score FROM avaliacoes_detalhadas a JOIN startups s ON s.id = a.startup_id
+        WHERE s.nome_startup = ? AND a.criterio = ?
+    ''', (df.loc[0, 'nome_startup'], criterio)).fetchone()
+    assert nota == (df.loc[0, criterio],)
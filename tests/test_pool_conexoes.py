@@ -0,0 +1,60 @@
+"""
+Testes do pool de conexões (pool_conexoes)
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+import pool_conexoes
+from pool_conexoes import PoolConexoes
+
+
+def _criar_banco(caminho, valor):
+    conn = sqlite3.connect(caminho)
+    conn.execute('CREATE TABLE t (valor INTEGER)')
+    conn.execute('INSERT INTO t VALUES (?)', (valor,))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """Pool sobre um banco pequeno, verificando a conexão a cada chamada"""
+    monkeypatch.setattr(pool_conexoes, 'INTERVALO_VERIFICACAO', 0)
+    caminho = str(tmp_path / 'pool.db')
+    _criar_banco(caminho, 1)
+    pool = PoolConexoes(caminho, tamanho=2)
+    yield pool
+    pool.fechar()
+
+
+def _recriar(pool, valor):
+    """Recria o arquivo do banco (outro inode) com outro conteúdo"""
+    novo = f'{pool.db_path}.novo'
+    _criar_banco(novo, valor)
+    os.replace(novo, pool.db_path)
+
+
+def test_arquivo_recriado_reabre_a_conexao(pool):
+    conn = pool.obter()
+    assert conn.execute('SELECT valor FROM t').fetchone() == (1,)
+
+    _recriar(pool, 2)
+    assert pool.obter().execute('SELECT valor FROM t').fetchone() == (2,)
+    assert pool.estatisticas()['reconexoes'] == 1
+
+
+def test_conexao_nao_e_trocada_com_transacao_aberta(pool):
+    conn = pool.obter()
+    conn.execute('INSERT INTO t VALUES (10)')
+    assert conn.in_transaction
+
+    _recriar(pool, 2)
+    assert pool.obter() is conn
+    assert conn.execute('SELECT COUNT(*) FROM t').fetchone() == (2,)
+
+    conn.rollback()
+    assert pool.obter() is not conn
+    assert pool.estatisticas()['reconexoes'] == 1
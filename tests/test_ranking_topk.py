@@ -0,0 +1,38 @@
+"""
+Testes do top-K por seleção parcial (ranking_topk) e do top-K em SQL
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ranking_topk import top_k_indices
+
+
+@pytest.mark.parametrize('k', [0, 1, 3, 7, 8])
+def test_top_k_indices_igual_a_nlargest(k):
+    # Valores repetidos e NaN: empates vão para quem aparece primeiro
+    valores = np.array([3.0, 1.5, np.nan, 3.0, 4.25, 1.5, 2.0, 4.25, np.nan, 3.0])
+    esperado = pd.Series(valores).nlargest(k, keep='first').index.to_numpy()
+    assert top_k_indices(valores, k).tolist() == esperado.tolist()
+
+
+@pytest.mark.parametrize('k', [1, 5, 100])
+def test_top_k_indices_igual_ao_sql(banco, k):
+    ativas = pd.read_sql_query('''
+        SELECT nome_startup, score_performance_viabilidade
+        FROM startups WHERE status = 'Ativa' ORDER BY id
+    ''', banco.conn)
+    posicoes = top_k_indices(ativas['score_performance_viabilidade'].to_numpy(), k)
+    assert ativas['nome_startup'].iloc[posicoes].tolist() == banco.obter_top_k(k)['geral']['nome_startup'].tolist()
+
+
+def test_top_k_por_setor_e_dimensao_do_sql(banco):
+    resultado = banco.obter_top_k(2)
+    por_setor = banco.cursor.execute('''
+        SELECT setor, COUNT(*) FROM startups WHERE status = 'Ativa' GROUP BY setor
+    ''').fetchall()
+    assert {setor: len(grupo) for setor, grupo in resultado['por_setor'].items()} == {
+        setor: min(total, 2) for setor, total in por_setor}
+    for grupo in [*resultado['por_setor'].values(), *resultado['por_dimensao'].values()]:
+        assert grupo.iloc[:, -1].is_monotonic_decreasing
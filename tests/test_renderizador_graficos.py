@@ -0,0 +1,31 @@
+"""
+Testes da renderização paralela dos gráficos (renderizador_graficos)
+"""
+
+import json
+
+from renderizador_graficos import espec_radar, renderizar_graficos
+
+CATEGORIAS = ['Performance', 'Viabilidade', 'Confiabilidade']
+
+
+def _radar(nome, saida):
+    return espec_radar(nome, 'SmartCity', 3.2, CATEGORIAS, [3.0, 3.5, 3.1], {'html': str(saida)})
+
+
+def test_erro_de_um_radar_nao_afeta_o_lote(tmp_path):
+    especs = [_radar('Ok', tmp_path / 'ok.html'), _radar('Falha', tmp_path / 'inexistente' / 'falha.html')]
+    manifesto = tmp_path / 'manifesto.json'
+
+    resultados = renderizar_graficos(especs, max_workers=1, manifesto=str(manifesto))
+
+    assert resultados[0].erro is None and (tmp_path / 'ok.html').exists()
+    assert resultados[1].erro is not None
+    assert list(json.loads(manifesto.read_text(encoding='utf-8'))) == [str(tmp_path / 'ok.html')]
+
+
+def test_radar_inalterado_e_reaproveitado(tmp_path):
+    especs = [_radar('Ok', tmp_path / 'ok.html')]
+    manifesto = str(tmp_path / 'manifesto.json')
+    assert not renderizar_graficos(especs, max_workers=1, manifesto=manifesto)[0].reaproveitado
+    assert renderizar_graficos(especs, max_workers=1, manifesto=manifesto)[0].reaproveitado
@@ -0,0 +1,55 @@
+"""
+Testes do snapshot em memória e dos rankings contra as consultas SQL
+"""
+
+import pytest
+
+from snapshot_banco import SnapshotBanco
+from visualizador_banco import CONSULTAS
+
+
+@pytest.fixture
+def snapshot(banco):
+    return SnapshotBanco(banco.conn)
+
+
+@pytest.mark.parametrize('limite', [-5, -1, 0, 1, 3, 10, 1000])
+def test_top_igual_ao_sql(banco, snapshot, limite):
+    assert snapshot.top(limite) == banco.conn.execute(CONSULTAS['top_startups'], (limite,)).fetchall()
+
+
+def test_top_sem_limite_devolve_todas(banco, snapshot):
+    assert snapshot.top() == banco.conn.execute(CONSULTAS['top_startups'], (-1,)).fetchall()
+
+
+@pytest.mark.parametrize('status', ['Ativa', 'Inativa'])
+def test_startups_por_status_igual_ao_sql(banco, snapshot, status):
+    assert snapshot.startups_por_status(status) == banco.conn.execute(
+        CONSULTAS['startups_por_status'], (status,)).fetchall()
+
+
+def test_snapshot_recarrega_apos_escrita(banco, snapshot):
+    assert snapshot.atualizar() is False
+    melhor = snapshot.top(1)[0][0]
+    assert banco.desativar_startup(melhor)
+
+    assert snapshot.atualizar() is True
+    assert snapshot.top(1)[0][0] != melhor
+    assert snapshot.top(10) == banco.conn.execute(CONSULTAS['top_startups'], (10,)).fetchall()
+
+
+@pytest.mark.parametrize('termo', ['', 'a', 'Sun', '1_', '%0'])
+def test_busca_igual_ao_sql(banco, snapshot, termo):
+    assert snapshot.buscar(termo) == banco.conn.execute(CONSULTAS['buscar_startup'], (termo,)).fetchall()
+
+
+def test_detalhes_iguais_ao_sql(banco, snapshot):
+    for nome in snapshot.nomes[:10]:
+        detalhes = snapshot.detalhes(nome)
+        assert detalhes['dimensoes'] == banco.conn.execute(CONSULTAS['dimensoes_startup'], (nome,)).fetchall()
+        assert detalhes['criterios'] == banco.conn.execute(CONSULTAS['criterios_startup'], (nome,)).fetchall()
+
+
+def test_estatisticas_iguais_ao_sql(banco, snapshot):
+    assert list(snapshot.estatisticas.itertuples(index=False, name=None)) == banco.conn.execute(
+        CONSULTAS['estatisticas_setor']).fetchall()
@@ -0,0 +1,57 @@
+"""
+Testes da tabela larga materializada (startups_completo)
+"""
+
+import sqlite3
+
+import pandas as pd
+
+from exportar_para_powerbi import exportar_para_powerbi
+
+
+def test_exportacao_da_tabela_larga_igual_ao_pivot(banco, tmp_path):
+    assert exportar_para_powerbi(banco.db_path, str(tmp_path / 'larga')) is not False
+
+    conn = sqlite3.connect(banco.db_path)
+    conn.execute('DROP TABLE startups_completo')
+    conn.commit()
+    conn.close()
+    assert exportar_para_powerbi(banco.db_path, str(tmp_path / 'pivot')) is not False
+
+    arquivo = 'powerbi_startups_completo.csv'
+    assert (tmp_path / 'larga' / arquivo).read_bytes() == (tmp_path / 'pivot' / arquivo).read_bytes()
+    assert pd.read_csv(tmp_path / 'larga' / arquivo, encoding='utf-8-sig')['id'].is_monotonic_increasing
+
+
+def test_gatilhos_propagam_escritas_externas(banco):
+    banco.criar_gatilhos_tabela_larga()
+    startup_id, = banco.cursor.execute("SELECT MIN(id) FROM startups WHERE status = 'Ativa'").fetchone()
+    banco.cursor.execute("UPDATE startups SET status = 'Inativa' WHERE id = ?", (startup_id,))
+    banco.cursor.execute("UPDATE avaliacoes_dimensoes SET score = 1.25 "
+                         "WHERE startup_id = ? AND dimensao = 'Grupo 3 - Confiabilidade'", (startup_id,))
+    banco.conn.commit()
+
+    assert banco.cursor.execute('SELECT status, confiabilidade FROM startups_completo WHERE id = ?',
+                                (startup_id,)).fetchone() == ('Inativa', 1.25)
+
+
+def test_reconstrucao_desfeita_com_a_importacao_incremental(banco, planilha):
+    # Banco anterior à tabela larga: a importação incremental a reconstrói
+    banco.cursor.execute('DROP TABLE startups_completo')
+    banco.conn.commit()
+
+    reconstruir = banco.reconstruir_tabela_larga
+
+    def reconstruir_e_falhar(commit=True):
+        reconstruir(commit=commit)
+        raise RuntimeError('falha simulada')
+    banco.reconstruir_tabela_larga = reconstruir_e_falhar
+
+    assert banco.importar_incremental(str(planilha), usar_cache=False) is False
+    assert banco.cursor.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name = 'startups_completo'").fetchone()[0] == 0
+
+    del banco.reconstruir_tabela_larga
+    assert banco.importar_incremental(str(planilha), usar_cache=False)
+    assert banco.cursor.execute('SELECT COUNT(*) FROM startups_completo').fetchone()[0] == \
+        banco.cursor.execute('SELECT COUNT(*) FROM startups').fetchone()[0]
@@ -0,0 +1,52 @@
+"""
+Utilitários Compartilhados - TechNova IoT
+Funções pequenas usadas por vários módulos: estado do banco visto por uma
+conexão, gravação atômica de JSON, hash de arquivos e opções da linha de
+comando
+
+Autor: Sistema TechNova
+Data: 2026-01-16
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+
+def versao_banco(conn):
+    """
+    Estado do banco visto pela conexão: (PRAGMA data_version, total_changes)
+
+    Commits de outras conexões mudam o data_version e escritas da própria
+    conexão mudam o total_changes; enquanto o par não muda, o que foi lido
+    antes continua válido.
+    """
+    return (conn.execute('PRAGMA data_version').fetchone()[0], conn.total_changes)
+
+
+def gravar_json_atomico(caminho, dados):
+    """Grava `dados` como JSON num arquivo temporário e o renomeia sobre `caminho`"""
+    temporario = f'{caminho}.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def hash_arquivo(caminho, tamanho_leitura=1 << 20):
+    """Calcula o SHA-256 do conteúdo do arquivo"""
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for parte in iter(lambda: f.read(tamanho_leitura), b''):
+            sha.update(parte)
+    return sha.hexdigest()
+
+
+def valor_opcao(nome, padrao=None, argv=None):
+    """Valor que segue `nome` na linha de comando (ex.: --porta 8765), ou `padrao`"""
+    argv = sys.argv if argv is None else argv
+    if nome in argv:
+        posicao = argv.index(nome) + 1
+        if posicao < len(argv):
+            return argv[posicao]
+    return padrao
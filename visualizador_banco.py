@@ -7,9 +7,144 @@ Data: 2026-01-16
 """
 
 import sqlite3
-import pandas as pd
+import sys
+import time
 from pathlib import Path
 
+# pandas e o snapshot (numpy) são importados nas opções que os usam: o
+# menu, a lista de tabelas, a estrutura e o top N respondem só com sqlite3
+
+# Consultas do visualizador: sempre parametrizadas, para que o SQLite
+# reaproveite a instrução já compilada e nenhum valor digitado vire SQL
+CONSULTAS = {
+    'listar_tabelas': """
+        SELECT name FROM sqlite_master WHERE type IN ('table', 'view') ORDER BY name
+    """,
+    'existe_tabela': """
+        SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?
+    """,
+    'startups_por_status': """
+        SELECT nome_startup, setor, score_global, score_performance_viabilidade
+        FROM startups
+        WHERE status = ?
+        ORDER BY score_global DESC, id
+    """,
+    'buscar_startup': """
+        SELECT nome_startup, setor, status, score_global, score_performance_viabilidade
+        FROM startups
+        WHERE nome_startup LIKE '%' || ? || '%'
+        ORDER BY score_global DESC, id
+    """,
+    'estatisticas_setor': """
+        SELECT setor, total_startups, startups_ativas, startups_inativas,
+               ROUND(score_medio, 2) as score_medio,
+               ROUND(score_min, 2) as score_min,
+               ROUND(score_max, 2) as score_max
+        FROM estatisticas_setor
+        ORDER BY score_medio DESC, setor
+    """,
+    'top_startups': """
+        SELECT nome_startup, setor, 
+               ROUND(score_global, 2) as score_global,
+               ROUND(score_performance_viabilidade, 2) as perf_viab
+        FROM startups
+        WHERE status = 'Ativa'
+        ORDER BY score_performance_viabilidade DESC, id
+        LIMIT ?
+    """,
+    'startup_por_nome': """
+        SELECT * FROM startups WHERE nome_startup = ?
+    """,
+    'dimensoes_startup': """
+        SELECT d.dimensao, ROUND(d.score, 2) as score
+        FROM avaliacoes_dimensoes d
+        JOIN startups s ON d.startup_id = s.id
+        WHERE s.nome_startup = ?
+        ORDER BY d.dimensao
+    """,
+    'criterios_startup': """
+        SELECT a.criterio, ROUND(a.score, 2) as score
+        FROM avaliacoes_detalhadas a
+        JOIN startups s ON a.startup_id = s.id
+        WHERE s.nome_startup = ?
+        ORDER BY a.score DESC, a.id
+    """,
+}
+
+# Instruções compiladas mantidas pela conexão (o padrão do sqlite3 é 128)
+TAMANHO_CACHE_INSTRUCOES = 256
+
+
+class RegistroConsultas:
+    """
+    Executa as consultas de CONSULTAS pelo nome, sempre na mesma conexão
+    
+    O texto SQL de cada consulta é fixo, então a partir da segunda execução
+    o cache de instruções do sqlite3 devolve a instrução já compilada.
+    O tempo de cada execução é acumulado por consulta em `tempos`.
+    """
+    
+    def __init__(self, conn, consultas=CONSULTAS):
+        self.conn = conn
+        self.consultas = consultas
+        self.tempos = {}
+    
+    def _executar(self, nome, parametros):
+        inicio = time.perf_counter()
+        cursor = self.conn.execute(self.consultas[nome], parametros)
+        linhas = cursor.fetchall()
+        acumulado = self.tempos.setdefault(nome, [0, 0.0])
+        acumulado[0] += 1
+        acumulado[1] += time.perf_counter() - inicio
+        return cursor, linhas
+    
+    def linhas(self, nome, parametros=()):
+        """Todas as linhas da consulta, como tuplas"""
+        return self._executar(nome, parametros)[1]
+    
+    def primeira(self, nome, parametros=()):
+        """Primeira linha da consulta, ou None"""
+        linhas = self.linhas(nome, parametros)
+        return linhas[0] if linhas else None
+    
+    def dataframe(self, nome, parametros=()):
+        """Resultado da consulta como DataFrame (mesmas colunas do SELECT)"""
+        import pandas as pd
+        cursor, linhas = self._executar(nome, parametros)
+        colunas = [descricao[0] for descricao in cursor.description]
+        return pd.DataFrame.from_records(linhas, columns=colunas, coerce_float=True)
+    
+    def relatorio_tempos(self):
+        """Exibe execuções, tempo total e tempo médio de cada consulta"""
+        if not self.tempos:
+            return
+        print("\n⏱ TEMPOS POR CONSULTA:")
+        for nome, (execucoes, total) in sorted(self.tempos.items(), key=lambda item: -item[1][1]):
+            print(f"  {nome:22s} {execucoes:5d}x | total {total * 1000:8.2f} ms | "
+                  f"médio {total / execucoes * 1000:7.3f} ms")
+
+
+def carregar_snapshot(conn):
+    """Cria o snapshot em memória (importa numpy/pandas só quando pedido)"""
+    from snapshot_banco import SnapshotBanco
+    return SnapshotBanco(conn)
+
+def formatar_tabela(colunas, linhas):
+    """
+    Tabela de textos e inteiros com o mesmo layout de
+    DataFrame.to_string(index=False), sem depender do pandas
+    """
+    textos = [['' if valor is None else str(valor) for valor in linha] for linha in linhas]
+    larguras = []
+    for j, coluna in enumerate(colunas):
+        inteira = bool(linhas) and all(type(linha[j]) is int for linha in linhas)
+        # Colunas inteiras reservam uma posição para o sinal, como no pandas
+        largura = len(coluna) + 1 if inteira else len(coluna)
+        larguras.append(max([largura] + [len(texto[j]) for texto in textos]))
+    saida = [' '.join(coluna.rjust(largura) for coluna, largura in zip(colunas, larguras))]
+    saida += [' '.join(valor.rjust(largura) for valor, largura in zip(texto, larguras)) for texto in textos]
+    return '\n'.join(saida)
+
 def exibir_menu():
     """Exibe menu principal"""
     print("\n" + "=" * 80)
@@ -25,98 +160,114 @@ def exibir_menu():
     print("  7. Ver top 10 startups")
     print("  8. Ver detalhes de uma startup")
     print("  9. Executar query personalizada")
+    print(" 10. Busca rápida por nome (prefixo, trecho e erros de digitação)")
     print("  0. Sair")
     print("-" * 80)
 
-def listar_tabelas(conn):
+def listar_tabelas(consultas):
     """Lista todas as tabelas do banco"""
-    query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-    tabelas = pd.read_sql_query(query, conn)
+    tabelas = consultas.linhas('listar_tabelas')
     print("\n📊 TABELAS NO BANCO DE DADOS:")
-    for i, tabela in enumerate(tabelas['name'], 1):
+    for i, (tabela,) in enumerate(tabelas, 1):
         print(f"  {i}. {tabela}")
 
-def ver_estrutura_tabela(conn, nome_tabela):
+def ver_estrutura_tabela(consultas, nome_tabela):
     """Mostra a estrutura de uma tabela"""
-    query = f"PRAGMA table_info({nome_tabela})"
-    estrutura = pd.read_sql_query(query, conn)
+    # Nomes de tabela não podem ser parâmetros: só nomes existentes são aceitos
+    if consultas.primeira('existe_tabela', (nome_tabela,)) is None:
+        print(f"\n✗ Tabela '{nome_tabela}' não encontrada")
+        return
+    tabela_sql = '"' + nome_tabela.replace('"', '""') + '"'
+    
+    # PRAGMA table_info: (cid, name, type, notnull, dflt_value, pk)
+    estrutura = consultas.conn.execute(f"PRAGMA table_info({tabela_sql})").fetchall()
     print(f"\n🏗️ ESTRUTURA DA TABELA '{nome_tabela}':")
-    print(estrutura[['name', 'type', 'notnull', 'pk']].to_string(index=False))
+    print(formatar_tabela(['name', 'type', 'notnull', 'pk'],
+                          [(coluna[1], coluna[2], coluna[3], coluna[5]) for coluna in estrutura]))
     
     # Contar registros
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT COUNT(*) FROM {nome_tabela}")
+    cursor = consultas.conn.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM {tabela_sql}")
     total = cursor.fetchone()[0]
     print(f"\n📈 Total de registros: {total}")
 
-def listar_startups_por_status(conn, status):
+def listar_startups_por_status(consultas, status, snapshot=None):
     """Lista startups por status"""
-    query = f"""
-        SELECT nome_startup, setor, score_global, score_performance_viabilidade
-        FROM startups
-        WHERE status = '{status}'
-        ORDER BY score_global DESC
-    """
-    resultado = pd.read_sql_query(query, conn)
+    import pandas as pd
+    if snapshot is not None:
+        resultado = pd.DataFrame.from_records(
+            snapshot.startups_por_status(status),
+            columns=['nome_startup', 'setor', 'score_global', 'score_performance_viabilidade']
+        )
+    else:
+        resultado = consultas.dataframe('startups_por_status', (status,))
     print(f"\n🏢 STARTUPS {status.upper()}S ({len(resultado)}):")
     if not resultado.empty:
         print(resultado.to_string(index=False))
     else:
         print("  Nenhuma startup encontrada")
 
-def buscar_startup(conn, nome):
+def buscar_startup(consultas, nome, snapshot=None):
     """Busca startup por nome (parcial)"""
-    query = f"""
-        SELECT nome_startup, setor, status, score_global, score_performance_viabilidade
-        FROM startups
-        WHERE nome_startup LIKE '%{nome}%'
-    """
-    resultado = pd.read_sql_query(query, conn)
+    import pandas as pd
+    if snapshot is not None:
+        resultado = pd.DataFrame.from_records(
+            snapshot.buscar(nome),
+            columns=['nome_startup', 'setor', 'status', 'score_global', 'score_performance_viabilidade']
+        )
+    else:
+        resultado = consultas.dataframe('buscar_startup', (nome,))
     print(f"\n🔍 RESULTADOS DA BUSCA por '{nome}':")
     if not resultado.empty:
         print(resultado.to_string(index=False))
     else:
         print("  Nenhuma startup encontrada")
 
-def ver_estatisticas_setor(conn):
+def buscar_startup_rapida(snapshot, termo):
+    """Busca ranqueada pelo índice de nomes do snapshot"""
+    import pandas as pd
+    inicio = time.perf_counter()
+    encontrados = snapshot.buscar_rapido(termo)
+    duracao = time.perf_counter() - inicio
+    resultado = pd.DataFrame.from_records(
+        encontrados,
+        columns=['nome_startup', 'setor', 'status', 'score_global', 'score_performance_viabilidade', 'correspondencia']
+    )
+    print(f"\n🔍 BUSCA RÁPIDA por '{termo}' ({duracao * 1000:.3f} ms):")
+    if not resultado.empty:
+        print(resultado.to_string(index=False))
+    else:
+        print("  Nenhuma startup encontrada")
+
+def ver_estatisticas_setor(consultas, snapshot=None):
     """Mostra estatísticas por setor"""
-    query = """
-        SELECT setor, total_startups, startups_ativas, startups_inativas,
-               ROUND(score_medio, 2) as score_medio,
-               ROUND(score_min, 2) as score_min,
-               ROUND(score_max, 2) as score_max
-        FROM estatisticas_setor
-        ORDER BY score_medio DESC
-    """
-    resultado = pd.read_sql_query(query, conn)
+    if snapshot is not None:
+        resultado = snapshot.estatisticas
+    else:
+        resultado = consultas.dataframe('estatisticas_setor')
     print("\n📊 ESTATÍSTICAS POR SETOR:")
     print(resultado.to_string(index=False))
 
-def ver_top_startups(conn, limite=10):
+def ver_top_startups(consultas, limite=10, snapshot=None):
     """Mostra top N startups"""
-    query = f"""
-        SELECT nome_startup, setor, 
-               ROUND(score_global, 2) as score_global,
-               ROUND(score_performance_viabilidade, 2) as perf_viab
-        FROM startups
-        WHERE status = 'Ativa'
-        ORDER BY score_performance_viabilidade DESC
-        LIMIT {limite}
-    """
-    resultado = pd.read_sql_query(query, conn)
+    # Linhas (nome_startup, setor, score_global, perf_viab), sem DataFrame
+    if snapshot is not None:
+        resultado = snapshot.top(limite)
+    else:
+        resultado = consultas.linhas('top_startups', (limite,))
     print(f"\n🏆 TOP {limite} STARTUPS:")
-    for i, row in enumerate(resultado.itertuples(), 1):
-        print(f"  {i:2d}. {row.nome_startup:30s} | {row.setor:15s} | Score: {row.perf_viab:.2f}")
+    for i, (nome_startup, setor, _, perf_viab) in enumerate(resultado, 1):
+        print(f"  {i:2d}. {nome_startup:30s} | {setor:15s} | Score: {perf_viab:.2f}")
 
-def ver_detalhes_startup(conn, nome):
+def ver_detalhes_startup(consultas, nome, snapshot=None):
     """Mostra detalhes completos de uma startup"""
-    # Informações básicas
-    query_basico = f"""
-        SELECT * FROM startups WHERE nome_startup = '{nome}'
-    """
-    cursor = conn.cursor()
-    cursor.execute(query_basico)
-    startup = cursor.fetchone()
+    import pandas as pd
+    if snapshot is not None:
+        detalhes = snapshot.detalhes(nome)
+        startup = detalhes['startup'] if detalhes else None
+    else:
+        # Informações básicas
+        startup = consultas.primeira('startup_por_nome', (nome,))
     
     if not startup:
         print(f"\n✗ Startup '{nome}' não encontrada")
@@ -131,26 +282,18 @@ def ver_detalhes_startup(conn, nome):
     print(f"Score Performance + Viabilidade: {startup[5]:.2f}")
     
     # Avaliações por dimensão
-    query_dimensoes = f"""
-        SELECT d.dimensao, ROUND(d.score, 2) as score
-        FROM avaliacoes_dimensoes d
-        JOIN startups s ON d.startup_id = s.id
-        WHERE s.nome_startup = '{nome}'
-        ORDER BY d.dimensao
-    """
-    dimensoes = pd.read_sql_query(query_dimensoes, conn)
+    if snapshot is not None:
+        dimensoes = pd.DataFrame.from_records(detalhes['dimensoes'], columns=['dimensao', 'score'])
+    else:
+        dimensoes = consultas.dataframe('dimensoes_startup', (nome,))
     print("\n📊 AVALIAÇÕES POR DIMENSÃO:")
     print(dimensoes.to_string(index=False))
     
     # Top 5 e Bottom 5 critérios
-    query_criterios = f"""
-        SELECT a.criterio, ROUND(a.score, 2) as score
-        FROM avaliacoes_detalhadas a
-        JOIN startups s ON a.startup_id = s.id
-        WHERE s.nome_startup = '{nome}'
-        ORDER BY a.score DESC
-    """
-    criterios = pd.read_sql_query(query_criterios, conn)
+    if snapshot is not None:
+        criterios = pd.DataFrame.from_records(detalhes['criterios'], columns=['criterio', 'score'])
+    else:
+        criterios = consultas.dataframe('criterios_startup', (nome,))
     
     print("\n✅ TOP 5 CRITÉRIOS:")
     print(criterios.head(5).to_string(index=False))
@@ -172,6 +315,7 @@ def executar_query_custom(conn):
     if query.lower() == 'voltar':
         return
     
+    import pandas as pd
     try:
         resultado = pd.read_sql_query(query, conn)
         print("\n📊 RESULTADO:")
@@ -190,48 +334,68 @@ def main():
         print("Execute primeiro: python criar_banco_dados.py")
         return
     
-    # Conectar ao banco
-    conn = sqlite3.connect(db_path)
+    # Conectar ao banco (uma conexão para a sessão inteira)
+    conn = sqlite3.connect(db_path, cached_statements=TAMANHO_CACHE_INSTRUCOES)
+    consultas = RegistroConsultas(conn)
     print(f"✓ Conectado ao banco: {db_path}")
     
+    # Modo snapshot (--snapshot): opções 3 a 8 respondidas da memória.
+    # A busca rápida (opção 10) sempre usa um snapshot, criado no primeiro uso
+    snapshot = None
+    if '--snapshot' in sys.argv:
+        snapshot = carregar_snapshot(conn)
+        print(f"✓ Snapshot carregado: {len(snapshot.ids)} startups em memória")
+    snapshot_busca = snapshot
+    
     while True:
         exibir_menu()
         opcao = input("\nEscolha uma opção: ").strip()
         
+        if snapshot is not None and opcao in ('3', '4', '5', '6', '7', '8', '10') and snapshot.atualizar():
+            print("✓ Banco alterado: snapshot recarregado")
+        
         if opcao == '1':
-            listar_tabelas(conn)
+            listar_tabelas(consultas)
         
         elif opcao == '2':
             tabela = input("\nNome da tabela: ").strip()
-            ver_estrutura_tabela(conn, tabela)
+            ver_estrutura_tabela(consultas, tabela)
         
         elif opcao == '3':
-            listar_startups_por_status(conn, 'Ativa')
+            listar_startups_por_status(consultas, 'Ativa', snapshot)
         
         elif opcao == '4':
-            listar_startups_por_status(conn, 'Inativa')
+            listar_startups_por_status(consultas, 'Inativa', snapshot)
         
         elif opcao == '5':
             nome = input("\nDigite parte do nome da startup: ").strip()
-            buscar_startup(conn, nome)
+            buscar_startup(consultas, nome, snapshot)
         
         elif opcao == '6':
-            ver_estatisticas_setor(conn)
+            ver_estatisticas_setor(consultas, snapshot)
         
         elif opcao == '7':
             try:
                 n = int(input("\nQuantas startups mostrar? (padrão: 10): ").strip() or "10")
-                ver_top_startups(conn, n)
+                ver_top_startups(consultas, n, snapshot=snapshot)
             except ValueError:
-                ver_top_startups(conn)
+                ver_top_startups(consultas, snapshot=snapshot)
         
         elif opcao == '8':
             nome = input("\nNome exato da startup: ").strip()
-            ver_detalhes_startup(conn, nome)
+            ver_detalhes_startup(consultas, nome, snapshot)
         
         elif opcao == '9':
             executar_query_custom(conn)
         
+        elif opcao == '10':
+            termo = input("\nDigite parte do nome da startup: ").strip()
+            if snapshot_busca is None:
+                snapshot_busca = carregar_snapshot(conn)
+            elif snapshot_busca is not snapshot and snapshot_busca.atualizar():
+                print("✓ Banco alterado: índice de nomes recarregado")
+            buscar_startup_rapida(snapshot_busca, termo)
+        
         elif opcao == '0':
             print("\n✓ Encerrando...")
             break
@@ -241,6 +405,7 @@ def main():
         
         input("\nPressione ENTER para continuar...")
     
+    consultas.relatorio_tempos()
     conn.close()
     print("✓ Conexão fechada")
 